@@ -1,14 +1,22 @@
+import sys
+
 first = None
 last = None
 
-def main():
-    result = 0
-    with open('input', 'r') as f:
-        for line in f.readlines():
-            temp = getline(line)
-            result += temp
+class Solver():
+    def __init__(self, filename: str):
+        with open(filename, 'r') as f:
+            self.lines = f.readlines()
+
+    def solve1(self):
+        result = 0
+        for line in self.lines:
+            result += getline(line)
+
+        return result
 
-    print(result)
+def main(filename: str = 'input'):
+    print(Solver(filename).solve1())
 
 def getline(line:str):
     global first
@@ -87,4 +95,7 @@ def getline(line:str):
     return 10*first + last
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    if len(sys.argv) > 1:
+        main(sys.argv[1])
+    else:
+        main()
\ No newline at end of file
@@ -58,27 +58,31 @@ def check_possible(game: cubegame, red_max=12, green_max=13, blue_max=14):
 
     return return_value
 
+class Solver():
+    def __init__(self, filename: str):
+        with open(filename, 'r') as f:
+            self.games = [cubegame(line) for line in f.readlines()]
+
+    def solve1(self)->int:
+        return sum(g.id for g in self.games if check_possible(g))
+
+    def solve2(self)->int:
+        return sum(g.minset().power() for g in self.games)
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         fname = 'input'
     else:
         fname = sys.argv[1]
 
-    with open(fname, 'r') as f:
-        games = [cubegame(line) for line in f.readlines()]
+    solver = Solver(fname)
+    games = solver.games
 
-        print("Found " + str(len(games)) + " games")
-        possible_game_ids = [g.id for g in games if check_possible(g)]
-        print(str(len(possible_game_ids)) + " games were possible")
-        print(str(sum(possible_game_ids)) + " was the sum of their IDs")
+    print("Found " + str(len(games)) + " games")
+    possible_game_ids = [g.id for g in games if check_possible(g)]
+    print(str(len(possible_game_ids)) + " games were possible")
+    print(str(solver.solve1()) + " was the sum of their IDs")
 
-        print("***************")
-
-        for g in games:
-            continue
-            m = g.minset()
-            print(f"Game {g.id} required at least {m.red} red cubes, {m.green} green cubes, and {m.blue} blue cubes for a power of {m.power()}")
-
-        
-        print(f"The sum of the powers was {sum([g.minset().power() for g in games])}")
+    print("***************")
 
+    print(f"The sum of the powers was {solver.solve2()}")
@@ -1,17 +1,17 @@
+import os
 import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.ints import ints, parse_ints
+
 
 class Card:
     """Handles one card"""
 
-    def __init__(self, text):
-        label, numbers = text.split(":")
-        _, id = label.split()
-        winning_numbers, card_numbers = numbers.split("|")
-
-        self.id = int(id)
-        self.winning_numbers = [int(n) for n in winning_numbers.split()]
-        self.card_numbers = [int(n) for n in card_numbers.split()]
+    def __init__(self, id, winning_numbers, card_numbers):
+        self.id = id
+        self.winning_numbers = winning_numbers
+        self.card_numbers = card_numbers
 
     def score(self) -> int:
         """
@@ -39,8 +39,13 @@ class CardTable:
     """
 
     def __init__(self, filename):
-        with open(filename, "r") as f:
-            self.cards = [Card(line) for line in f.readlines()]
+        with open(filename, "rb") as f:
+            data = f.read()
+
+        # Every card has the same number of winning numbers, so the first one says where the | falls.
+        # The rows of ints don't keep it, so it comes from the text of the first card.
+        split = len(ints(data[:data.index(b"|")]))
+        self.cards = [Card(row[0], row[1:split], row[split:]) for row in parse_ints(data).lines()]
 
     def score(self):
         """Get the sum of the scores of the cards"""
@@ -4,6 +4,11 @@ import sys
 import logging
 import os
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc import sidecar
+from aoc.interval import IntervalMap, IntervalSet, compose_shifts
+from aoc.loader import Input
+
 class Loggable:
     def __init__(self, logger_name):
         self.logger = logging.getLogger(logger_name)
@@ -22,60 +27,44 @@ class Map(Loggable):
     source-to-dest map:
     dst_range, src_range, len
     """
-    def __init__(self, lines):
+    def __init__(self, src: str, dst: str, ranges: list[tuple[int, int, int]]):
         self.initLogger()
+        self.src: str = src
+        self.dst: str = dst
+        self.ranges = ranges
+        # How far each source number moves, which is all a lookup needs
+        self.shifts: IntervalMap[int] = IntervalMap((src, src + len, dst - src) for (dst, src, len) in ranges)
+
+    @classmethod
+    def from_lines(cls, lines)->Map:
         src_dst, m = lines[0].split()
         assert(m == "map:")
         src, _, dst = src_dst.split("-")
-        self.src: str = src
-        self.dst: str = dst
 
         ranges: list[tuple[int, int, int]] = []
         for line in lines[1:]:
             (dst_range, src_range, len) = line.split()
             ranges.append((int(dst_range), int(src_range), int(len)))
 
-        self.ranges = ranges
+        return cls(src, dst, ranges)
 
     def lookup(self, src_num: int)->int:
-        for (dst_range, src_range, len) in self.ranges:
-            if src_num >= src_range and src_num < src_range + len:
-                return dst_range + (src_num - src_range)
-        
         # source numbers that aren't mapped correspond to the same destination number
-        return src_num
+        return src_num + self.shifts.get(src_num, 0)
     
     def ordered_ranges(self, pad:bool = False)->list[tuple[int, int, int]]:
-        # Assumes:
-        # 1. There's no overlap between ranges
-        # 2. All indexes start at 0
-        ranges = list(self.ranges)
-        ranges.sort(key=lambda x: x[1])
-        if pad:
-            new_ranges = []
-            last = 0
-            for r in ranges:
-                # Either we insert a new range to fill the gap, or we insert the next range we found
-                (dst, src, len) = r
-                if last < src: # need to fill some space
-                    new_ranges.append((last, last, src - last))
-                new_ranges.append(r)
-                last = src + len
-
-            ranges = new_ranges
-
-        return ranges
+        # Assumes all indexes start at 0. With pad, the gaps map to themselves.
+        shifts = self.shifts.filled(0, 0) if pad else self.shifts
+        return [(src + shift, src, end - src) for (src, end, shift) in shifts]
     
 class OffsetMap(Loggable):
     def __init__(self, maps: list[Map]):
         super().__init__(__class__.__name__)
-        offsets = [self.toOffsets(m) for m in maps]
-        self.debug(offsets)
-        self.partial_offsets = []
-        combined_offset = []
+        self.partial_offsets: list[IntervalMap[int]] = []
+        combined_offset: IntervalMap[int] = IntervalMap()
 
-        for offset in offsets:
-            combined_offset = self.combineOffsets(combined_offset, offset)
+        for m in maps:
+            combined_offset = self.combineOffsets(combined_offset, m.shifts)
             self.partial_offsets.append(combined_offset)
 
         self.offsets = combined_offset
@@ -150,62 +139,23 @@ class OffsetMap(Loggable):
         self.debug(offsets)
         return offsets
     
-    def combineOffsets(self, m1: list[tuple[int, int, int]], m2: list[tuple[int, int, int]])->list[tuple[int, int, int]]:
+    def combineOffsets(self, m1: IntervalMap[int], m2: IntervalMap[int])->IntervalMap[int]:
         """
-        Takes an existing mapping m1 that consists of (start, end, offset) lists and a second map m2 that.
-        Returns a list of maps that is the result of applying m1 and then m2.
-        Assumes that m1 and m2 are ordered (offsets are generated using an ordered_ranges call so that should be fine)
+        Takes an existing mapping m1 of source intervals to offsets, and a second map m2.
+        Returns the map that is the result of applying m1 and then m2.
         """
         self.debug(f"Entered combineOffsets with {len(m1)} left offsets and {len(m2)} right offsets")
-        offsets: list[tuple[int, int, int]] = [] # the return value
-
-        if len(m1) == 0:
-            return list(m2)
-
-        for (m1_start, m1_end, m1_offset) in m1:
-            self.debug(f"Handling a left offset: {m1_start}-{m1_end}->{m1_offset}")
-            current = m1_start
-            while current <= m1_end:
-                self.debug(f"Hit the outer while, starting from {current}")
-                new_start = current
-                i = 0
-                self.debug(f"Looking at {len(m2)} right offsets")
-                while i < len(m2):
-                    (m2_start, m2_end, m2_offset) = m2[i]
-                    if m2_start <= current+m1_offset and m2_end >= current+m1_offset:
-                        new_end = min(m1_end, m2_end-m1_offset)
-                        self.debug(f"Found a matching right offset, through {new_end}")
-                        new_offset = m1_offset + m2_offset
-                        break
-                    else:
-                        self.debug(f"Skipping {m2_start}-{m2_end}")
-                        i += 1
-
-                if i >= len(m2): # We're past the last offset in m2
-                    self.debug(f"Went past the end of the right loop")
-                    new_end = m1_end
-                    new_offset = m1_offset
-
-                self.debug(f"Created a new offset: {new_start}-{new_end}->{new_offset}")
-                offsets.append((new_start, new_end, new_offset))
-                current = new_end+1
-
-        return offsets
+        return compose_shifts(m1, m2)
 
     def lookup(self, num:int)->int:
-        for i in range(len(self.offsets)):
-            (first, last, offset) = self.offsets[i]
-            if num >= first and num <= last:
-                return num + offset
-        
-        # If we fall through this far, we're beyong the mapping
-        return num
+        # If we fall outside the mapping, the number stays where it is
+        return num + self.offsets.get(num, 0)
     
     def __str__(self)->str:
         res = "Offset Map:\n"
         for offset in self.partial_offsets:
-            for r in offset:
-                res += f"({r[0]}-{r[1]}->{r[2]})\n"
+            for (first, end, shift) in offset:
+                res += f"({first}-{end - 1}->{shift})\n"
         return res
                 
 class Almanac:
@@ -224,18 +174,14 @@ class Almanac:
     """
     def __init__(self, filename):
         self.maps: list[Map] = []
-        with open(filename, 'r') as f:
-            current_block: list[str] = []
-            for line in f:
-                next_line = line.strip()
-                if next_line != "":
-                    current_block.append(next_line)
-                else:
-                    self.parse_block(current_block)
-                    current_block = []
-            
-            if len(current_block) > 0:
-                self.parse_block(current_block)
+        stored = sidecar.load(filename, "almanac-v1")
+        if stored is None:
+            with Input(filename) as f:
+                for block in f.blocks(text=True):
+                    self.parse_block([line.strip() for line in block])
+            sidecar.save(filename, "almanac-v1", *self.packed())
+        else:
+            self.unpack(stored)
 
         self.make_lookup_list()
 
@@ -257,7 +203,23 @@ class Almanac:
             assert(label == "seeds")
             self.seeds = [int(seed) for seed in seeds.split()]
         else: # must be a map block
-            self.maps.append(Map(block))
+            self.maps.append(Map.from_lines(block))
+
+    def packed(self)->tuple[dict[str, list[int]], dict]:
+        """The seeds and maps as flat lists of numbers, and the map names"""
+        ranges = [n for m in self.maps for r in m.ranges for n in r]
+        counts = [len(m.ranges) for m in self.maps]
+        names = [[m.src, m.dst] for m in self.maps]
+        return {"seeds": self.seeds, "ranges": ranges, "counts": counts}, {"names": names}
+
+    def unpack(self, stored: sidecar.Sidecar):
+        self.seeds = list(stored.arrays["seeds"])
+        ranges = stored.arrays["ranges"]
+        start = 0
+        for (src, dst), count in zip(stored.meta["names"], stored.arrays["counts"]):
+            flat = ranges[start:start + 3 * count]
+            self.maps.append(Map(src, dst, [tuple(flat[k:k + 3]) for k in range(0, 3 * count, 3)]))
+            start += 3 * count
 
     def lookup_old(self, seed: int)-> int:
         maps_dict: dict[str, Map] = {}
@@ -316,28 +278,13 @@ class Almanac:
         om = OffsetMap(self.maps)
         offsets = om.offsets
 
-        minimum_loc = self.lookup(self.seeds[0])
+        seed_ranges = IntervalSet((self.seeds[i], self.seeds[i] + self.seeds[i + 1]) for i in range(0, len(self.seeds), 2))
 
-        seed_ranges:list[tuple[int, int]] = []
-        i = 0
-        while i < len(self.seeds):
-            seed_ranges.append((self.seeds[i], self.seeds[i] + self.seeds[i + 1]))
-            i += 2
-
-        for (seed_start, seed_end) in seed_ranges:
-            search_next = seed_start # search_next is the next number we're looking for
-            i = 0
-            while search_next <= seed_end and i < len(offsets):
-                #print(f"Looking at {search_next} in the {i}th offset")
-                (offset_min, offset_max, offset_num) = offsets[i]
-                if offset_min <= search_next and offset_max >= search_next: # our next number is inside of offset[i]
-                    loc = search_next + offset_num
-                    minimum_loc = min(loc, minimum_loc)
-                    search_next = min(seed_end+1, offset_max+1)
-                else:
-                    i += 1
+        # Every seed in a stretch that moves by the same offset keeps its order, so the start of the stretch is the lowest
+        moved = [seed_start + offset for (seed_start, _, offset) in offsets.restrict(seed_ranges)]
+        unmoved = [seed_start for (seed_start, _) in seed_ranges - offsets.domain()]
             
-        return minimum_loc
+        return min(moved + unmoved)
     
 if __name__ == "__main__":
     logging.basicConfig()
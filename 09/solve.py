@@ -1,12 +1,13 @@
 from __future__ import annotations
+import os
 import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.ints import read_ints
+
 class Solver:
     def __init__(self, filename):
-        self.nums:list[list[int]] = []
-        with open(filename, 'r') as f:
-            for line in f.readlines():
-                self.nums.append([int(x) for x in line.split()])
+        self.nums:list[list[int]] = list(read_ints(filename).lines())
 
     def solve1(self):
         results = [self.solve_line(x) for x in self.nums]
@@ -1,49 +1,49 @@
 from __future__ import annotations
+import os
 import sys
 
-type Coordinate = tuple[int, int]
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.coords import Layout, OUTSIDE
+from aoc.unionfind import UnionFind
+
+type Coordinate = int # Packed (row, column), see aoc.coords
 type Path = list[Coordinate]
 type Area = set[Coordinate]
 
 class Solver():
     def __init__(self, filename: str):
-        with open(filename, 'r') as f:
-            self.board = [line for line in f.readlines()]
+        # The board is one flat bytearray with a border of OUTSIDE round it, so stepping off the edge needs no bounds check
+        self.layout, self.board = Layout.read(filename)
+        self.N, self.E, self.S, self.W = self.layout.NEIGHBORS4
 
     def start(self)->Coordinate:
-        for i in range(len(self.board)):
-            line = self.board[i]
-            for j in range(len(line)):
-                if line[j] == 'S':
-                    return (i, j)
-        
-        assert(False) #If we got here, we didn't have a starting point
+        return self.board.index(ord('S'))
 
     def lookup(self, coordinate: Coordinate)->str:
-        return self.board[coordinate[0]][coordinate[1]]
+        return chr(self.board[coordinate])
     
     def set(self, coordinate: Coordinate, val: str)->None:
-        self.board[coordinate[0]][coordinate[1]] = val
+        self.board[coordinate] = ord(val)
     
     def north(self, c: Coordinate)->Coordinate:
-        return (c[0] - 1, c[1])
+        return c + self.N
     def east(self, c: Coordinate)->Coordinate:
-        return (c[0], c[1] + 1)
+        return c + self.E
     def south(self, c: Coordinate)->Coordinate:
-        return (c[0] + 1, c[1])
+        return c + self.S
     def west(self, c: Coordinate)->Coordinate:
-        return (c[0], c[1] - 1)
+        return c + self.W
     def legal(self, c:Coordinate)->bool:
-        if c[0] < 0 or c[1] < 0 or c[0] >= self.height() or c[1] >= self.width():
-            return False
-        else:
-            return True
+        return self.board[c] != OUTSIDE
         
     def height(self)->int:
-        return len(self.board)
+        return self.layout.height
     
     def width(self)->int:
-        return len(self.board[0])
+        return self.layout.width
+
+    def rows(self)->list[str]:
+        return [self.board[self.layout.pack(r, 0):self.layout.pack(r, self.width())].decode() for r in range(self.height())]
     
 
     def adjacents(self, coordinate: Coordinate)->list[Coordinate]:
@@ -135,110 +135,41 @@ class Solver():
         assert(len(pArea) == len(path) - 1)
         
         # Clean the board up
-        for i in range(self.height()):
-            row = self.board[i]
-            newRow = ''
-            for j in range(self.width()):
-                if (i, j) not in pArea:
-                    newRow += '.'
-                else:
-                    newRow += row[j]
-            self.board[i] = list(newRow)
-
-        for row in self.board:
-            print(''.join(row))
-
-        # Build the initial list of areas
-        accountedFor: Area = set()
-        areaList: list[Area] = []
-        for i in range(self.height()):
-            for j in range(self.width()):
-                c: Coordinate = (i, j)
-                symbol = self.lookup(c)
-
-                #print(f"Checking {c}")
-                #print(f"areaList: {areaList}")
-                #print(f"accountedFor: {accountedFor}")
-                
-                # If we're looking at the path, we don't need to do anything
-                if symbol != '.':
-                    #print(f"skipping {c}\n")
-                    continue
-
-                # Mark this square as handled
-                accountedFor.add(c)
-
-                # Look up the legal neighbors that are empty
-                neighbors:Area = set([x for x in [self.north(c), self.east(c), self.west(c), self.south(c)] if self.legal(x) and self.lookup(x) == '.'])
-
-                # See if we've seen any neighbors before
-                found_neighbors = accountedFor.intersection(neighbors)
-
-                # Mark all the neighbors complete, since we handle them below
-                accountedFor = accountedFor.union(neighbors)
-
-                if len(found_neighbors) == 0:
-                    # Cool, a whole new area
-                    neighbors.add(c)
-                    #print(f"Creating new area: {neighbors}")
-                    areaList.append(neighbors)
-
-                elif len(found_neighbors) == 1:
-                    # This is easy, just add to an existing area
-                    # Note that we add not just the found one, but all the neighbors
-
-                    found = found_neighbors.pop() # Removes and returns a random element, but there's only one
-                    for k in range(len(areaList)):
-                        candidate = areaList[k]
-                        #print(f"Checking for {found} in {candidate}")
-                        if found in candidate:
-                            neighbors.add(c)
-                            #print(f"Adding {neighbors} to {candidate}")
-                            candidate = candidate.union(neighbors)
-                            areaList[k] = candidate
-                            break #no need to keep looking
-
-                else:
-                    # More than one neighbor was found in the list, so we need to check and see if we need to combine areas
-                    #print(f"Found multiple neighbors: {found_neighbors}")
-                    newAreaList:list[Area] = []
-                    newArea: Area = neighbors
-                    newArea.add(c)
-
-                    for area in areaList:
-                        if len(area.intersection(found_neighbors)) == 0:
-                            #print(f"Didn't find any of those in {area}, adding it to the new list")
-                            newAreaList.append(area)
-
-                        else:
-                            newArea = newArea.union(area)
-
-                    newAreaList.append(newArea)
-                    #print(f"Updating {areaList} to {newAreaList}")
-                    areaList = newAreaList
-
-                #print()
+        for c in self.layout.cells():
+            if c not in pArea:
+                self.set(c, '.')
+
+        for row in self.rows():
+            print(row)
+
+        # Join up the areas of ground, the border never is any
+        ground = [c for c in self.layout.cells() if self.lookup(c) == '.']
+        uf = UnionFind(self.layout.size)
+        for c in ground:
+            for n in (self.east(c), self.south(c)):
+                if self.lookup(n) == '.':
+                    uf.union(c, n)
+
+        areas: dict[int, Area] = {root: set(cells) for root, cells in uf.groups(ground).items()}
 
         # Mark everything touching the edge of the board as "outside"
         outsideList: list[Area] = []
-        unknownList: list[Area] = []
-        for area in areaList:
-            x = set(p[0] for p in area)
-            y = set(p[1] for p in area)
-            if 0 in x or 0 in y or self.height()-1 in x or self.width()-1 in y:
+        unknownAreas: dict[int, Area] = {}
+        for root, area in areas.items():
+            if any(self.layout.on_edge(p) for p in area):
                 outsideList.append(area)
             else:
-                unknownList.append(area)
+                unknownAreas[root] = area
 
-        sizes = [len(area) for area in unknownList]
+        sizes = [len(area) for area in unknownAreas.values()]
         print({i:sizes.count(i) for i in sizes})
 
         for area in outsideList:
             for coord in area:
                 self.set(coord, 'O')
 
-        for row in self.board:
-            print(''.join(row))
+        for row in self.rows():
+            print(row)
 
         outside_side = None
         def facing(coords)->str:
@@ -381,30 +312,20 @@ class Solver():
                     seen = self.lookup(outside_coord)
                     if seen == '.':
                         # We have a previously unseen patch of ground on our outside side
-                        j = 0
-                        while outside_coord not in unknownList[j]:
-                            j += 1
-
-                        area = unknownList[j]
+                        area = unknownAreas.pop(uf.find(outside_coord))
                         outsideList.append(area)
                         for coord in area:
                             self.set(coord, 'O')
 
-                        assert(area == unknownList.pop(j))
-
-        sizes = [len(area) for area in unknownList]
+        sizes = [len(area) for area in unknownAreas.values()]
         print({i:sizes.count(i) for i in sizes})
 
-        for row in self.board:
-            print(''.join(row))
+        for row in self.rows():
+            print(row)
 
-        inside = set()
-        for coord in inside_seen:
-            for area in areaList:
-                if coord in area:
-                    inside = inside.union(area)
+        inside = {uf.find(coord) for coord in inside_seen}
         
-        return sum(sizes), len(inside)
+        return sum(sizes), sum(uf.size(root) for root in inside)
     
 
 if __name__ == "__main__":
@@ -1,5 +1,10 @@
 from __future__ import annotations
+import os
 import re
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.memo import MISSING, Memo
 
 
 class SpringGroup:
@@ -46,18 +51,20 @@ def parse_folded(line: str) -> tuple[list[SpringGroup], list[int]]:
     new_second = ",".join(second.strip() for _ in range(5))
     return parse_spring_groups(new_first), parse_groupings(new_second)
 
-def count_ways(sgs: list[SpringGroup], damaged: list[int], in_group: bool, cache: dict[str, int]|None=None) -> int:
+type State = tuple[int, int, int, int, bool]
+
+def count_ways(sgs: list[SpringGroup], damaged: list[int], in_group: bool, cache: Memo[State, int]|None=None) -> int:
     if cache is not None:
-        as_str = "".join(str(sg) for sg in sgs) + " " + ",".join(str(x) for x in damaged) + " " + str(in_group)
-        if as_str in cache:
-            cache["hits"] = cache["hits"] + 1
-            return cache[as_str]
-        
-        cache["misses"] = cache["misses"] + 1
+        # Within one line sgs and damaged are always the tail of the originals, with maybe
+        # the first one cut down, so their lengths and first entries pin them down. That
+        # makes the cache only good for one line at a time.
+        key = (len(sgs), sgs[0].size if sgs else 0, len(damaged), damaged[0] if damaged else 0, in_group)
+        found = cache.get(key, MISSING)
+        if found is not MISSING:
+            return found
 
         def ret_fun(n: int) -> int:
-            cache[as_str] = n
-            return n
+            return cache.put(key, n)
     else:
         def ret_fun(n: int) -> int:
             return n
@@ -153,26 +160,37 @@ def count_ways(sgs: list[SpringGroup], damaged: list[int], in_group: bool, cache
     return ret_fun(first_op + count_ways(new_sgs, damaged[1:], False, cache))
 
 
-with open("tiny_input") as f:
-    for line in f:
-        sgs, dmg = parse_folded(line)
-        cache: dict[str, int] = {"hits": 0, "misses": 0}
-        res = count_ways(sgs, dmg, False, cache)
-        print(line.strip(), "->", res, cache["hits"], cache["misses"])
-
-
-ans1 = 0
-ans2 = 0
-print("")
-with open("input") as f:
-    for line in f:
-        sgs, dmg = parse_line(line)
-        sgs2, dmg2 = parse_folded(line)
-        res = count_ways(sgs, dmg, False, None)
-        cache: dict[str, int] = {"hits": 0, "misses": 0}
-        res2 = count_ways(sgs2, dmg2, False, cache)
-        ans1 += res
-        ans2 += res2
-
-print("First answer:", ans1)
-print("Second answer: ", ans2)
\ No newline at end of file
+CACHE_LIMIT = 1 << 14 # Per line, the folded lines need a couple of thousand at most
+
+class Solver():
+    def __init__(self, filename: str):
+        with open(filename, 'r') as f:
+            self.lines = [line for line in f if line.strip() != ""]
+
+    def solve1(self) -> int:
+        ans = 0
+        for line in self.lines:
+            sgs, dmg = parse_line(line)
+            ans += count_ways(sgs, dmg, False, None)
+        return ans
+
+    def solve2(self) -> int:
+        ans = 0
+        cache: Memo[State, int] = Memo(CACHE_LIMIT)
+        for line in self.lines:
+            sgs, dmg = parse_folded(line)
+            ans += count_ways(sgs, dmg, False, cache)
+            cache.clear()
+        cache.record("12.cache")
+        return ans
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        filename = sys.argv[1]
+    else:
+        filename = "input"
+
+    solver = Solver(filename)
+    print("First answer:", solver.solve1())
+    print("Second answer: ", solver.solve2())
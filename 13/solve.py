@@ -1,74 +1,56 @@
 from __future__ import annotations
+import os
 import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.coords import Layout
+from aoc.loader import Input
+
 class Pattern():
     def __init__(self, lines: list[str]):
         self.original = lines
-        self.reflected: list[lines] = []
+        self.layout = Layout.from_lines(lines)
+        self.board = self.layout.pad(lines)
         self.h_mirror: int|None = None
         self.v_mirror: int|None = None
 
         self.v_mirror2: int|None = None
         self.h_mirror2: int|None = None
 
-        self._find_h_reflect()
-        self._find_v_reflect()
+        # Rows and columns are both slices of the flat board, so one search finds either mirror
+        l = self.layout
+        rows = [self.board[l.pack(r, 0):l.pack(r, l.width)] for r in range(l.height)]
+        cols = [self.board[l.pack(0, c):l.pack(l.height, c):l.stride] for c in range(l.width)]
+        self.h_mirror, self.h_mirror2 = self._find_reflect(rows)
+        self.v_mirror, self.v_mirror2 = self._find_reflect(cols)
 
         for row in self.original:
             print(row)
 
         print('-----')
 
-    def _find_h_reflect(self):
-        for i in range(len(self.original)-1):
-            n_above = i+1
-            n_below = len(self.original) - n_above
-            slice_size = min(n_above, n_below)
-            above, below = [], []
-            for j in range(slice_size):
-                above.append(self.original[i-j])
-                below.append(self.original[i+j+1])
+    @staticmethod
+    def _find_reflect(lanes: list[bytearray])->tuple[int|None, int|None]:
+        """The last mirror between lanes i and i+1 that's exact, and the last that's one smudge off"""
+        exact: int|None = None
+        smudged: int|None = None
+        for i in range(len(lanes)-1):
+            slice_size = min(i+1, len(lanes) - (i+1))
 
             hamming = 0
-            for (a, b) in zip(above, below):
-                for j in range(len(a)):
-                    if a[j] != b[j]:
-                        hamming += 1
+            for j in range(slice_size):
+                if lanes[i-j] != lanes[i+j+1]:
+                    hamming += sum(a != b for a, b in zip(lanes[i-j], lanes[i+j+1]))
+                    if hamming > 1:
+                        break # Not a mirror either way
 
             if hamming == 0:
-                self.h_mirror = i
+                exact = i
 
             if hamming == 1:
-                self.h_mirror2 = i
+                smudged = i
 
-
-    def _find_v_reflect(self):
-        cols:list[str] = ['' for i in range(len(self.original[0]))]
-
-        for row in self.original:
-            for i in range(len(row)):
-                cols[i] += row[i]
-        
-        for i in range(len(cols)-1):
-            n_left = i+1
-            n_right = len(cols) - n_left
-            slice_size = min(n_left, n_right)
-            left, right = [], []
-            for j in range(slice_size):
-                left.append(cols[i-j])
-                right.append(cols[i+j+1])
-                        
-            hamming = 0
-            for (l, r) in zip(left, right):
-                for j in range(len(l)):
-                    if l[j] != r[j]:
-                        hamming += 1
-            
-            if hamming == 0:
-                self.v_mirror = i
-            
-            if hamming == 1:
-                self.v_mirror2 = i
+        return exact, smudged
 
 
     def score1(self)->int:
@@ -96,16 +78,9 @@ class Solver():
     def __init__(self, filename: str):
         self.patterns: list[Pattern] = []
 
-        with open(filename, 'r') as f:
-            current = []
-            for line in f.readlines():
-                if line.strip() != '':
-                    current.append(line.strip())
-                else:
-                    self.patterns.append(Pattern(current))
-                    current = []
-            if len(current) > 0:
-                self.patterns.append(Pattern(current))
+        with Input(filename) as f:
+            for block in f.blocks(text=True):
+                self.patterns.append(Pattern([line.strip() for line in block]))
 
     def solve1(self):
         return sum(p.score1() for p in self.patterns)
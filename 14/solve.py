@@ -1,132 +1,69 @@
 from __future__ import annotations
+import os
 import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.coords import Layout
+
+ROUND = ord('O')
+EMPTY = ord('.')
+CUBE = ord('#')
+
 class Solver():
     def __init__(self, filename: str):
-        with open(filename, 'r') as f:
-            self.board = [line.strip() for line in f.readlines()]
+        self.layout, self.board = Layout.read(filename)
+        l = self.layout
+
+        # Each lane is a row or column of cell indices, starting from the edge the rocks roll towards
+        columns = [range(l.pack(0, c), l.pack(l.height, c), l.stride) for c in range(l.width)]
+        rows = [range(l.pack(r, 0), l.pack(r, l.width)) for r in range(l.height)]
+        self.lanes = {
+            'north': columns,
+            'south': [lane[::-1] for lane in columns],
+            'west': rows,
+            'east': [lane[::-1] for lane in rows],
+        }
+
+    def tilt(self, direction: str):
+        data = self.board
+        for lane in self.lanes[direction]:
+            free = 0
+            for pos, idx in enumerate(lane):
+                cell = data[idx]
+                if cell == CUBE:
+                    free = pos + 1
+                elif cell == ROUND:
+                    if pos != free:
+                        data[lane[free]], data[idx] = ROUND, EMPTY
+                    free += 1
 
     def solve1(self):
-        columns = [[] for i in range(len(self.board[0]))]
-
-        for row in self.board:
-            for i in range(len(row)):
-                columns[i].append(row[i])
-
-        for col in columns:
-            col_len = len(col)
-            idx = 1
-            while idx < col_len:
-                if col[idx] == 'O':
-                    temp_idx = idx
-                    while temp_idx > 0 and col[temp_idx - 1] == '.':
-                        col[temp_idx], col[temp_idx - 1] = '.', 'O'
-                        temp_idx -= 1
-                idx += 1
-        
-        # Convert the column view back to a row view
-        tilted = [[] for i in range(len(columns[0]))]
-        for col in columns:
-            for i in range(len(col)):
-                tilted[i].append(col[i])
-
-        self.tilted = tilted
-
-        load = 0
-        score = len(tilted)
-        for row in tilted:
-            load += row.count('O') * score
-            score -= 1
+        original = self.board
+        self.board = bytearray(original)
+        self.north()
+        load = self.total_load()
 
+        self.tilted = self.board
+        self.board = original
         return load
     
     def north(self):
-        columns = [[] for i in range(len(self.board[0]))]
-
-        for row in self.board:
-            for i in range(len(row)):
-                columns[i].append(row[i])
-
-        for col in columns:
-            col_len = len(col)
-            idx = 1
-            while idx < col_len:
-                if col[idx] == 'O':
-                    temp_idx = idx
-                    while temp_idx > 0 and col[temp_idx - 1] == '.':
-                        col[temp_idx], col[temp_idx - 1] = '.', 'O'
-                        temp_idx -= 1
-                idx += 1
-        
-        # Convert the column view back to a row view
-        tilted = [[] for i in range(len(columns[0]))]
-        for col in columns:
-            for i in range(len(col)):
-                tilted[i].append(col[i])
-
-        self.board = tilted
+        self.tilt('north')
 
     def south(self):
-        columns = [[] for i in range(len(self.board[0]))]
-
-        for row in self.board:
-            for i in range(len(row)):
-                columns[i].append(row[i])
-
-        for col in columns:
-            col_len = len(col)
-            idx = col_len - 2
-            while idx > -1:
-                if col[idx] == 'O':
-                    temp_idx = idx
-                    while temp_idx < col_len - 1 and col[temp_idx + 1] == '.':
-                        col[temp_idx], col[temp_idx + 1] = '.', 'O'
-                        temp_idx += 1
-                idx -= 1
-        
-        # Convert the column view back to a row view
-        tilted = [[] for i in range(len(columns[0]))]
-        for col in columns:
-            for i in range(len(col)):
-                tilted[i].append(col[i])
-
-        self.board = tilted
+        self.tilt('south')
 
     def west(self):
-        rows = self.board
-        for row in rows:
-            row_len = len(row)
-            idx = 1
-            while idx < row_len:
-                if row[idx] == 'O':
-                    temp_idx = idx
-                    while temp_idx > 0 and row[temp_idx - 1] == '.':
-                        row[temp_idx], row[temp_idx - 1] = '.', 'O'
-                        temp_idx -= 1
-                idx += 1
-        
-        self.board = rows
+        self.tilt('west')
 
     def east(self):
-        rows = self.board
-        for row in rows:
-            row_len = len(row)
-            idx = row_len - 2
-            while idx > -1:
-                if row[idx] == 'O':
-                    temp_idx = idx
-                    while temp_idx < row_len - 1 and row[temp_idx + 1] == '.':
-                        row[temp_idx], row[temp_idx + 1] = '.', 'O'
-                        temp_idx += 1
-                idx -= 1
-        
-        self.board = rows
+        self.tilt('east')
 
     def total_load(self):
         total_load = 0
-        score = len(self.board)
-        for row in self.board:
-            total_load += row.count('O') * score
+        score = self.layout.height
+        for row in self.layout.rows(self.board):
+            total_load += row.count(ROUND) * score
             score -= 1
 
         return total_load
@@ -138,60 +75,13 @@ class Solver():
         self.east()
 
     def as_string(self):
-        biglist = []
-        for row in self.board:
-            biglist.extend(row)
-
-        return ''.join(biglist)
+        return bytes(self.board)
 
     def solve2(self):
         print("Initial Board:")
-        for row in self.board:
-            print(''.join(row))
+        print(b"\n".join(self.layout.rows(self.board)).decode())
         print("---")
 
-        # print("After 1 cycle:")
-        # self.cycle()
-        # for row in self.board:
-        #     print(''.join(row))
-        # print("---")
-
-        # print("After 2 cycles:")
-        # self.cycle()
-        # for row in self.board:
-        #     print(''.join(row))
-        # print("---")
-
-        # print("After 3 cycles:")
-        # self.cycle()
-        # for row in self.board:
-        #     print(''.join(row))
-        # print("---")
-
-        # self.north()
-        # print("After tilting north:")
-        # for row in self.board:
-        #     print(''.join(row))
-        # print("---")
-
-        # self.west()
-        # print("After tilting west:")
-        # for row in self.board:
-        #     print(''.join(row))
-        # print("---")
-
-        # self.south()
-        # print("After tilting south:")
-        # for row in self.board:
-        #     print(''.join(row))
-        # print("---")
-
-        # self.east()
-        # print("After tilting east:")
-        # for row in self.board:
-        #     print(''.join(row))
-        # print("---")
-
         current = self.as_string()
         its = 0
         seen = set()
@@ -226,4 +116,4 @@ if __name__ == "__main__":
     solver = Solver(filename)
 
     print(f"First Solution: {solver.solve1()}")
-    print(f"Second Solution: {solver.solve2()}")
\ No newline at end of file
+    print(f"Second Solution: {solver.solve2()}")
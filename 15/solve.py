@@ -1,10 +1,14 @@
 from __future__ import annotations
+import os
 import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.loader import Input
+
 class Solver():
     def __init__(self, filename: str):
-        with open(filename, 'r') as f:
-            strings = f.read().split(',')
+        with Input(filename) as f:
+            strings = list(f.tokens(b',', text=True))
 
         self.strings = strings
 
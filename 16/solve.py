@@ -1,163 +1,71 @@
 from __future__ import annotations
+import os
 import sys
 
-type Coord = tuple[int, int]
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.coords import Layout, OUTSIDE
 
 class Solver():
     def __init__(self, filename: str):
-        self.board: list[list[str]] = []
-        with open(filename, 'r') as f:
-            for line in f.readlines():
-                self.board.append(list(line.strip()))
-
-        self.height = len(self.board)
-        self.width = len(self.board[0])
-
-    def lookup(self, coord: Coord)->str:
-        x, y = coord
-        return self.board[x][y]
-
-    def step(self, coord: Coord, direction: str)->list[tuple[Coord, str]]:
-        steps: list[Coord] = []
-        char = self.lookup(coord)
-
-        # Empty space is easy, it just continues on the same direction
-        if char == '.':
-            next = self.direction(coord, direction)
-            if self.legal(next):
-                steps.append((next, direction))
-
-        # Splitters either continue, or change direction
-        elif char == '|':
-            if direction in ["up", "down"]:
-                next = self.direction(coord, direction)
-                if self.legal(next):
-                    steps.append((next, direction))
-            elif direction in ["left", "right"]:
-                up = self.direction(coord, "up")
-                if self.legal(up):
-                    steps.append((up, "up"))
-
-                down = self.direction(coord, "down")
-                if self.legal(down):
-                    steps.append((down, "down"))
-
-            else:
-                assert False, f"Invalid direction: {direction}"
-
-        elif char == '-':
-            if direction in ["left", "right"]:
-                next = self.direction(coord, direction)
-                if self.legal(next):
-                    steps.append((next, direction))
-            elif direction in ["up", "down"]:
-                left = self.direction(coord, "left")
-                if self.legal(left):
-                    steps.append((left, "left"))
-
-                right = self.direction(coord, "right")
-                if self.legal(right):
-                    steps.append((right, "right"))
-            else:
-                assert False, f"Invalid direction: {direction}"
-
-        # Mirrors always change direction
-        elif char == '/':
-            if direction == "right":
-                next = self.direction(coord, "up")
-                if self.legal(next):
-                    steps.append((next, "up"))
-            
-            elif direction == "left":
-                next = self.direction(coord, "down")
-                if self.legal(next):
-                    steps.append((next, "down"))
-
-            elif direction == "up":
-                next = self.direction(coord, "right")
-                if self.legal(next):
-                    steps.append((next, "right"))
-
-            elif direction == "down":
-                next = self.direction(coord, "left")
-                if self.legal(next):
-                    steps.append((next, "left"))
-            else:
-                assert False, f"Invalid direction: {direction}"
-
-        elif char == '\\':
-            if direction == "left":
-                next = self.direction(coord, "up")
-                if self.legal(next):
-                    steps.append((next, "up"))
-            
-            elif direction == "right":
-                next = self.direction(coord, "down")
-                if self.legal(next):
-                    steps.append((next, "down"))
-
-            elif direction == "down":
-                next = self.direction(coord, "right")
-                if self.legal(next):
-                    steps.append((next, "right"))
-
-            elif direction == "up":
-                next = self.direction(coord, "left")
-                if self.legal(next):
-                    steps.append((next, "left"))
-            else:
-                assert False, f"Invalid direction: {direction}"
-
-        return steps
-
-    def legal(self, coord: Coord)->bool:
-        x, y = coord
-        return x >= 0 and y >= 0 and x < self.height and y < self.width
-    
-    def direction(self, coord: Coord, direction: str)->Coord:
-        x, y = coord
-        if direction == "left":
-            return (x, y - 1)
-        elif direction == "right":
-            return (x, y + 1)
-        elif direction == "up":
-            return (x - 1, y)
-        elif direction == "down":
-            return (x + 1, y)
-        else:
-            assert False, f"Invalid direction: {direction}"
-
-    
-    def count(self, start: tuple[Coord, str]):
-        energized: list[Coord] = []
-        found: list[tuple[Coord, str]] = [start]
-        handled = set()
-
-        while len(found) > 0:
-            coord, direction = found.pop()
-            if (coord, direction) in handled:
+        # Squares are packed ints with a border round the board, so walking off the edge lands on OUTSIDE
+        self.layout, self.board = Layout.read(filename)
+        self.height = self.layout.height
+        self.width = self.layout.width
+
+        up, right, down, left = self.layout.NEIGHBORS4
+
+        # Which way a beam leaves each kind of square, given the way it was heading
+        self.turns: dict[int, dict[int, tuple[int, ...]]] = {
+            # Empty space is easy, it just continues on the same direction
+            ord('.'): {up: (up,), right: (right,), down: (down,), left: (left,)},
+
+            # Splitters either continue, or change direction
+            ord('|'): {up: (up,), down: (down,), left: (up, down), right: (up, down)},
+            ord('-'): {left: (left,), right: (right,), up: (left, right), down: (left, right)},
+
+            # Mirrors always change direction
+            ord('/'): {right: (up,), left: (down,), up: (right,), down: (left,)},
+            ord('\\'): {left: (up,), right: (down,), down: (right,), up: (left,)},
+        }
+
+        # One bit per direction, so a single byte per square records every way a beam has crossed it
+        self.bits = {up: 1, right: 2, down: 4, left: 8}
+
+    def count(self, start: tuple[int, int]):
+        board = self.board
+        turns = self.turns
+        bits = self.bits
+        handled = bytearray(self.layout.size)
+        found: list[tuple[int, int]] = [start]
+
+        while found:
+            square, direction = found.pop()
+            bit = bits[direction]
+            if handled[square] & bit:
                 continue
-            handled.add((coord, direction))
-            energized.append(coord)
-            steps = self.step(coord, direction)
-            # print(f"Stepped from {coord} to {steps}")
-            found.extend(self.step(coord, direction))
-        
-        return len(set(energized))
+            handled[square] |= bit
+
+            for step in turns[board[square]][direction]:
+                if board[square + step] != OUTSIDE:
+                    found.append((square + step, step))
+
+        # Every square a beam crossed has at least one bit set, and the border is never touched
+        return len(handled) - handled.count(0)
 
     def solve1(self):
-        return self.count(((0, 0), "right"))
+        return self.count((self.layout.pack(0, 0), self.layout.E))
 
     def solve2(self):
-        starts: list[tuple[Coord, str]] = []
+        layout = self.layout
+        starts: list[tuple[int, int]] = []
 
         for i in range(self.width):
-            starts.append(((0, i), "down"))
-            starts.append(((self.height - 1, i), "up"))
+            starts.append((layout.pack(0, i), layout.S))
+            starts.append((layout.pack(self.height - 1, i), layout.N))
 
         for j in range(self.height):
-            starts.append(((j, 0), "right"))
-            starts.append(((j, self.width - 1), "left"))
+            starts.append((layout.pack(j, 0), layout.E))
+            starts.append((layout.pack(j, self.width - 1), layout.W))
 
         energized = [self.count(start) for start in starts]
         return max(energized)
@@ -171,4 +79,4 @@ if __name__ == "__main__":
     solver = Solver(filename)
 
     print(f"First Solution: {solver.solve1()}")
-    print(f"Second Solution: {solver.solve2()}")
\ No newline at end of file
+    print(f"Second Solution: {solver.solve2()}")
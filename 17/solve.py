@@ -1,63 +1,27 @@
 from __future__ import annotations
-import heapq
+import os
 import sys
 
-class Node:
-    def __init__(self, name, edges: list[tuple]):
-        self.name = name
-        self.edges = edges
-        self.distance = float('inf')
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.coords import Layout, OUTSIDE
+from aoc.search import BucketQueue, GraphBuilder, dijkstra
+from aoc.search import Graph as DenseGraph
 
-    def __lt__(self, other: Node):
-        return self.distance < other.distance
-    
-    def set_distance(self, dist: int):
-        self.distance = dist
-    
 class Graph:
     def __init__(self):
-        self.vertex_names = set() # Set of any type
-        self.edges = set() # Set of 3-tuples (src, dst, cost)
-        
+        self.builder = GraphBuilder()
+
     def add_edge(self, v1, v2, cost=1):
-        self.vertex_names.add(v1)
-        self.vertex_names.add(v2)
-        self.edges.add((v1, v2, cost))
+        self.builder.add_edge(v1, v2, cost)
 
     def solve(self, start, end):
-        edge_lists = {name: [] for name in self.vertex_names}
+        # Vertices are numbered as they're added, so the search runs on plain ints
+        graph = self.builder.build()
+        print(f"Starting to solve a graph with {graph.edge_count()} edges and {len(graph)} nodes")
 
-        for (src, dst, cost) in self.edges:
-            edge_lists[src].append((dst, cost))
-        
-        remaining: list[Node] = []
-        node_dict: dict[any, Node]= {}
-
-        for key, value in edge_lists.items():
-            node = Node(key, value)
-            if key == start:
-                node.set_distance(0)
-
-            remaining.append(node)
-            node_dict[key] = node
-
-        print(f"Starting to solve a graph with {len(self.edges)} edges and {len(remaining)} nodes")
-        remaining.sort()
-        assert remaining[0].distance == 0, "Start node distance isn't 0"
-
-        current = remaining.pop(0)
-        while current.name != end:
-            tainted = False
-            for (dst, cost) in current.edges:
-                if current.distance + cost < node_dict[dst].distance:
-                    tainted = True
-                    node_dict[dst].set_distance(current.distance + cost)
-            if tainted:
-                remaining.sort()
-
-            current = remaining.pop(0)
-
-        return current.distance
+        ids = self.builder.ids
+        distances = dijkstra(graph, ids[start], goal=ids[end], queue=BucketQueue)
+        return distances[ids[end]]
         
 
 class Solver():
@@ -67,6 +31,10 @@ class Solver():
             self.height = len(self.board)
             self.width = len(self.board[0])
 
+        # The same board as packed ints, with a border to walk into instead of checking bounds
+        self.layout = Layout(self.width, self.height)
+        self.squares = self.layout.pad([''.join(row) for row in self.board])
+
     def lookup(self, coord)->int:
         x, y = coord
         return int(self.board[x][y])
@@ -225,42 +193,46 @@ class Solver():
 
     def newSolve1(self, min_walk: int, max_walk: int):
         """Solves the constrained case"""
-        g = Graph()
+        layout = self.layout
+        squares = self.squares
+        edges: list[tuple[int, int, int]] = []
 
-        # Create two nodes for each (x, y) coordinate in the board: one for horizontal arrivals and one for vertical arrivals.
+        # Create two nodes for each square on the board: one for horizontal arrivals and one for vertical arrivals.
         # For nodes that were arrived at via a horizontal walk, you may only exit vertically. The converse is also true.
+        # Squares are packed ints, so node 2 * square is the horizontal arrival and 2 * square + 1 the vertical one.
 
         # Outgoing edges are of length min_walk <= length <= max_walk and have weight equal to the sum of the arrival costs.
-        for i in range(self.height):
-            for j in range(self.width):
-                h_src = (i, j, True) # Horizontal arrival, vertical exit
-                v_src = (i, j, False) # Vertical arrival, horizontal exit
-                for offset in range(min_walk, max_walk + 1): # Includes min_walk and max_walk
-                    if i - offset >  -1: # Walk north
-                        cost = sum(self.lookup((i-k, j)) for k in range(1, offset+1))
-                        g.add_edge(h_src, (i-offset, j, False), cost)
-
-                    if i + offset < self.height: # Walk south
-                        cost = sum(self.lookup((i+k, j)) for k in range(1, offset+1))
-                        g.add_edge(h_src, (i+offset, j, False), cost)
-
-                    if j - offset >  -1: # Walk west
-                        cost = sum(self.lookup((i, j-k)) for k in range(1, offset+1))
-                        g.add_edge(v_src, (i, j-offset, True), cost)
-
-                    if j + offset < self.width: # Walk east
-                        cost = sum(self.lookup((i, j+k)) for k in range(1, offset+1))
-                        g.add_edge(v_src, (i, j+offset, True), cost)
-        
+        walks = [
+            (layout.N, 0, 1), (layout.S, 0, 1), # Horizontal arrival, walk north or south to a vertical arrival
+            (layout.W, 1, 0), (layout.E, 1, 0), # Vertical arrival, walk west or east to a horizontal arrival
+        ]
+        for square in layout.cells():
+            for step, src, dst in walks:
+                cost = 0
+                current = square
+                for offset in range(1, max_walk + 1):
+                    current += step
+                    if squares[current] == OUTSIDE: # Walked off the board
+                        break
+                    cost += squares[current] - ord('0')
+                    if offset >= min_walk:
+                        edges.append((2 * square + src, 2 * current + dst, cost))
+
         # Need two start nodes: one where we land at (0, 0) vertically and one where we land at (0, 0) horizontally
-        g.add_edge("start", (0, 0, True), 0)
-        g.add_edge("start", (0, 0, False), 0)
+        start = 2 * layout.size
+        first = layout.pack(0, 0)
+        edges.append((start, 2 * first, 0))
+        edges.append((start, 2 * first + 1, 0))
 
         # Likewise, we need two end nodes
-        g.add_edge((self.height - 1, self.width - 1, True), "end", 0)
-        g.add_edge((self.height - 1, self.width - 1, False), "end", 0)
-        
-        return g.solve("start", "end")
+        end = start + 1
+        last = layout.pack(self.height - 1, self.width - 1)
+        edges.append((2 * last, end, 0))
+        edges.append((2 * last + 1, end, 0))
+
+        graph = DenseGraph.from_edges(end + 1, edges)
+        print(f"Starting to solve a graph with {graph.edge_count()} edges and {len(graph)} nodes")
+        return dijkstra(graph, start, goal=end, queue=BucketQueue)[end]
     
     def solve2(self):
         pass
@@ -1,5 +1,11 @@
 from __future__ import annotations
+from collections import defaultdict
 from dataclasses import dataclass, field
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.interval import IntervalSet
 
 @dataclass
 class Entry:
@@ -8,13 +14,13 @@ class Entry:
     color:  int
 
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Vertex:
     x: int
     y: int
 
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Edge:
     v1: Vertex
     v2: Vertex
@@ -56,7 +62,7 @@ def make_edge(v1: Vertex, v2: Vertex, active: bool) -> Edge:
     else:
         return Edge(v2, v1, active)
             
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class Face:
     top:    Edge
     right:  Edge
@@ -117,32 +123,29 @@ class Graph:
                 new_vertices.add(Vertex(x, y))
 
 
+        # Where the original edges run, by row and by column. A new edge is active
+        # when it lies along an original one, and since the new edges only go between
+        # neighbouring values, that's when one of these intervals covers it.
+        rows: dict[int, IntervalSet] = defaultdict(IntervalSet)
+        columns: dict[int, IntervalSet] = defaultdict(IntervalSet)
+        for e in self.edges:
+            if e.horizonal():
+                rows[e.v1.y].add(e.v1.x, e.v2.x)
+            else:
+                columns[e.v1.x].add(e.v1.y, e.v2.y)
+
         for y in y_vals:
+            row = rows.get(y, IntervalSet())
             last_x = x_vals[0]
             for x in x_vals[1:]:
-                v1 = Vertex(last_x, y)
-                v2 = Vertex(x, y)
-                active = False
-                for e in self.edges:
-                    if e.contains(v1) and e.contains(v2):
-                        active = True
-                        break
-                new_edges.add(make_edge(v1, v2, active))
+                new_edges.add(make_edge(Vertex(last_x, y), Vertex(x, y), row.covers(last_x, x)))
                 last_x = x
 
-        
         for x in x_vals:
+            column = columns.get(x, IntervalSet())
             last_y = y_vals[0]
             for y in y_vals[1:]:
-                v1 = Vertex(x, last_y)
-                v2 = Vertex(x, y)
-                active = False
-
-                for e in self.edges:
-                    if e.contains(v1) and e.contains(v2):
-                        active = True
-                        break
-                new_edges.add(make_edge(v1, v2, active))
+                new_edges.add(make_edge(Vertex(x, last_y), Vertex(x, y), column.covers(last_y, y)))
                 last_y = y
 
         self.edges = new_edges
@@ -333,11 +336,31 @@ def make_entry2(line: str) -> Entry:
     d = hexcode[7]
     return Entry({"0": "R", "1": "D", "2": "L", "3": "U"}[d], int(l, 16), 0)
 
-g = Graph()
+class Solver():
+    def __init__(self, filename: str):
+        with open(filename, "r") as f:
+            self.lines = [line for line in f if line.strip() != ""]
+
+    def dig(self, entries: list[Entry]) -> int:
+        g = Graph()
+        for entry in entries:
+            g.add_entry(entry)
 
-with open("input", "r") as f:
-    for line in f:
-        g.add_entry(make_entry2(line))
+        g.extend()
+        return g.count()
+
+    def solve1(self) -> int:
+        return self.dig([make_entry(line) for line in self.lines])
+
+    def solve2(self) -> int:
+        return self.dig([make_entry2(line) for line in self.lines])
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        filename = sys.argv[1]
+    else:
+        filename = "input"
 
-g.extend()
-print(g.count())
\ No newline at end of file
+    solver = Solver(filename)
+    print(solver.solve2())
@@ -1,11 +1,17 @@
 from __future__ import annotations
 from dataclasses import dataclass
+import os
 import re
 import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.interval import IntervalSet
+
 type Part = dict[str, int]
 
-@dataclass
+RATINGS = IntervalSet([(1, 4001)]) # Every rating is from 1 to 4000
+
+@dataclass(slots=True)
 class Expression:
     """Class for keeping track of an expression"""
     variable: str
@@ -25,6 +31,13 @@ class Expression:
         else: # self.operation == '>'
             return Expression(self.variable, '<', self.literal + 1)
 
+    def allowed(self)->IntervalSet:
+        """The ratings that satisfy the expression"""
+        if self.operator == '<':
+            return IntervalSet([(1, self.literal)])
+        else:
+            return IntervalSet([(self.literal + 1, 4001)])
+
 class Workflow:
     """CLass for holding a workflow"""
 
@@ -55,45 +68,24 @@ class ExpressionSet:
     """Class for evaluating conjunctions of expressions"""
 
     def __init__(self):
-        self.expr_dict: dict[str, list[Expression]] = {x: [] for x in ['x','m','a','s']}
+        # The ratings each category can still have, narrowed down by every expression added
+        self.allowed: dict[str, IntervalSet] = {x: RATINGS for x in ['x','m','a','s']}
 
     def addExpr(self, expr: Expression):
-        self.expr_dict[expr.variable].append(expr)
+        self.allowed[expr.variable] = self.allowed[expr.variable] & expr.allowed()
 
     @classmethod
     def copy(cls, instance: ExpressionSet)->ExpressionSet:
         es = cls()
-        for l in instance.expr_dict.values():
-            for expr in l:
-                es.addExpr(expr)
+        es.allowed = dict(instance.allowed) # Sets are never changed in place, so they can be shared
 
         return es
     
     def count(self)->int:
         combos = 1
-        #print('Counting an ExpressionSet')
-        for cat, expr_list in self.expr_dict.items(): # This is safe because the constructor makes 4 entries
-
-            lt = list(filter(lambda x: x.operator == '<', expr_list))
-            gt = list(filter(lambda x: x.operator == '>', expr_list))
-
-            if len(lt) > 0:
-                lt.sort(key=lambda x: x.literal)
-                lub = lt[0].literal
-            else:
-                lub = 4001
-            
-            if len(gt) > 0:
-                gt.sort(key=lambda x: x.literal)
-                glb = gt[-1].literal
-            else:
-                glb = 0
-            
-            combos *= (lub - glb - 1)
-
-            #print(f'  {glb} < {cat} < {lub}: {lub - glb - 1}')
+        for allowed in self.allowed.values():
+            combos *= allowed.size()
 
-        #print(f'Total: {combos}')
         return combos
 
 class Solver():
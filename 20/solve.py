@@ -1,10 +1,14 @@
 from __future__ import annotations
 from collections import deque
 from dataclasses import dataclass
+import os
 import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc import metrics
 
-@dataclass
+
+@dataclass(slots=True)
 class Pulse:
     source: str
     destination: str
@@ -120,6 +124,10 @@ class Circuit:
         while self.pulse_queue:
             self.dispatch(self.pulse_queue.pop())
 
+        # dispatch logs every pulse, so the log says how many this press sent
+        metrics.count("20.pulses", len(self.pulse_log))
+        metrics.observe("20.pulses_per_press", len(self.pulse_log))
+
     def score(self) -> int:
         return self.low_count * self.high_count
 
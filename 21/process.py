@@ -1,7 +1,7 @@
 import sys
-from z3 import *
 from timeit import default_timer as timer
-import matplotlib.pyplot as plt
+
+# z3 and matplotlib are slow to import, so each is only imported by the functions that use it
 
 def parse(fname) -> dict[int, int]:
     res = {0: 1}
@@ -13,6 +13,8 @@ def parse(fname) -> dict[int, int]:
     return res
 
 def plot(results: dict[int, int]):
+    import matplotlib.pyplot as plt
+
     x = [i for i in range(len(results)+1) if i % 50 == 0]
     y = [results[i] for i in x]
 
@@ -24,6 +26,7 @@ def poly(results: dict[int, int]) -> bool:
     # Assume that after some amount of time, the number of steps is defined by the equation:
     # y = ax^4 + bx^3 + cx^2 + dx + e
     # Also assume that those are integers, because there's no reason to think they wouldn't be
+    from z3 import Int, Solver, unsat
 
     a = Int("a")
     b = Int("b")
@@ -54,6 +57,7 @@ def difference(results: dict[int, int]) -> bool:
     # I don't think we need to know m ahead of time, if we choose a sufficiently large m for the solver
     # Any unneeded coefficients should come back as 0 in the model
     # In order to have enough constraints to get a meaningful answer, we can use a sliding window
+    from z3 import Int, Solver, unsat
 
     m = 25
 
@@ -1,57 +1,52 @@
 from __future__ import annotations
+import os
 import sys
 from timeit import default_timer as timer
 
-type Coord = tuple[int, int]
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.checkpoint import Checkpoint
+from aoc.coords import Layout, OUTSIDE
+from aoc.memo import MISSING, Memo
+
+type Coord = int # Packed (row, column), see aoc.coords
 type Plot = frozenset[Coord]
 
+# Copies of the garden are packed into one int too, QUADRANT apart vertically and 1 apart horizontally
+QUADRANT = 1 << 20
+
 def initial_plot(start: Coord) -> Plot:
     return frozenset([start])
 
-def neighbors(plot: Plot) -> Plot:
-    n: list[Coord] = []
-    for c in plot:
-        n.append((c[0]-1, c[1]))
-        n.append((c[0]+1, c[1]))
-        n.append((c[0], c[1]-1))
-        n.append((c[0], c[1]+1))
+def neighbors(plot: Plot, steps: tuple[int, ...]) -> Plot:
+    return frozenset(c + step for c in plot for step in steps)
 
-    return frozenset(n)
+def next_plot(current_plot: Plot, open_areas: Plot, steps: tuple[int, ...]) -> Plot:
+    return open_areas.intersection(neighbors(current_plot, steps))
 
-def next_plot(current_plot: Plot, open_areas: Plot) -> Plot:
-    return open_areas.intersection(neighbors(current_plot))
+PLOT_CACHE_SQUARES = 1 << 20
 
 class Solver():
     def __init__(self, filename: str):
-        self.reachable:set[Coord] = set()
-        row_number = 0
-        with open(filename, 'r') as f:
-            for line in f:
-                line = line.strip()
-                col_number = 0
-                for char in line:
-                    if char == 'S':
-                        self.start = (row_number, col_number)
-                        self.reachable.add((row_number, col_number))
-
-                    elif char == '.':
-                        self.reachable.add((row_number, col_number))
-
-                    col_number += 1
-                row_number += 1
-
-        self.height = row_number
-        self.width = col_number
+        # Squares are packed ints, with a border round the garden to spot steps off the edge
+        self.layout, self.garden = Layout.read(filename)
+        self.start: Coord = self.garden.index(ord('S'))
+        self.reachable: set[Coord] = {c for c in self.layout.cells() if self.garden[c] in b'.S'}
+
+        self.height = self.layout.height
+        self.width = self.layout.width
+        self.filename = filename
 
     def solve1(self, steps: int) -> int:
         """Naive solver for part 1"""
         reachable_sets: list[set[Coord]] = [set([self.start])]
+        reachable = self.reachable
+        moves = self.layout.NEIGHBORS4
         for i in range(steps):
             new_set = set()
-            for (x, y) in reachable_sets[-1]:
-                for coord in [(x-1, y), (x+1, y), (x, y-1), (x, y+1)]:
-                    if coord in self.reachable:
-                        new_set.add(coord)
+            for c in reachable_sets[-1]:
+                for step in moves:
+                    if c + step in reachable:
+                        new_set.add(c + step)
             reachable_sets.append(new_set)
 
         return len(reachable_sets[-1])
@@ -61,95 +56,77 @@ class Solver():
         current = initial_plot(self.start)
         reachable = frozenset(self.reachable)
 
-        cache: dict[Plot, Plot] = {}
+        # Weighed by squares held, the plots at the end are the biggest and they alternate
+        cache: Memo[Plot, Plot] = Memo(PLOT_CACHE_SQUARES, weigh=lambda current, next: len(current) + len(next))
 
         for _ in range(steps):
-            if current in cache:
-                current = cache[current]
-            else:
-                next = next_plot(current, reachable)
-                cache[current] = next
-                current = next
+            next = cache.get(current, MISSING)
+            if next is MISSING:
+                next = cache.put(current, next_plot(current, reachable, self.layout.NEIGHBORS4))
+            current = next
 
+        cache.record("21.plots")
         return len(current)
     
     def solve3(self, seconds: int) -> int:
         # Begin with the starting point in the (0, 0) quadrant
-        last_dict: dict[Coord, set[Coord]] = {self.start: set([(0, 0)])}
-        
+        last_dict: dict[Coord, set[int]] = {self.start: set([0])}
+
+        # Stepping off one edge of the garden comes back in on the far side, in the next quadrant over
+        layout = self.layout
+        span = self.height * layout.stride
+        moves = [
+            (layout.N, span, -QUADRANT),
+            (layout.S, -span, QUADRANT),
+            (layout.W, self.width, -1),
+            (layout.E, -self.width, 1),
+        ]
+        garden = self.garden
+        reachable = self.reachable
 
-        file = open("tiny_output.csv", "w")
         steps = 1
 
+        # Named after the input, like the checkpoint, so runs on different inputs keep apart
+        output = f"{os.path.basename(self.filename)}_steps.csv"
+        checkpoint = Checkpoint(self.filename, "garden-steps-v2")
+        saved = checkpoint.resume()
+        if saved is not None and not (os.path.isfile(output) and os.path.getsize(output) >= saved[2]):
+            print(f"{output} is missing rows from before the checkpoint, starting over")
+            saved = None
+
+        if saved is None:
+            file = open(output, "w")
+        else:
+            steps, last_dict, written = saved
+            # Rows written after the checkpoint will be written again
+            file = open(output, "r+")
+            file.truncate(written)
+            file.seek(written)
+            print(f"Resuming at step {steps}")
+
         start_time = timer()
         last_time = start_time
         while steps < 5000:
-            new_dict: dict[Coord, set[Coord]] = {}
-            for (x, y), s in last_dict.items():
-
-                # (x-1, y)
-                if x > 0:
-                    p = (x-1, y)
-                    if p in self.reachable:
-                        if p in new_dict:
-                            new_dict[p].update(s)
-                        else:
-                            new_dict[p] = s.copy()
-                else:
-                    p = (self.height-1, y)
-                    if p in self.reachable:
-                        if p in new_dict:
-                            new_dict[p].update((i-1, j) for (i, j) in s)
-                        else:
-                            new_dict[p] = set((i-1, j) for (i, j) in s)
-
-                # (x+1, y)
-                if x+1 < self.height:
-                    p = (x+1, y)
-                    if p in self.reachable:
-                        if p in new_dict:
-                            new_dict[p].update(s)
-                        else:
-                            new_dict[p] = s.copy()
-                else:
-                    p = (0, y)
-                    if p in self.reachable:
-                        if p in new_dict:
-                            new_dict[p].update((i+1, j) for (i, j) in s)
-                        else:
-                            new_dict[p] = set((i+1, j) for (i, j) in s)
-
-                # (x, y-1)
-                if y > 0:
-                    p = (x, y-1)
-                    if p in self.reachable:
-                        if p in new_dict:
-                            new_dict[p].update(s)
-                        else:
-                            new_dict[p] = s.copy()
-                else:
-                    p = (x, self.width-1)
-                    if p in self.reachable:
-                        if p in new_dict:
-                            new_dict[p].update((i, j-1) for (i, j) in s)
-                        else:
-                            new_dict[p] = set((i, j-1) for (i, j) in s)
-
-                # (x, y+1)
-                if y+1 < self.width:
-                    p = (x, y+1)
-                    if p in self.reachable:
+            if checkpoint.due():
+                file.flush()
+                checkpoint.save((steps, last_dict, file.tell()))
+
+            new_dict: dict[Coord, set[int]] = {}
+            for c, s in last_dict.items():
+                for step, wrap, shift in moves:
+                    p = c + step
+                    if garden[p] == OUTSIDE:
+                        p += wrap
+                        if p in reachable:
+                            if p in new_dict:
+                                new_dict[p].update(q + shift for q in s)
+                            else:
+                                new_dict[p] = set(q + shift for q in s)
+                    elif p in reachable:
                         if p in new_dict:
                             new_dict[p].update(s)
                         else:
                             new_dict[p] = s.copy()
-                else:
-                    p = (x, 0)
-                    if p in self.reachable:
-                        if p in new_dict:
-                            new_dict[p].update((i, j+1) for (i, j) in s)
-                        else:
-                            new_dict[p] = set((i, j+1) for (i, j) in s)
 
             count = sum(len(x) for x in new_dict.values())
             new_time = timer()
@@ -160,6 +137,7 @@ class Solver():
             steps += 1
 
         file.close()
+        checkpoint.done()
         return steps - 1
    
 if __name__ == "__main__":
@@ -1,9 +1,15 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import os
 import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc import sidecar
+from aoc.interval import Interval
+from aoc.ints import read_ints
 
-@dataclass
+
+@dataclass(slots=True)
 class Coord:
     x: int
     y: int
@@ -12,12 +18,22 @@ class Coord:
     def __str__(self) -> str:
         return f"{self.x},{self.y},{self.z}"
 
-@dataclass
+@dataclass(slots=True)
 class Brick:
     c1: Coord
     c2: Coord
     idx: int
 
+    # Worked out from the corners, slots need them declared up front
+    _min_x: int = field(init=False, repr=False, compare=False)
+    _min_y: int = field(init=False, repr=False, compare=False)
+    _min_z: int = field(init=False, repr=False, compare=False)
+    _max_x: int = field(init=False, repr=False, compare=False)
+    _max_y: int = field(init=False, repr=False, compare=False)
+    _max_z: int = field(init=False, repr=False, compare=False)
+    xs: Interval = field(init=False, repr=False, compare=False)
+    ys: Interval = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
         self._min_x = min(self.c1.x, self.c2.x)
         self._min_y = min(self.c1.y, self.c2.y)
@@ -26,6 +42,10 @@ class Brick:
         self._max_y = max(self.c1.y, self.c2.y)
         self._max_z = max(self.c1.z, self.c2.z)
 
+        # The brick's footprint, as half-open ranges of x and y
+        self.xs = Interval(self._min_x, self._max_x + 1)
+        self.ys = Interval(self._min_y, self._max_y + 1)
+
     def min_x(self) -> int:
         return self._min_x
 
@@ -48,12 +68,7 @@ class Brick:
         return not self.misses(other)
 
     def misses(self, other: Brick) -> bool:
-        return (
-            self.min_x() > other.max_x()
-            or self.max_x() < other.min_x()
-            or self.min_y() > other.max_y()
-            or self.max_y() < other.min_y()
-        )
+        return not (self.xs.overlaps(other.xs) and self.ys.overlaps(other.ys))
 
     def drop_to(self, base: int) -> Brick:
         delta = self.min_z() - base
@@ -104,14 +119,18 @@ class Stack:
 class Solver:
     def __init__(self, filename: str):
         bricks: list[Brick] = []
-        with open(filename, "r") as f:
-            count = 1
-            for line in f:
-                t1, t2 = line.strip().split("~")
-                x1, y1, z1 = [int(x) for x in t1.split(",")]
-                x2, y2, z2 = [int(x) for x in t2.split(",")]
-                bricks.append(Brick(Coord(x1, y1, z1), Coord(x2, y2, z2), count))
-                count += 1
+        stored = sidecar.load(filename, "bricks-v1")
+        if stored is None:
+            corners = read_ints(filename).values
+            sidecar.save(filename, "bricks-v1", {"corners": corners})
+        else:
+            corners = stored.arrays["corners"]
+
+        count = 1
+        for k in range(0, len(corners), 6):
+            x1, y1, z1, x2, y2, z2 = corners[k:k + 6]
+            bricks.append(Brick(Coord(x1, y1, z1), Coord(x2, y2, z2), count))
+            count += 1
 
         self.initial_stack = Stack.from_bricks(bricks)
 
@@ -1,8 +1,14 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
+import os
 import sys
 
-type Coord = tuple[int, int]
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc import metrics
+from aoc.checkpoint import Checkpoint
+from aoc.coords import Layout, OUTSIDE
+
+type Coord = int # Packed (row, column), see aoc.coords
 
 @dataclass
 class Hallway:
@@ -15,13 +21,13 @@ class Hallway:
         else:
             return self.junctions[0]
         
-@dataclass
+@dataclass(slots=True)
 class HallPath:
     current: Coord
     junctions: set[Coord] = field(default_factory=set)
     length: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class Path:
     current: Coord
     history: list[set[Coord]] = field(default_factory=list)
@@ -78,32 +84,35 @@ class Path:
 class Solver():
     
     def __init__(self, filename: str, climb: bool = False):
-        self.paths: dict[Coord, str] = {}
-        
         with open(filename, 'r') as f:
-            x = 0
-            for line in f:
-                y = 0
-                for c in line:
-                    if c in ['.', '<', '>', 'v', '^']:
-                        if climb:
-                            self.paths[(x, y)] = '.'
-                        else:
-                            self.paths[(x, y)] = c
-                    y += 1
-                x += 1
-        
-        self.start: Coord = (0, 1)
-        self.end: Coord = ((x-1, y-2))
+            lines = f.readlines()
+
+        # Squares are packed ints on a flat board, with walls and the border round it both OUTSIDE
+        board = [line.strip() for line in lines]
+        self.layout = Layout.from_lines(board)
+        self.paths = self.layout.pad(board).replace(b'#', bytes([OUTSIDE]))
+        if climb:
+            for slope in b'<>v^':
+                self.paths = self.paths.replace(bytes([slope]), b'.')
+        self.path_count = len(self.paths) - self.paths.count(OUTSIDE)
+        self.filename = filename
+        self.climb = climb
+
+        self.start: Coord = self.layout.pack(0, 1)
+        self.end: Coord = self.layout.pack(len(lines)-1, len(lines[-1])-2)
 
     def solve1(self):
         path = Path(self.start)
         longest_walk = 0
-        print(f'The longest theoretical path length is {len(self.paths)}')
+        print(f'The longest theoretical path length is {self.path_count}')
+
+        paths = self.paths
+        N, E, S, W = self.layout.NEIGHBORS4
+        dot, down, right = ord('.'), ord('v'), ord('>')
         
         keep_going = True
         while keep_going:
-            (x, y) = path.current
+            here = path.current
             if path.current == self.end:
                 steps = path.steps()
                 if steps > longest_walk:
@@ -114,35 +123,35 @@ class Solver():
 
             next_walks: list[tuple[Coord]] = []
             
-            north = (x-1, y)
-            if north in self.paths and path.unseen(north):
-                tile = self.paths[north]
-                if tile == '.':
+            north = here + N
+            if paths[north] != OUTSIDE and path.unseen(north):
+                tile = paths[north]
+                if tile == dot:
                     next_walks.append((north,))
             
-            west = (x, y-1)
-            if west in self.paths and path.unseen(west):
-                tile = self.paths[west]
-                if tile == '.':
+            west = here + W
+            if paths[west] != OUTSIDE and path.unseen(west):
+                tile = paths[west]
+                if tile == dot:
                     next_walks.append((west,))
 
-            south = (x+1, y)
-            if south in self.paths and path.unseen(south):
-                tile = self.paths[south]
-                if tile == '.':
+            south = here + S
+            if paths[south] != OUTSIDE and path.unseen(south):
+                tile = paths[south]
+                if tile == dot:
                     next_walks.append((south,))
-                elif tile == 'v':
-                    next = (x+2, y)
+                elif tile == down:
+                    next = south + S
                     if path.unseen(next):
                         next_walks.append((south, next))
             
-            east = (x, y+1)
-            if east in self.paths and path.unseen(east):
-                tile = self.paths[east]
-                if tile == '.':
+            east = here + E
+            if paths[east] != OUTSIDE and path.unseen(east):
+                tile = paths[east]
+                if tile == dot:
                     next_walks.append((east,))
-                elif tile == '>':
-                    next = (x, y+2)
+                elif tile == right:
+                    next = east + E
                     if path.unseen(next):
                         next_walks.append((east, next))
 
@@ -167,7 +176,9 @@ class Solver():
         hallways: list[Hallway] = []
         junctions: set[Coord] = set()
 
-        unexplored: list[tuple[Coord, Coord]] = [(self.start, (self.start[0]+1, self.start[1]))]
+        paths = self.paths
+        N, E, S, W = self.layout.NEIGHBORS4
+        unexplored: list[tuple[Coord, Coord]] = [(self.start, self.start + S)]
         visited: set[Coord] = set()
 
         while unexplored:
@@ -177,16 +188,10 @@ class Solver():
             junctions.add(j1)
             visited.add(c)
             current_set = {j1, c}
-            
-            (x, y) = c
-            north = (x-1, y)
-            south = (x+1, y)
-            east = (x, y+1)
-            west = (x, y-1)
 
             neighbors = []
-            for p in [north, south, east, west]:
-                if p in self.paths and p not in current_set:
+            for p in [c + N, c + S, c + E, c + W]:
+                if paths[p] != OUTSIDE and p not in current_set:
                     neighbors.append(p)
             
             while len(neighbors) == 1:
@@ -197,16 +202,10 @@ class Solver():
                 if c == self.end:
                     neighbors = []
                     break
-                
-                (x, y) = c
-                north = (x-1, y)
-                south = (x+1, y)
-                east = (x, y+1)
-                west = (x, y-1)
 
                 neighbors = []
-                for p in [north, south, east, west]:
-                    if p in self.paths and p not in current_set:
+                for p in [c + N, c + S, c + E, c + W]:
+                    if paths[p] != OUTSIDE and p not in current_set:
                         neighbors.append(p)
 
             current_set.remove(c) #c is now the second junction
@@ -219,7 +218,7 @@ class Solver():
 
         junctions.add(self.end)
 
-        print(f'There are {len(self.paths)} paths. {sum(x.size for x in hallways)} of those are in {len(hallways)} hallways. There are {len(junctions)} junctions.')
+        print(f'There are {self.path_count} paths. {sum(x.size for x in hallways)} of those are in {len(hallways)} hallways. There are {len(junctions)} junctions.')
         print(f'{len(visited)} paths were visited')
 
         junction_map: dict[Coord, list[Hallway]] = {j: [] for j in junctions}
@@ -229,10 +228,24 @@ class Solver():
 
         paths: list[HallPath] = [HallPath(self.start)]
         longest_path = 0
+        explored = finished = 0
+
+        # The hallways come out the same every time, so only the search itself is saved
+        checkpoint = Checkpoint(self.filename, f"hallpaths-{'climb' if self.climb else 'slopes'}-v1")
+        saved = checkpoint.resume()
+        if saved is not None:
+            longest_path, explored, finished, stack = saved
+            paths = [HallPath(current, set(seen), length) for current, seen, length in stack]
+            print(f'Resuming with {len(paths)} paths to go, {explored} explored so far')
 
         while paths:
+            if checkpoint.due():
+                checkpoint.save((longest_path, explored, finished, [(p.current, list(p.junctions), p.length) for p in paths]))
+
             hp = paths.pop()
+            explored += 1
             if hp.current == self.end:
+                finished += 1
                 if hp.length > longest_path:
                     print(f'Longest path to date: {hp.length}')
                     longest_path = hp.length
@@ -257,6 +270,9 @@ class Solver():
                     path = HallPath(next_hallway.other_end(hp.current), hp.junctions.copy(), hp.length + next_hallway.size + 1)
                     paths.append(path)
 
+        checkpoint.done()
+        metrics.count("23.paths_explored", explored)
+        metrics.count("23.paths_finished", finished)
         return longest_path
     
 if __name__ == "__main__":
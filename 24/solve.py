@@ -1,8 +1,10 @@
 from __future__ import annotations
 from dataclasses import dataclass
-import numpy as np
+import os
 import sys
-import z3
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc.ints import read_ints
 
 type Point2D = tuple[float, float]
 type Point3D = tuple[float, float, float]
@@ -14,15 +16,16 @@ class Hailstone:
     velocity: Point3D
 
     @classmethod
-    def from_line(cls, line: str) -> Hailstone:
-        p, v = line.split("@")
-        (px, py, pz) = p.split(",")
-        (vx, vy, vz) = v.split(",")
+    def from_numbers(cls, numbers) -> Hailstone:
+        px, py, pz, vx, vy, vz = numbers
         return Hailstone(
             (float(px), float(py), float(pz)), (float(vx), float(vy), float(vz))
         )
     
     def getXYintersection(self, other: Hailstone)->Point2D|None:
+        # Only part one needs numpy, and it's slow to import. After the first pair it's just a lookup in sys.modules.
+        import numpy as np
+
         A = np.array([[self.velocity[0], -self.velocity[1]],
                       [other.velocity[0], -other.velocity[1]]])
         
@@ -48,10 +51,7 @@ class Hailstone:
 
 class Solver:
     def __init__(self, filename: str):
-        self.hailstones: list[Hailstone] = []
-        with open(filename, "r") as f:
-            for line in f:
-                self.hailstones.append(Hailstone.from_line(line))
+        self.hailstones: list[Hailstone] = [Hailstone.from_numbers(row) for row in read_ints(filename).lines()]
 
     def solve1(self, XYmin, XYmax):
         found = 0
@@ -68,6 +68,8 @@ class Solver:
 
 
     def solve2(self):
+        import z3  # Only part two needs z3, and it's slow to import
+
         # We need a z3 solver to add our constraints to
         s = z3.Solver()
 
@@ -1,7 +1,13 @@
 from __future__ import annotations
+from array import array
 from dataclasses import dataclass, field
+import os
 import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from aoc import metrics, sidecar
+from aoc.unionfind import UnionFind
+
 type Vertex = str
 
 class Edge(tuple):
@@ -28,31 +34,33 @@ class Graph:
         self.vertices.add(edge[1])
 
     def min_cut(self)->Cut:
-        weights = {e: 1 for e in self.edges}
-
-        swg = SWGraph(self.vertices, self.edges, weights)
-
-        return swg.minimum_cut()
+        return SWGraph.from_graph(self).minimum_cut()
         
 @dataclass
-class SWGraph(Graph):
+class SWGraph():
     """Implements the Stoer-Wagner minimum cut algo"""
-    weights: dict[Edge, int] = field(default_factory=dict)
+    vertices: set[int]  # Numbered, a merged vertex goes by its root in merged
+    edges: set[Edge]
+    weights: dict[Edge, int]
+    names: list[Vertex]
+    merged: UnionFind  # Which of the original vertices have been merged together, shared by every phase
 
     
     def minimum_cut_phase(self)->tuple[Cut, SWGraph|None]:
         """Implements the Stoer-Wagner MinimumCutPhase"""            
 
         print(f'Entered minimum cut phase with |V| = {len(self.vertices)}')
+        metrics.count("25.phases")
+        metrics.observe("25.phase_edges", len(self.edges))
         if len(self.vertices) == 2:
-            return(Cut(list(self.edges), self.weights[next(iter(self.edges))]), None)
+            return(Cut(list(self.edges), self.weights[next(iter(self.edges))], next(iter(self.vertices))), None)
         
         vertices: set[Vertex] = set() # This is A in the original paper
         excluded_vertices = list(self.vertices)
 
         vertices.add(excluded_vertices.pop()) # Add an arbitrary vertex, can be different on each MinimumCutPhase
 
-        connectedness: dict[str, int] = {v: 0 for v in excluded_vertices}
+        connectedness: dict[int, int] = {v: 0 for v in excluded_vertices}
         for e in self.edges:
             (a, b) = e
             if (a in excluded_vertices and b in vertices):
@@ -75,11 +83,12 @@ class SWGraph(Graph):
         t = excluded_vertices[1]
 
         excluded_edges = list(filter(lambda e: (s in e or t in e) and e != Edge(s, t), self.edges))
-        cut = Cut(excluded_edges, sum(self.weights[e] for e in excluded_edges))
-
-        new_vertex = ','.join(excluded_vertices)
+        new_vertex = self.merged.union(s, t)
         vertices.add(new_vertex)
 
+        # The cut is everything leaving the merged vertex
+        cut = Cut(excluded_edges, sum(self.weights[e] for e in excluded_edges), new_vertex)
+
         edges: set[Edge] = set()
         weights: dict[Edge, int] = {}
         for e in self.edges:
@@ -105,41 +114,71 @@ class SWGraph(Graph):
                 edges.add(e)
                 weights[e] = (self.weights[e])
         
-        return (cut, SWGraph(vertices, edges, weights=weights))
+        return (cut, SWGraph(vertices, edges, weights, self.names, self.merged))
+
+    def side(self, vertex: int)->list[Vertex]:
+        """The original vertices merged into this one so far"""
+        root = self.merged.find(vertex)
+        return [self.names[v] for v in range(len(self.names)) if self.merged.find(v) == root]
     
     def minimum_cut(self)->Cut:
         c, g = self.minimum_cut_phase()
         min_cut = c
+        # Later phases merge more vertices in, so take the side as soon as the cut is found
+        min_cut.side = self.side(c.vertex)
         while g:
             #print(c)
             #print(g)
             c, g = g.minimum_cut_phase()
             if c.weight < min_cut.weight:
                 min_cut = c
+                min_cut.side = self.side(c.vertex)
         
         #print(c)
         return min_cut
         
     @classmethod
     def from_graph(cls, g:Graph):
-        weights = {e: 1 for e in g.edges}
-        swg = SWGraph(g.vertices, g.edges, weights)
-        return swg
+        return cls.from_weights({e: 1 for e in g.edges})
+
+    @classmethod
+    def from_weights(cls, weights: dict[Edge, int]):
+        names = sorted({v for e in weights for v in e})
+        ids = {v: i for i, v in enumerate(names)}
+        numbered = {Edge(ids[a], ids[b]): w for (a, b), w in weights.items()}
+        return SWGraph(set(range(len(names))), set(numbered), numbered, names, UnionFind(len(names)))
     
 
 @dataclass
 class Cut:
-    edges: list[Edge]
+    edges: list[Edge]  # Between the merged vertices of the phase that found it
     weight: int
+    vertex: int  # The merged vertex the cut goes round
+    side: list[Vertex] = field(default_factory=list)  # Its original vertices, filled in by minimum_cut
 
 class Solver():
     def __init__(self, filename: str):
         self.graph = Graph()
-        with open(filename, 'r') as f:
-            for line in f:
-                src, dsts = line.strip().split(':')
-                for dst in dsts.split():
-                    self.graph.add_edge(Edge(src, dst))
+
+        # Edges are saved as pairs of indexes into the list of vertex names
+        stored = sidecar.load(filename, "wiring-v1")
+        if stored is None:
+            ids: dict[Vertex, int] = {}
+            ends = array('q')
+            with open(filename, 'r') as f:
+                for line in f:
+                    src, dsts = line.strip().split(':')
+                    for dst in dsts.split():
+                        ends.append(ids.setdefault(src, len(ids)))
+                        ends.append(ids.setdefault(dst, len(ids)))
+            names = list(ids)
+            sidecar.save(filename, "wiring-v1", {"ends": ends}, {"names": names})
+        else:
+            ends = stored.arrays["ends"]
+            names = stored.meta["names"]
+
+        for k in range(0, len(ends), 2):
+            self.graph.add_edge(Edge(names[ends[k]], names[ends[k + 1]]))
 
         print(f'Loaded the graph with |V|={len(self.graph.vertices)} and |E|={len(self.graph.edges)}')
 
@@ -148,15 +187,8 @@ class Solver():
         # swg.minimum_cut_phase()
         # return 0
         cut = self.graph.min_cut()
-        removed_edges = []
-        for e in cut.edges:
-            a = e[0].split(',')
-            b = e[1].split(',')
-
-            for v1 in a:
-                for v2 in b:
-                    if Edge(v1, v2) in self.graph.edges:
-                        removed_edges.append(Edge(v1, v2))        
+        side = set(cut.side)
+        removed_edges = [e for e in self.graph.edges if (e[0] in side) != (e[1] in side)]
         
         assert len(removed_edges) == 3, f'Expected 3 edges, got {len(removed_edges)}'
 
@@ -190,7 +222,6 @@ class Solver():
         return len(visited) * len(unvisited)
 
     def solve2(self):
-        v = set(str(x) for x in range(1, 9))
         w = {}
         w[Edge('1', '2')] = 2
         w[Edge('1', '5')] = 3
@@ -211,9 +242,7 @@ class Solver():
 
         w[Edge('7', '8')] = 3
 
-        e = set(w.keys())
-
-        swg = SWGraph(v, e, w)
+        swg = SWGraph.from_weights(w)
 
         return swg.minimum_cut()
 
@@ -0,0 +1 @@
+"""Shared tooling for running, timing and benchmarking the daily solvers"""
@@ -0,0 +1,129 @@
+"""
+Solves one day against many input files, printing a line per input as soon as it's
+done:
+
+    python -m aoc.batch 9 generated/              # every file in a directory
+    python -m aoc.batch 12 -m inputs.txt -j 4      # a manifest, one path per line
+    python -m aoc.batch 5 a b c --json             # JSON lines instead of columns
+
+Each worker imports the day once and keeps it, along with anything the module
+builds at import time, for every input it's handed. Results come out in the order
+they finish, tagged with their input.
+"""
+from __future__ import annotations
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from timeit import default_timer as timer
+from typing import Iterable, Iterator
+import argparse
+import json
+import os
+import sys
+
+from aoc.cache import AnswerCache
+from aoc.days import DAYS
+from aoc.runner import DayResult, run_day
+
+IGNORED_SUFFIXES = (".sidecar", ".checkpoint", ".tmp")
+
+
+def expand(paths: Iterable[str]) -> Iterator[str]:
+    """Files stay as they are, directories turn into the files in them, sorted"""
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                full = os.path.join(path, name)
+                if os.path.isfile(full) and not name.startswith(".") and not name.endswith(IGNORED_SUFFIXES):
+                    yield os.path.abspath(full)
+        else:
+            yield os.path.abspath(path)
+
+
+def read_manifest(filename: str) -> list[str]:
+    """One path per line, relative to the manifest. Blank lines and # comments are skipped."""
+    base = os.path.dirname(os.path.abspath(filename))
+    with open(filename, "r") as f:
+        lines = [line.split("#", 1)[0].strip() for line in f]
+    return [os.path.join(base, line) for line in lines if line]
+
+
+def warm(number: int):
+    """Runs once in each worker, so the first input doesn't pay for the imports"""
+    day = DAYS[number]
+    day.load()
+    for part in day.parts():
+        if part.path is not None:
+            day.load(part.path)
+
+
+def results(number: int, inputs: list[str], jobs: int | None = None, cache: AnswerCache | None = None) -> Iterator[DayResult]:
+    if jobs == 1:
+        warm(number)
+        for filename in inputs:
+            yield run_day(number, filename, cache)
+        return
+
+    workers = jobs or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=warm, initargs=(number,)) as pool:
+        # Only keep a few inputs queued per worker, so thousands of them don't all sit in memory
+        window = 4 * workers
+        pending: set[Future] = set()
+
+        for filename in inputs:
+            pending.add(pool.submit(run_day, number, filename, cache))
+            if len(pending) >= window:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from (f.result() for f in done)
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from (f.result() for f in done)
+
+
+def format_line(result: DayResult) -> str:
+    if result.error:
+        return f"{result.input}\terror\t{result.error}"
+
+    answers = [str(p.answer) for p in result.phases if p.name.startswith("part")]
+    return "\t".join([result.input] + answers + [f"{result.total():.4f}"])
+
+
+def as_json(result: DayResult) -> str:
+    record: dict = {"input": result.input, "day": result.day, "seconds": result.total()}
+    for p in result.phases:
+        if p.name.startswith("part"):
+            record[p.name] = p.answer
+    if result.error:
+        record["error"] = result.error
+    return json.dumps(record)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m aoc.batch", description="Solve one day against many inputs")
+    parser.add_argument("day", type=int, choices=sorted(DAYS), metavar="day")
+    parser.add_argument("inputs", nargs="*", help="input files, or directories of them")
+    parser.add_argument("-m", "--manifest", action="append", default=[], help="file listing one input path per line")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("-c", "--cache", action="store_true", help="reuse answers for inputs and code that haven't changed")
+    parser.add_argument("--json", action="store_true", help="print JSON lines")
+    args = parser.parse_args(argv)
+
+    paths = list(args.inputs)
+    for manifest in args.manifest:
+        paths.extend(read_manifest(manifest))
+    inputs = list(expand(paths))
+    if not inputs:
+        parser.error("no inputs given")
+
+    cache = AnswerCache() if args.cache else None
+    errors = 0
+    start = timer()
+    for result in results(args.day, inputs, args.jobs, cache):
+        errors += result.error is not None
+        print(as_json(result) if args.json else format_line(result), flush=True)
+
+    print(f"Solved {len(inputs)} inputs for day {args.day} in {timer() - start:.4f} seconds, {errors} failed", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,248 @@
+"""
+Times every day's parts as the input grows, to see which solvers scale badly:
+
+    python -m aoc.bench                       # all days at 1x, 10x and 100x their input
+    python -m aoc.bench -d 10,22 -s 1,2,4,8 -o bench_output.json
+    python -m aoc.bench -g --seed 3          # synthetic inputs instead of the real ones
+    python -m aoc.bench -d 16,21 --memory    # peak memory per part too
+
+Days with records in aoc.records also get the bytes per instance of each. Results
+are written as JSON, so two runs can be compared.
+"""
+from __future__ import annotations
+from dataclasses import dataclass, asdict
+from timeit import default_timer as timer
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import sys
+import tempfile
+
+from aoc import sidecar
+from aoc.days import DAYS, select
+from aoc.generators import GENERATORS, generate
+from aoc.memory import megabytes
+from aoc.records import RecordSize, measure_records
+from aoc.runner import DayResult, run_day, resolve_input
+
+
+def blocks(text: str) -> list[str]:
+    return [b for b in text.strip("\n").split("\n\n") if b.strip()]
+
+
+def renumber(lines: list[str], factor: int) -> list[str]:
+    """Repeats "<Label> <n>: ..." lines, keeping the numbers unique"""
+    out: list[str] = []
+    n = 0
+    for _ in range(factor):
+        for line in lines:
+            n += 1
+            label, rest = line.split(":", 1)
+            out.append(f"{label.split()[0]} {n}:{rest}")
+    return out
+
+
+def repeat_lines(text: str, factor: int) -> str:
+    return "\n".join(text.strip("\n").split("\n") * factor) + "\n"
+
+
+def repeat_blocks(text: str, factor: int) -> str:
+    return "\n\n".join(blocks(text) * factor) + "\n"
+
+
+def scale_cards(text: str, factor: int) -> str:
+    return "\n".join(renumber(text.strip("\n").split("\n"), factor)) + "\n"
+
+
+def scale_almanac(text: str, factor: int) -> str:
+    seeds, *maps = blocks(text)
+    label, numbers = seeds.split(":")
+    return "\n\n".join([f"{label}:{numbers * factor}"] + maps) + "\n"
+
+
+def scale_tokens(text: str, factor: int) -> str:
+    return ",".join([text.strip()] * factor)
+
+
+def scale_ratings(text: str, factor: int) -> str:
+    workflows, ratings = blocks(text)
+    return workflows + "\n\n" + repeat_lines(ratings, factor)
+
+
+def scale_bricks(text: str, factor: int) -> str:
+    """Stacks copies of the snapshot on top of each other"""
+    lines = text.strip("\n").split("\n")
+    height = max(int(c.split(",")[2]) for line in lines for c in line.split("~"))
+    out: list[str] = []
+    for k in range(factor):
+        for line in lines:
+            ends = []
+            for c in line.split("~"):
+                x, y, z = c.split(",")
+                ends.append(f"{x},{y},{int(z) + k * height}")
+            out.append("~".join(ends))
+    return "\n".join(out) + "\n"
+
+
+# Days whose input is a list of independent records can be grown by repeating them.
+# Grids are stacked vertically, which keeps every row the same width.
+SCALERS = {
+    1: repeat_lines,
+    2: scale_cards,
+    3: repeat_lines,
+    4: scale_cards,
+    5: scale_almanac,
+    7: repeat_lines,
+    9: repeat_lines,
+    11: repeat_lines,
+    12: repeat_lines,
+    13: repeat_blocks,
+    14: repeat_lines,
+    15: scale_tokens,
+    16: repeat_lines,
+    17: repeat_lines,
+    19: scale_ratings,
+    22: scale_bricks,
+    24: repeat_lines,
+}
+
+
+@dataclass
+class Sample:
+    day: int
+    scale: int
+    part: str
+    input_bytes: int
+    seconds: float | None  # Best of the repeats, None if it timed out or failed
+    answer: str | None = None
+    error: str | None = None
+    peak_bytes: int | None = None  # Only with --memory
+
+
+def run_isolated(number: int, filename: str, timeout: float | None, memory: bool = False) -> DayResult:
+    """Runs a day in a throwaway process, so a blown-up solver can be killed"""
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        pending = pool.apply_async(run_day, (number, filename, None, memory))
+        try:
+            return pending.get(timeout)
+        except multiprocessing.TimeoutError:
+            pool.terminate()
+            return DayResult(number, filename, error=f"timed out after {timeout} seconds")
+
+
+def scaled_input(number: int, scale: int, input_name: str | None, seed: int) -> str:
+    """The day's real input grown scale times, or a synthetic one when input_name is None"""
+    if input_name is None:
+        return generate(number, GENERATORS[number].size * scale, seed)
+
+    with open(resolve_input(DAYS[number], input_name), "r") as f:
+        return SCALERS[number](f.read(), scale)
+
+
+def bench_day(number: int, scales: list[int], input_name: str | None, repeats: int, timeout: float | None, workdir: str, seed: int = 0, memory: bool = False) -> list[Sample]:
+    if input_name is not None and number not in SCALERS:
+        return [Sample(number, 1, "all", 0, None, error="can't grow this input by repeating it, try --generated")]
+
+    samples: list[Sample] = []
+    for scale in scales:
+        filename = os.path.join(workdir, f"day{number:02}_x{scale}")
+        with open(filename, "w") as f:
+            f.write(scaled_input(number, scale, input_name, seed))
+        size = os.path.getsize(filename)
+
+        best: dict[str, Sample] = {}
+        for _ in range(repeats):
+            result = run_isolated(number, filename, timeout, memory)
+            if result.error:
+                best = {"all": Sample(number, scale, "all", size, None, error=result.error)}
+                break
+
+            for p in result.phases:
+                if p.name not in best or p.seconds < best[p.name].seconds:
+                    peak = p.memory.peak_bytes if p.memory else None
+                    best[p.name] = Sample(number, scale, p.name, size, p.seconds, p.answer, peak_bytes=peak)
+
+        samples.extend(best.values())
+        if "all" in best:
+            break  # Bigger inputs will only be worse
+
+    return samples
+
+
+def growth(samples: list[Sample]) -> dict[tuple[int, str], float]:
+    """The scaling exponent between the smallest and largest input, per day and part"""
+    exponents: dict[tuple[int, str], float] = {}
+    series: dict[tuple[int, str], list[Sample]] = {}
+    for s in samples:
+        if s.seconds is not None and s.part != "import":  # Doesn't depend on the input
+            series.setdefault((s.day, s.part), []).append(s)
+
+    for key, points in series.items():
+        points.sort(key=lambda s: s.scale)
+        first, last = points[0], points[-1]
+        if last.scale > first.scale and first.seconds > 0:
+            exponents[key] = math.log(last.seconds / first.seconds) / math.log(last.scale / first.scale)
+
+    return exponents
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m aoc.bench", description="Time the solvers on growing inputs")
+    parser.add_argument("-d", "--days", help="days to run, e.g. 1-5,9 (default: all)")
+    parser.add_argument("-i", "--input", default="input", help="input file to scale, relative to each day's directory")
+    parser.add_argument("-g", "--generated", action="store_true", help="use synthetic inputs, scaled from the real puzzle size")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the synthetic inputs")
+    parser.add_argument("-s", "--scales", default="1,10,100", help="comma separated input size multipliers")
+    parser.add_argument("-r", "--repeats", type=int, default=1, help="runs per size, the fastest is kept")
+    parser.add_argument("-t", "--timeout", type=float, default=300, help="seconds before a run is abandoned")
+    parser.add_argument("-o", "--output", default="bench_output.json", help="where to write the results")
+    parser.add_argument("--sidecars", action="store_true", help="parse each input once and load the parsed form in later repeats")
+    parser.add_argument("--memory", action="store_true", help="record each part's peak memory as well (slows the solvers down)")
+    args = parser.parse_args(argv)
+
+    if args.sidecars:
+        os.environ[sidecar.ENV] = "1"  # Inherited by the isolated runs
+
+    scales = [int(s) for s in args.scales.split(",")]
+    samples: list[Sample] = []
+    records: list[RecordSize] = []
+    start = timer()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for day in select(args.days):
+            input_name = None if args.generated else args.input
+            day_samples = bench_day(day.number, scales, input_name, args.repeats, args.timeout, workdir, args.seed, args.memory)
+            samples.extend(day_samples)
+            for s in day_samples:
+                timing = f"{s.seconds:.4f}s" if s.seconds is not None else s.error
+                if s.peak_bytes is not None:
+                    timing += f"  {megabytes(s.peak_bytes):.2f} MB peak"
+                print(f"day {s.day:>2} x{s.scale:<4} {s.part:<5} {s.input_bytes:>10} bytes  {timing}", file=sys.stderr)
+
+            for r in measure_records(day.number):
+                records.append(r)
+                layout = "slots" if r.slotted else "__dict__"
+                print(f"day {r.day:>2} {r.name:<12} {r.bytes:>6.0f} bytes per instance ({layout})", file=sys.stderr)
+
+    exponents = growth(samples)
+    with open(args.output, "w") as f:
+        json.dump({
+            "scales": scales,
+            "source": f"generated, seed {args.seed}" if args.generated else args.input,
+            "wall_seconds": timer() - start,
+            "samples": [asdict(s) for s in samples],
+            "exponents": [{"day": d, "part": p, "exponent": e} for (d, p), e in sorted(exponents.items())],
+            "records": [asdict(r) for r in records],
+        }, f, indent=2)
+
+    for (d, p), e in sorted(exponents.items()):
+        flag = "  <-- superlinear" if e > 1.2 else ""
+        print(f"day {d:>2} {p:<5} time ~ n^{e:.2f}{flag}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""
+An on-disk cache of answers, so reruns against unchanged inputs come back at once.
+
+Each answer is filed under a hash of everything that could change it: the input
+file's bytes, the day, the part and its arguments, and the source of the day's
+directory and of the shared aoc modules. Editing any of those simply misses the
+cache, so nothing ever needs clearing by hand. Entries are small JSON files under
+.aoc_cache at the top of the repository, or wherever AOC_CACHE_DIR points.
+"""
+from __future__ import annotations
+from dataclasses import dataclass, asdict
+from functools import cache
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from aoc.days import Day, Part, ROOT
+
+DEFAULT_DIRECTORY = os.path.join(ROOT, ".aoc_cache")
+
+
+@dataclass
+class Entry:
+    day: int
+    part: str
+    answer: str | None
+    seconds: float  # How long it took to work out
+    created: float
+
+
+def file_hash(filename: str) -> str:
+    digest = hashlib.sha256()
+    with open(filename, "rb") as f:
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@cache
+def source_hash(directory: str) -> str:
+    """
+    Covers every Python file in the day's directory, since days import their
+    neighbours, and the shared modules days can import from aoc
+    """
+    files = sorted(glob.glob(os.path.join(directory, "*.py")))
+    files += sorted(
+        f for f in glob.glob(os.path.join(ROOT, "aoc", "**", "*.py"), recursive=True)
+        if not os.path.basename(f).startswith("test_") and os.sep + "generators" + os.sep not in f
+    )
+
+    digest = hashlib.sha256()
+    for f in files:
+        digest.update(os.path.relpath(f, ROOT).encode())
+        with open(f, "rb") as source:
+            digest.update(hashlib.sha256(source.read()).digest())
+    return digest.hexdigest()
+
+
+class AnswerCache:
+    def __init__(self, directory: str | None = None):
+        self.directory = directory or os.environ.get("AOC_CACHE_DIR") or DEFAULT_DIRECTORY
+
+    def key(self, day: Day, name: str, part: Part, filename: str, input_hash: str | None = None) -> str:
+        fields = [
+            input_hash or file_hash(filename),
+            str(day.number),
+            name,
+            repr(part),
+            repr(part.arguments(filename)),
+            source_hash(day.directory),
+        ]
+        return hashlib.sha256("\0".join(fields).encode()).hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Entry | None:
+        try:
+            with open(self.path(key), "r") as f:
+                return Entry(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None  # Missing, or left half written by a killed run
+
+    def put(self, key: str, day: int, part: str, answer: str | None, seconds: float):
+        """Writes to a scratch file and renames it, so parallel runs never see a partial entry"""
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        entry = Entry(day, part, answer, seconds, time.time())
+        fd, scratch = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(asdict(entry), f)
+        os.replace(scratch, path)
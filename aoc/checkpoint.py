@@ -0,0 +1,111 @@
+"""
+Saves the state of a long search next to its input every so often, so that a
+run that gets interrupted can carry on from there instead of starting over:
+
+    checkpoint = Checkpoint(filename, "hallpaths-v1")
+    state = checkpoint.resume()          # None unless resuming and one was saved
+    ...
+    while stack:
+        if checkpoint.due():
+            checkpoint.save((stack, best))
+        ...
+    checkpoint.done()                    # Finished, so nothing to resume
+
+Checkpoints are off unless AOC_CHECKPOINTS is set: "1" saves them and "resume"
+picks up from them too (the runner sets it with --checkpoints and --resume), so
+by default nothing is written next to the inputs. They're saved at most every
+AOC_CHECKPOINT_SECONDS, a minute by default.
+
+The state is pickled, so keep it to plain ints, tuples, lists, sets and dicts
+rather than a day's own classes, which live in modules with different names
+depending on how the day was run. Like a sidecar, a checkpoint is only used if
+it was made from a file of the same size and modification time, and with the
+same tag, so bump the tag's version when the saved state changes.
+"""
+from __future__ import annotations
+from timeit import default_timer as timer
+from typing import Any
+import os
+import pickle
+import tempfile
+
+ENV = "AOC_CHECKPOINTS"
+SECONDS_ENV = "AOC_CHECKPOINT_SECONDS"
+DEFAULT_SECONDS = 60.0
+
+
+def enabled() -> bool:
+    return os.environ.get(ENV, "") not in ("", "0")
+
+
+def resuming() -> bool:
+    return os.environ.get(ENV, "") == "resume"
+
+
+def path(filename: str, tag: str) -> str:
+    return f"{filename}.{tag}.checkpoint"
+
+
+def _stamp(filename: str) -> dict[str, int]:
+    stat = os.stat(filename)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+class Checkpoint:
+    def __init__(self, filename: str, tag: str, every: float | None = None, save: bool | None = None, resume: bool | None = None):
+        """save and resume default to what AOC_CHECKPOINTS says, every to AOC_CHECKPOINT_SECONDS"""
+        self.filename = filename
+        self.tag = tag
+        self.path = path(filename, tag)
+        self.every = float(os.environ.get(SECONDS_ENV, DEFAULT_SECONDS)) if every is None else every
+        self.saving = enabled() if save is None else save
+        self.resuming = resuming() if resume is None else resume
+        self.last = timer()
+        self.saves = 0
+
+    def resume(self) -> Any | None:
+        """The saved state, or None if not resuming or there isn't an up to date one"""
+        if not self.resuming:
+            return None
+
+        # A checkpoint cut short or from somewhere else can fail to unpickle in all sorts of ways
+        try:
+            with open(self.path, "rb") as f:
+                saved = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError, AttributeError, ImportError, IndexError, TypeError):
+            return None
+
+        if not isinstance(saved, dict) or "state" not in saved:
+            return None
+        if saved.get("tag") != self.tag or saved.get("input") != _stamp(self.filename):
+            return None
+        return saved["state"]
+
+    def due(self) -> bool:
+        """Whether it's time to save again. Cheap enough to ask on every step."""
+        return self.saving and timer() - self.last >= self.every
+
+    def save(self, state: Any):
+        if not self.saving:
+            return
+
+        # Written to one side and moved into place, so being interrupted mid-save leaves the last one intact
+        fd, scratch = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump({"tag": self.tag, "input": _stamp(self.filename), "state": state}, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(scratch, self.path)
+        except BaseException:
+            os.unlink(scratch)
+            raise
+
+        self.saves += 1
+        self.last = timer()
+
+    def done(self):
+        """The search finished, so there's nothing left to resume"""
+        if self.saving or self.resuming:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,187 @@
+"""
+Fits how each part's time and peak memory grow with the size of its input, and
+checks the fit against what the solver is expected to do:
+
+    python -m aoc.complexity                  # every day with an expectation
+    python -m aoc.complexity -d 22 --start 200 --steps 5
+    python -m aoc.complexity -d 10 --no-memory -o complexity.json
+
+Inputs come from aoc.generators, at a geometric series of sizes starting from
+--start and growing --ratio times each step. Sizes are the generator's knob
+(bricks, grid cells, lines...), so an exponent of 2 means the part is quadratic
+in those. The exponent is the least squares slope of log time against log size,
+leaving out points too fast to time reliably.
+
+A part is flagged when its exponent is more than --slack above its EXPECTATIONS
+entry. Most entries describe the solver as it is, bad scaling included, so the
+check catches things getting worse rather than asking them to get better.
+"""
+from __future__ import annotations
+from dataclasses import dataclass, asdict
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+
+from aoc.days import select
+from aoc.generators import GENERATORS, generate
+from aoc.memory import megabytes
+from aoc.regress import Measurement, measure_day
+
+
+@dataclass(frozen=True)
+class Expectation:
+    time: float  # Exponent of the input size
+    memory: float | None = None
+    note: str = ""
+
+
+# Keyed by day and phase
+EXPECTATIONS: dict[tuple[int, str], Expectation] = {
+    (10, "parse"): Expectation(1, 1),
+    (10, "part1"): Expectation(1, 1, "walks the loop once"),
+    (10, "part2"): Expectation(1, 1, "areas are joined with a union-find"),
+    (22, "parse"): Expectation(1, 1),
+    (22, "part1"): Expectation(2, 1, "Stack.settled checks every brick against every brick below it"),
+    (22, "part2"): Expectation(2, 1, "settling, then copies the support lists for every brick it removes"),
+}
+
+
+@dataclass
+class Fit:
+    day: int
+    part: str
+    sizes: list[int]
+    seconds: list[float]
+    peak_bytes: list[int | None]
+    time: float | None  # Fitted exponents, None when there weren't enough usable points
+    memory: float | None
+    expected: Expectation | None
+
+    def worse(self, slack: float) -> list[str]:
+        """Which of time and memory grow faster than expected"""
+        if self.expected is None:
+            return []
+        found = []
+        if self.time is not None and self.time > self.expected.time + slack:
+            found.append("time")
+        if self.memory is not None and self.expected.memory is not None and self.memory > self.expected.memory + slack:
+            found.append("memory")
+        return found
+
+
+def exponent(sizes: list[int], values: list[float]) -> float | None:
+    """Least squares slope of log(value) against log(size)"""
+    points = [(math.log(n), math.log(v)) for n, v in zip(sizes, values) if v > 0]
+    if len(points) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if spread == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def geometric(start: int, ratio: float, steps: int) -> list[int]:
+    sizes: list[int] = []
+    for k in range(steps):
+        n = round(start * ratio ** k)
+        if not sizes or n > sizes[-1]:
+            sizes.append(n)
+    return sizes
+
+
+def fit(number: int, series: dict[int, list[Measurement]], floor: float) -> list[Fit]:
+    """One fit per phase, from the measurements taken at each size"""
+    by_part: dict[str, list[tuple[int, Measurement]]] = {}
+    for size, measurements in sorted(series.items()):
+        for m in measurements:
+            by_part.setdefault(m.part, []).append((size, m))
+
+    fits: list[Fit] = []
+    for part, points in by_part.items():
+        sizes = [n for n, _ in points]
+        seconds = [m.seconds for _, m in points]
+        peaks = [m.peak_bytes for _, m in points]
+
+        # Very fast phases are mostly timer noise and interpreter overhead
+        timed = [(n, s) for n, s in zip(sizes, seconds) if s >= floor]
+        measured = [(n, p) for n, p in zip(sizes, peaks) if p]
+        fits.append(Fit(
+            number, part, sizes, seconds, peaks,
+            exponent([n for n, _ in timed], [s for _, s in timed]),
+            exponent([n for n, _ in measured], [p for _, p in measured]),
+            EXPECTATIONS.get((number, part)),
+        ))
+
+    return fits
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m aoc.complexity", description="Fit how the solvers scale and check it against expectations")
+    parser.add_argument("-d", "--days", help="days to fit, e.g. 10,22 (default: the days with expectations)")
+    parser.add_argument("--start", type=int, help="smallest input size (default: an eighth of the real puzzle's)")
+    parser.add_argument("--ratio", type=float, default=2, help="how much bigger each size is than the last")
+    parser.add_argument("--steps", type=int, default=4, help="how many sizes to run")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the synthetic inputs")
+    parser.add_argument("-r", "--repeats", type=int, default=3, help="runs per size, the median is fitted")
+    parser.add_argument("-t", "--timeout", type=float, default=300, help="seconds before a run is abandoned")
+    parser.add_argument("--floor", type=float, default=0.002, help="timings below this many seconds are left out of the fit")
+    parser.add_argument("--slack", type=float, default=0.3, help="how far above its expected exponent a part can be")
+    parser.add_argument("--no-memory", action="store_true", help="only fit times")
+    parser.add_argument("-o", "--output", help="write the samples and fits here as JSON")
+    args = parser.parse_args(argv)
+
+    numbers = [d.number for d in select(args.days)] if args.days else sorted({day for day, _ in EXPECTATIONS})
+
+    fits: list[Fit] = []
+    failed = 0
+    with tempfile.TemporaryDirectory() as workdir:
+        for number in numbers:
+            start = args.start or max(1, GENERATORS[number].size // 8)
+            series: dict[int, list[Measurement]] = {}
+            for size in geometric(start, args.ratio, args.steps):
+                filename = os.path.join(workdir, f"day{number:02}_n{size}")
+                with open(filename, "w") as f:
+                    f.write(generate(number, size, args.seed))
+
+                measured = measure_day(number, filename, args.repeats, args.timeout, not args.no_memory)
+                if isinstance(measured, str):
+                    print(f"day {number:>2} n={size} failed: {measured}", file=sys.stderr)
+                    failed += 1
+                    break  # Bigger inputs will only be worse
+                series[size] = measured
+                print(f"day {number:>2} n={size:<8} " + "  ".join(f"{m.part} {m.seconds:.4f}s" for m in measured), file=sys.stderr)
+
+            fits.extend(fit(number, series, args.floor))
+
+    worse = 0
+    for f in fits:
+        time = "-" if f.time is None else f"n^{f.time:.2f}"
+        memory = "-" if f.memory is None else f"n^{f.memory:.2f}"
+        line = f"day {f.day:>2} {f.part:<5} time {time:<7} memory {memory:<7}"
+        if f.expected is not None:
+            expected_memory = "" if f.expected.memory is None else f", memory n^{f.expected.memory:g}"
+            line += f" expected time n^{f.expected.time:g}{expected_memory}"
+            found = f.worse(args.slack)
+            if found:
+                worse += 1
+                line += f"  WORSE ({', '.join(found)})"
+        if f.memory is not None and f.peak_bytes[-1]:
+            line += f"  [{megabytes(f.peak_bytes[-1]):.2f} MB at n={f.sizes[-1]}]"
+        print(line)
+
+    if args.output:
+        with open(args.output, "w") as out:
+            json.dump({"seed": args.seed, "floor": args.floor, "fits": [asdict(f) for f in fits]}, out, indent=2)
+
+    print(f"{worse} parts scale worse than expected, {failed} days failed to run")
+    return 1 if worse or failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
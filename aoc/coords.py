@@ -0,0 +1,108 @@
+"""
+Packs (row, col) coordinates into one int each, so hot loops step around a grid
+with integer adds instead of building and hashing tuples.
+
+The grid is padded with a one cell border all round, and a cell's index is
+(row + 1) * stride + (col + 1), where the stride is the width plus two. N, E, S
+and W are the index offsets for one step in each direction. Any step from a cell
+in the grid lands either on another cell or on the border, never off the end of
+the board, so the only bounds check a loop needs is whether it landed on the
+OUTSIDE sentinel:
+
+    layout, board = Layout.read(filename)     # or Layout(width, height) and layout.pad(lines)
+    for step in layout.NEIGHBORS4:
+        if board[here + step] != OUTSIDE:
+            ...
+
+Since indexes are small and dense, a bytearray(layout.size) works as a visited set.
+Days that only scan or edit the board in place, like day 14 tilting its rocks,
+work on the padded board directly, with rows and columns as ranges of indices.
+
+read() fills the board straight from the memory mapped input file, one row at a
+time, without building a list of line strings. The border means a board can't
+just be the file's own bytes, so each row is still copied once, into place.
+"""
+from __future__ import annotations
+from typing import Iterator, Sequence
+
+from aoc.loader import Input
+
+OUTSIDE = 0  # Never appears in a puzzle input
+
+
+class Layout:
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.stride = width + 2
+        self.size = self.stride * (height + 2)
+
+        self.N = -self.stride
+        self.S = self.stride
+        self.E = 1
+        self.W = -1
+        self.NEIGHBORS4 = (self.N, self.E, self.S, self.W)
+        self.NEIGHBORS8 = (self.N, self.N + 1, self.E, self.S + 1, self.S, self.S - 1, self.W, self.N - 1)
+
+    @classmethod
+    def from_lines(cls, lines: Sequence[str]) -> Layout:
+        return cls(len(lines[0]), len(lines))
+
+    @classmethod
+    def read(cls, filename: str, fill: int = OUTSIDE) -> tuple[Layout, bytearray]:
+        """The layout of a grid file and its padded board, skipping blank lines"""
+        with Input(filename) as inp:
+            lines = [line for line in inp.lines() if len(line) > 0]
+            try:
+                layout = cls(len(lines[0]), len(lines))
+                return layout, layout.pad(lines, fill)
+            finally:
+                # Views of the map have to go before it can be closed
+                for line in lines:
+                    line.release()
+
+    def pack(self, row: int, col: int) -> int:
+        return (row + 1) * self.stride + col + 1
+
+    def unpack(self, index: int) -> tuple[int, int]:
+        row, col = divmod(index, self.stride)
+        return row - 1, col - 1
+
+    def row(self, index: int) -> int:
+        return index // self.stride - 1
+
+    def col(self, index: int) -> int:
+        return index % self.stride - 1
+
+    def inside(self, index: int) -> bool:
+        """For the occasional check without a padded board at hand"""
+        row, col = divmod(index, self.stride)
+        return 0 < row <= self.height and 0 < col <= self.width
+
+    def on_edge(self, index: int) -> bool:
+        row, col = self.unpack(index)
+        return row == 0 or col == 0 or row == self.height - 1 or col == self.width - 1
+
+    def cells(self) -> Iterator[int]:
+        """Every cell index, row by row"""
+        for r in range(1, self.height + 1):
+            start = r * self.stride + 1
+            yield from range(start, start + self.width)
+
+    def rows(self, board: bytearray) -> list[bytearray]:
+        """The cells of each row of a padded board, without the border"""
+        return [board[start:start + self.width] for start in range(self.stride + 1, self.stride * (self.height + 1), self.stride)]
+
+    def pad(self, lines: Sequence[str | bytes], fill: int = OUTSIDE) -> bytearray:
+        """The lines as one flat board, with the border set to fill"""
+        if len(lines) != self.height:
+            raise ValueError(f"expected {self.height} rows, got {len(lines)}")
+        board = bytearray([fill]) * self.size
+        for r, line in enumerate(lines):
+            cells = line.encode() if isinstance(line, str) else line
+            # A short or long row would shift every cell after it
+            if len(cells) != self.width:
+                raise ValueError(f"row {r} is {len(cells)} wide, expected {self.width}")
+            start = self.pack(r, 0)
+            board[start:start + self.width] = cells
+        return board
@@ -0,0 +1,124 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from types import ModuleType
+from typing import Any
+import importlib.util
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+@dataclass(frozen=True)
+class Part:
+    """How to get one answer out of a day's solver"""
+
+    method: str = "solve1"
+    args: tuple = ()
+    tiny_args: tuple | None = None  # Some days use different parameters for the example input
+    init: dict[str, Any] | None = None  # Part needs its own solver, built with these keyword args
+    path: str | None = None  # Part lives in a different file than the rest of the day
+
+    def arguments(self, filename: str) -> tuple:
+        if self.tiny_args is not None and os.path.basename(filename).startswith("tiny"):
+            return self.tiny_args
+        return self.args
+
+
+@dataclass(frozen=True)
+class Day:
+    """Everything the tooling needs to know to run one day"""
+
+    number: int
+    path: str  # Relative to the repository root
+    solver: str = "Solver"
+    part1: Part = field(default_factory=Part)
+    part2: Part | None = field(default_factory=lambda: Part("solve2"))
+
+    @property
+    def directory(self) -> str:
+        return os.path.join(ROOT, os.path.dirname(self.path))
+
+    def load(self, path: str | None = None) -> ModuleType:
+        """Imports the solver file under a unique module name"""
+        path = path or self.path
+        name = f"day{self.number:02}_{os.path.splitext(os.path.basename(path))[0]}"
+        if name in sys.modules:
+            return sys.modules[name]
+
+        spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, path))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[name]
+            raise
+        return module
+
+    def parts(self) -> list[Part]:
+        return [p for p in (self.part1, self.part2) if p is not None]
+
+    def make_solver(self, filename: str, part: Part | None = None) -> Any:
+        path = part.path if part is not None and part.path else self.path
+        cls = getattr(self.load(path), self.solver)
+        kwargs = part.init if part is not None and part.init else {}
+        return cls(filename, **kwargs)
+
+    def needs_own_solver(self, part: Part) -> bool:
+        return part.init is not None or part.path is not None
+
+    def solve(self, solver: Any, part: Part, filename: str) -> Any:
+        return getattr(solver, part.method)(*part.arguments(filename))
+
+
+# Mirrors the __main__ block of each day
+DAYS: dict[int, Day] = {
+    d.number: d
+    for d in [
+        Day(1, "01-01/solve.py", part2=None),
+        Day(2, "02-01/solve.py"),
+        Day(3, "03/solve.py"),
+        Day(4, "04/solve.py", solver="CardTable", part1=Part("score"), part2=Part("score2")),
+        Day(5, "05/solve.py", solver="Almanac"),
+        Day(6, "06/solve.py"),
+        Day(7, "07/solve.py"),
+        Day(8, "08/solve.py", part2=Part("solve1", path="08/solve2.py")),
+        Day(9, "09/solve.py"),
+        Day(10, "10/solve.py"),
+        Day(11, "11/solve.py", part2=Part("solve1", init={"expansion": 1000000})),
+        Day(12, "12/new.py"),
+        Day(13, "13/solve.py"),
+        Day(14, "14/solve.py"),
+        Day(15, "15/solve.py"),
+        Day(16, "16/solve.py"),
+        Day(17, "17/solve.py", part1=Part("newSolve1", (1, 3)), part2=Part("newSolve1", (4, 10))),
+        Day(18, "18/faces.py"),
+        Day(19, "19/solve.py"),
+        Day(20, "20/solve.py", part2=Part("solve2", ("rx", False), init={})),
+        Day(21, "21/solve.py", part1=Part("solve1", (64,), tiny_args=(6,)), part2=None),  # solve3 only explores, it always steps 5000 times
+        Day(22, "22/solve.py"),
+        Day(23, "23/solve.py"),
+        Day(24, "24/solve.py", part1=Part("solve1", (200000000000000, 400000000000000), tiny_args=(7, 27))),
+        Day(25, "25/solve.py", part2=None),
+    ]
+}
+
+
+def select(spec: str | None) -> list[Day]:
+    """Parses a day selection like "1-5,9,12" into a list of days"""
+    if not spec:
+        return list(DAYS.values())
+
+    numbers: list[int] = []
+    for chunk in spec.split(","):
+        if "-" in chunk:
+            first, last = chunk.split("-")
+            numbers.extend(range(int(first), int(last) + 1))
+        else:
+            numbers.append(int(chunk))
+
+    return [DAYS[n] for n in numbers]
@@ -0,0 +1,179 @@
+"""
+Runs the slow reference implementations some days keep beside their fast paths
+on many random inputs, checks they give the same answers, and reports how much
+faster the fast path is:
+
+    python -m aoc.differential                # every pair, 20 inputs each
+    python -m aoc.differential -d 17 -n 100
+    python -m aoc.differential -d 5 --seed 7 -n 1   # replay one failing input
+
+Inputs come from the day's generator, kept small enough for the reference to
+finish. Each side gets a freshly parsed solver, and only the solving is timed.
+Input k of a pair is the same on every run, so a reported seed can be replayed.
+"""
+from __future__ import annotations
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+from timeit import default_timer as timer
+from typing import Any, Callable
+import argparse
+import io
+import os
+import random
+import sys
+import tempfile
+
+from aoc.days import DAYS, select
+from aoc.generators import grids, numeric
+
+ALMANAC_UNIVERSE = 1000  # Numbers the day 5 maps cover when every one of them is looked up
+
+
+@dataclass(frozen=True)
+class Pair:
+    day: int
+    name: str
+    make: Callable[[random.Random], str]  # A random input the reference can finish
+    reference: Callable[[Any], Any]  # Both take a parsed solver and return something comparable
+    fast: Callable[[Any], Any]
+    known: str = ""  # Why the two are known to disagree, if they do. Reported, but not a failure.
+
+
+def combined_old(almanac: Any) -> Callable[[int], int]:
+    """Looks numbers up in the almanac's maps folded together with combineOffsetsOld"""
+    om = almanac_module().OffsetMap([])
+    offsets: list[tuple[int, int, int]] = []
+    for m in almanac.maps:
+        offsets = om.combineOffsetsOld(offsets, om.toOffsets(m))
+
+    def lookup(n: int) -> int:
+        for first, last, offset in offsets:
+            if first <= n <= last:
+                return n + offset
+        return n
+
+    return lookup
+
+
+def almanac_module() -> Any:
+    return DAYS[5].load()
+
+
+def every_location(lookup: Callable[[int], int]) -> list[int]:
+    return [lookup(n) for n in range(ALMANAC_UNIVERSE + 10)]
+
+
+PAIRS: list[Pair] = [
+    Pair(5, "solve2", lambda rng: numeric.almanac(rng, 6, 100_000),
+         lambda a: a.old_solve2(), lambda a: a.solve2()),
+    Pair(5, "combineOffsets", lambda rng: numeric.almanac(rng, 6, ALMANAC_UNIVERSE),
+         lambda a: every_location(a.lookup), lambda a: every_location(almanac_module().OffsetMap(a.maps).lookup)),
+    Pair(5, "combineOffsetsOld", lambda rng: numeric.almanac(rng, 6, ALMANAC_UNIVERSE),
+         lambda a: every_location(a.lookup), lambda a: every_location(combined_old(a)),
+         known="adds up overlapping offsets without sending the range through the first map, so it's only right by luck"),
+    Pair(17, "newSolve1", lambda rng: grids.heat_loss(rng, 12 * 12),
+         lambda s: s.solve1(), lambda s: s.newSolve1(1, 3)),
+    Pair(21, "solve2", lambda rng: grids.garden(rng, 21 * 21),
+         lambda s: s.solve1(64), lambda s: s.solve2(64)),
+]
+
+
+@dataclass
+class Outcome:
+    day: int
+    name: str
+    known: str = ""
+    cases: int = 0
+    mismatches: list[tuple[int, str, str]] = field(default_factory=list)  # Seed, reference answer, fast answer
+    reference_seconds: float = 0.0
+    fast_seconds: float = 0.0
+    error: str | None = None
+
+    def speedup(self) -> float | None:
+        return self.reference_seconds / self.fast_seconds if self.fast_seconds > 0 else None
+
+    def failed(self) -> bool:
+        return self.error is not None or bool(self.mismatches and not self.known)
+
+
+def shorten(value: Any, limit: int = 60) -> str:
+    text = repr(value)
+    return text if len(text) <= limit else text[:limit - 3] + "..."
+
+
+def check(pair: Pair, seeds: range, workdir: str) -> Outcome:
+    outcome = Outcome(pair.day, pair.name, pair.known)
+    day = DAYS[pair.day]
+    for seed in seeds:
+        filename = os.path.join(workdir, f"day{pair.day:02}_{pair.name}_{seed}")
+        with open(filename, "w") as f:
+            f.write(pair.make(random.Random(f"{pair.day}:{pair.name}:{seed}")))
+
+        try:
+            with redirect_stdout(io.StringIO()):
+                solver = day.make_solver(filename)
+                start = timer()
+                expected = pair.reference(solver)
+                outcome.reference_seconds += timer() - start
+
+                solver = day.make_solver(filename)  # In case the reference changed it
+                start = timer()
+                answer = pair.fast(solver)
+                outcome.fast_seconds += timer() - start
+        except Exception as e:
+            outcome.error = f"seed {seed}: {e.__class__.__name__}: {e}"
+            break
+
+        outcome.cases += 1
+        if answer != expected:
+            outcome.mismatches.append((seed, shorten(expected), shorten(answer)))
+
+    return outcome
+
+
+def format_outcome(o: Outcome) -> str:
+    line = f"day {o.day:>2} {o.name:<18} {o.cases:>4} inputs  "
+    if o.error:
+        return line + f"ERROR {o.error}"
+
+    if not o.mismatches:
+        status = "agree"
+    elif o.known:
+        status = f"{len(o.mismatches)} differ, known: {o.known}"
+    else:
+        status = f"{len(o.mismatches)} DIFFER"
+
+    speedup = o.speedup()
+    timing = f"reference {o.reference_seconds:.4f}s, fast {o.fast_seconds:.4f}s"
+    if speedup is not None:
+        timing += f", {speedup:.1f}x"
+    return line + f"{timing:<48} {status}"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m aoc.differential", description="Check fast paths against their reference implementations")
+    parser.add_argument("-d", "--days", help="days to check, e.g. 5,17 (default: every day with a pair)")
+    parser.add_argument("-n", "--cases", type=int, default=20, help="random inputs per pair")
+    parser.add_argument("--seed", type=int, default=0, help="first input to use")
+    args = parser.parse_args(argv)
+
+    numbers = {d.number for d in select(args.days)}
+    outcomes: list[Outcome] = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for pair in PAIRS:
+            if pair.day in numbers:
+                outcome = check(pair, range(args.seed, args.seed + args.cases), workdir)
+                outcomes.append(outcome)
+                print(format_outcome(outcome))
+                if outcome.failed():
+                    for seed, expected, answer in outcome.mismatches[:5]:
+                        print(f"    seed {seed}: reference {expected}, fast {answer}")
+
+    failed = [o for o in outcomes if o.failed()]
+    agree = [o for o in outcomes if not o.error and not o.mismatches]
+    print(f"{len(agree)} of {len(outcomes)} pairs agree, {len(failed)} failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""
+Reproducible synthetic inputs for every day, in the format its solver parses.
+
+Each generator takes a seeded random.Random and a size knob. Sizes are roughly
+the number of records (lines, cards, bricks...) or grid cells, so the input
+grows linearly with them. DEFAULT sizes are about as big as the real puzzles.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Callable
+import random
+
+from aoc.generators import geometry, graphs, grids, numeric, text
+
+
+@dataclass(frozen=True)
+class Generator:
+    make: Callable[[random.Random, int], str]
+    size: int  # About the size of the real puzzle input
+
+
+GENERATORS: dict[int, Generator] = {
+    1: Generator(text.calibration, 1000),
+    2: Generator(text.cube_games, 100),
+    3: Generator(grids.schematic, 140 * 140),
+    4: Generator(numeric.scratchcards, 200),
+    5: Generator(numeric.almanac, 40),
+    6: Generator(numeric.races, 4),
+    7: Generator(text.camel_cards, 1000),
+    8: Generator(text.desert_map, 6600),
+    9: Generator(numeric.histories, 200),
+    10: Generator(grids.pipe_maze, 140 * 140),
+    11: Generator(grids.galaxies, 140 * 140),
+    12: Generator(text.springs, 1000),
+    13: Generator(grids.mirrors, 100),
+    14: Generator(grids.rocks, 100 * 100),
+    15: Generator(text.lens_steps, 4000),
+    16: Generator(grids.contraption, 110 * 110),
+    17: Generator(grids.heat_loss, 141 * 141),
+    18: Generator(geometry.dig_plan, 400),
+    19: Generator(text.workflows, 550),
+    20: Generator(text.pulse_modules, 4),
+    21: Generator(grids.garden, 131 * 131),
+    22: Generator(geometry.bricks, 1400),
+    23: Generator(grids.trails, 141 * 141),
+    24: Generator(geometry.hailstones, 300),
+    25: Generator(graphs.wiring, 1500),
+}
+
+
+def generate(day: int, size: int | None = None, seed: int = 0) -> str:
+    """The text of a synthetic input for the day. The same seed and size always give the same text."""
+    generator = GENERATORS[day]
+    return generator.make(random.Random(f"{day}:{seed}"), generator.size if size is None else size)
@@ -0,0 +1,32 @@
+"""
+Writes a synthetic input to stdout or a file:
+
+    python -m aoc.generators 10 --size 40000 --seed 3 -o 10/big_input
+"""
+from __future__ import annotations
+import argparse
+import sys
+
+from aoc.generators import GENERATORS, generate
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m aoc.generators", description="Generate a synthetic puzzle input")
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    parser.add_argument("-n", "--size", type=int, default=None, help="size knob (default: about the real puzzle size)")
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", default=None, help="file to write (default: stdout)")
+    args = parser.parse_args(argv)
+
+    content = generate(args.day, args.size, args.seed)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(content)
+    else:
+        sys.stdout.write(content)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
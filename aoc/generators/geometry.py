@@ -0,0 +1,90 @@
+"""Generators for the days whose input is points and shapes in space"""
+from __future__ import annotations
+from itertools import accumulate
+from math import isqrt
+import random
+
+from aoc.generators.shapes import polyomino, outline
+
+HEX_DIRECTIONS = {"R": "0", "D": "1", "L": "2", "U": "3"}
+
+
+def _stretch(rng: random.Random, count: int, low: int, high: int) -> list[int]:
+    """Strictly increasing coordinates with random gaps"""
+    return [0] + list(accumulate(rng.randrange(low, high) for _ in range(count)))
+
+
+def dig_plan(rng: random.Random, size: int) -> str:
+    """
+    Day 18: both the plain plan and the one hidden in the colors are simple loops.
+    They're the same random outline stretched two different ways, which keeps them
+    from crossing themselves while giving them the same turns.
+    """
+    n = max(2, isqrt(size))
+    corners = outline(polyomino(rng, n, n, 0.5))
+    small = (_stretch(rng, n + 1, 1, 10), _stretch(rng, n + 1, 1, 10))
+    # The hidden lengths have to fit in five hex digits
+    high = max(2, 0xFFFFF // (n + 1))
+    large = (_stretch(rng, n + 1, 1 + high // 10, high), _stretch(rng, n + 1, 1 + high // 10, high))
+
+    lines: list[str] = []
+    for i in range(len(corners)):
+        (r1, c1), (r2, c2) = corners[i], corners[(i + 1) % len(corners)]
+        if r1 == r2:
+            direction = "R" if c2 > c1 else "L"
+            plain, hidden = abs(small[1][c2] - small[1][c1]), abs(large[1][c2] - large[1][c1])
+        else:
+            direction = "D" if r2 > r1 else "U"
+            plain, hidden = abs(small[0][r2] - small[0][r1]), abs(large[0][r2] - large[0][r1])
+        lines.append(f"{direction} {plain} (#{hidden:05x}{HEX_DIRECTIONS[direction]})")
+
+    return "\n".join(lines) + "\n"
+
+
+def bricks(rng: random.Random, size: int, footprint: int = 10) -> str:
+    """Day 22: size bricks falling onto a footprint x footprint floor, none overlapping"""
+    top = max(10, size // 2)
+    occupied: set[tuple[int, int, int]] = set()
+    lines: list[str] = []
+
+    while len(lines) < size:
+        length = rng.randrange(1, 5)
+        axis = rng.randrange(3)
+        start = [rng.randrange(footprint), rng.randrange(footprint), rng.randrange(1, top)]
+        end = list(start)
+        end[axis] += length - 1
+        if axis < 2 and end[axis] >= footprint:
+            continue
+
+        cells = set()
+        for k in range(length):
+            cell = list(start)
+            cell[axis] += k
+            cells.add(tuple(cell))
+        if cells & occupied:
+            continue
+
+        occupied |= cells
+        lines.append(f"{start[0]},{start[1]},{start[2]}~{end[0]},{end[1]},{end[2]}")
+
+    return "\n".join(lines) + "\n"
+
+
+def hailstones(rng: random.Random, size: int) -> str:
+    """
+    Day 24: hailstones that a rock thrown from a random spot hits at distinct
+    whole-number times, so part 2 always has an answer
+    """
+    rock = [rng.randrange(200000000000000, 400000000000000) for _ in range(3)]
+    rock_velocity = [rng.randrange(-300, 301) for _ in range(3)]
+    times = rng.sample(range(10**10, 10**12), max(1, size))
+
+    lines: list[str] = []
+    for t in times:
+        velocity = [rng.randrange(-500, 501) for _ in range(3)]
+        while velocity[0] == 0:  # The solver divides by the x velocity
+            velocity[0] = rng.randrange(-500, 501)
+        position = [p + t * (rv - v) for p, rv, v in zip(rock, rock_velocity, velocity)]
+        lines.append(f"{', '.join(map(str, position))} @ {', '.join(map(str, velocity))}")
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,49 @@
+"""Generators for the days whose input is a graph"""
+from __future__ import annotations
+from string import ascii_lowercase
+import random
+
+from aoc.generators.text import names
+
+
+def _component(rng: random.Random, vertices: list[str], extra: float) -> set[tuple[str, str]]:
+    """
+    Links every vertex to the next two around a ring, which takes cutting at least
+    four edges to split, then adds random chords on top
+    """
+    n = len(vertices)
+    edges: set[tuple[str, str]] = set()
+
+    def link(a: str, b: str):
+        if a != b:
+            edges.add((a, b) if a < b else (b, a))
+
+    for i in range(n):
+        link(vertices[i], vertices[(i + 1) % n])
+        link(vertices[i], vertices[(i + 2) % n])
+    for _ in range(int(n * extra)):
+        link(rng.choice(vertices), rng.choice(vertices))
+
+    return edges
+
+
+def wiring(rng: random.Random, size: int) -> str:
+    """Day 25: two well connected halves of size components joined by exactly three wires"""
+    count = min(max(10, size), 17000)
+    vertices = names(rng, count, ascii_lowercase, 3)
+    split = rng.randrange(count // 3, 2 * count // 3)
+    left, right = vertices[:split], vertices[split:]
+
+    edges = _component(rng, left, 1.0) | _component(rng, right, 1.0)
+    for a, b in zip(rng.sample(left, 3), rng.sample(right, 3)):
+        edges.add((a, b) if a < b else (b, a))
+
+    listed: dict[str, list[str]] = {}
+    for a, b in edges:
+        if rng.random() < 0.5:
+            a, b = b, a
+        listed.setdefault(a, []).append(b)
+
+    lines = [f"{src}: {' '.join(dsts)}" for src, dsts in listed.items()]
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,208 @@
+"""Generators for the days whose input is a character grid"""
+from __future__ import annotations
+from math import isqrt
+import random
+
+from aoc.generators.shapes import polyomino, outline
+
+
+def side(size: int, smallest: int = 5) -> int:
+    """Grid sizes are given in cells, so the input grows linearly with them"""
+    return max(smallest, isqrt(size))
+
+
+def render(rows: list[list[str]], newline: bool = True) -> str:
+    text = "\n".join("".join(row) for row in rows)
+    return text + "\n" if newline else text
+
+
+def schematic(rng: random.Random, size: int) -> str:
+    """Day 3: part numbers scattered among symbols"""
+    n = side(size)
+    rows: list[list[str]] = []
+    for _ in range(n):
+        row: list[str] = []
+        while len(row) < n:
+            roll = rng.random()
+            if roll < 0.12:
+                row.extend(str(rng.randrange(1, 1000)))
+                row.append(".")
+            elif roll < 0.17:
+                row.append(rng.choice("*#+$/@=%&-"))
+            else:
+                row.append(".")
+        rows.append(row[:n])
+    return render(rows)
+
+
+PIPES = {
+    ((-1, 0), (1, 0)): "|", ((0, -1), (0, 1)): "-",
+    ((-1, 0), (0, 1)): "L", ((-1, 0), (0, -1)): "J",
+    ((1, 0), (0, -1)): "7", ((1, 0), (0, 1)): "F",
+}
+
+
+def pipe(a: tuple[int, int], b: tuple[int, int]) -> str:
+    return PIPES.get((a, b)) or PIPES[(b, a)]
+
+
+def pipe_maze(rng: random.Random, size: int) -> str:
+    """Day 10: a single loop of pipe, with S on a straight piece, among junk pipes"""
+    n = side(size, 7)
+    corners = outline(polyomino(rng, n - 1, n - 1, 0.45))
+
+    loop: list[tuple[int, int]] = []
+    for i in range(len(corners)):
+        (r1, c1), (r2, c2) = corners[i], corners[(i + 1) % len(corners)]
+        dr, dc = (r2 > r1) - (r2 < r1), (c2 > c1) - (c2 < c1)
+        while (r1, c1) != (r2, c2):
+            loop.append((r1, c1))
+            r1, c1 = r1 + dr, c1 + dc
+
+    rows = [[rng.choice("|-LJ7F..") for _ in range(n)] for _ in range(n)]
+    straight: list[tuple[int, int]] = []
+    for i in range(len(loop)):
+        here = loop[i]
+        before, after = loop[i - 1], loop[(i + 1) % len(loop)]
+        a = (before[0] - here[0], before[1] - here[1])
+        b = (after[0] - here[0], after[1] - here[1])
+        rows[here[0]][here[1]] = pipe(a, b)
+        if rows[here[0]][here[1]] in "|-":
+            straight.append(here)
+
+    start = rng.choice(straight)
+    on_loop = set(loop)
+    rows[start[0]][start[1]] = "S"
+    # Junk next to S mustn't look like it connects to it
+    for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+        r, c = start[0] + dr, start[1] + dc
+        if 0 <= r < n and 0 <= c < n and (r, c) not in on_loop:
+            rows[r][c] = "."
+
+    return render(rows)
+
+
+def galaxies(rng: random.Random, size: int) -> str:
+    """Day 11: sparse galaxies, with some rows and columns left empty"""
+    n = side(size)
+    empty_rows = {r for r in range(n) if rng.random() < 0.1}
+    empty_cols = {c for c in range(n) if rng.random() < 0.1}
+    rows = [
+        ["#" if r not in empty_rows and c not in empty_cols and rng.random() < 0.02 else "." for c in range(n)]
+        for r in range(n)
+    ]
+    rows[0][0] = "#"
+    return render(rows)
+
+
+def _mirror_pattern(rng: random.Random) -> list[list[str]]:
+    """
+    A pattern with a perfect vertical reflection and a horizontal one that is off by
+    exactly one cell, built by mirroring random rows and columns and then smudging a
+    cell in a column the vertical reflection doesn't reach.
+    """
+    while True:
+        height, width = rng.randrange(5, 18), rng.randrange(5, 18)
+        v_line = rng.randrange(width - 1)
+        if 2 * (v_line + 1) != width:
+            break
+
+    h_line = rng.randrange(height - 1)
+    grid = [[rng.choice("#.") for _ in range(width)] for _ in range(height)]
+
+    h_reach = min(h_line + 1, height - h_line - 1)
+    for k in range(h_reach):
+        grid[h_line + 1 + k] = list(grid[h_line - k])
+
+    v_reach = min(v_line + 1, width - v_line - 1)
+    for row in grid:
+        for k in range(v_reach):
+            row[v_line + 1 + k] = row[v_line - k]
+
+    free_cols = [c for c in range(width) if c < v_line + 1 - v_reach or c > v_line + v_reach]
+    smudge_rows = range(h_line + 1 - h_reach, h_line + 1 + h_reach)
+    r, c = rng.choice(smudge_rows), rng.choice(free_cols)
+    grid[r][c] = "#" if grid[r][c] == "." else "."
+
+    if rng.random() < 0.5:
+        grid = [list(col) for col in zip(*grid)]
+
+    return grid
+
+
+def mirrors(rng: random.Random, size: int) -> str:
+    """Day 13: blocks that each have a reflection and a smudged reflection"""
+    return "\n\n".join(render(_mirror_pattern(rng), newline=False) for _ in range(max(1, size))) + "\n"
+
+
+def rocks(rng: random.Random, size: int) -> str:
+    """Day 14: round rocks and cube rocks on a platform"""
+    n = side(size)
+    return render([[rng.choices("O#.", weights=[2, 1, 7])[0] for _ in range(n)] for _ in range(n)])
+
+
+def contraption(rng: random.Random, size: int) -> str:
+    """Day 16: mirrors and splitters"""
+    n = side(size)
+    return render([[rng.choices(".|-/\\", weights=[90, 2, 2, 3, 3])[0] for _ in range(n)] for _ in range(n)])
+
+
+def heat_loss(rng: random.Random, size: int) -> str:
+    """Day 17: a map of single digit costs"""
+    n = side(size)
+    return render([[str(rng.randrange(1, 10)) for _ in range(n)] for _ in range(n)])
+
+
+def garden(rng: random.Random, size: int) -> str:
+    """Day 21: rocks around a start in the middle, with its row, column and the border clear"""
+    n = side(size) | 1
+    middle = n // 2
+    rows = [
+        ["." if r in (0, middle, n - 1) or c in (0, middle, n - 1) or rng.random() > 0.12 else "#" for c in range(n)]
+        for r in range(n)
+    ]
+    rows[middle][middle] = "S"
+    return render(rows)
+
+
+def trails(rng: random.Random, size: int) -> str:
+    """
+    Day 23: like the real puzzle, a square lattice of junctions joined by hallways,
+    entered from the top left and left from the bottom right. The slopes next to
+    each junction point right or down. Part 2 is exponential in the number of
+    junctions, which grows with the square of the side.
+    """
+    n = side(size)
+    junctions = max(2, n // 23)
+    gap = max(2, n // junctions)
+
+    rows_at = [2] + [0] * (junctions - 1)
+    cols_at = [1] + [0] * (junctions - 1)
+    for k in range(1, junctions):
+        rows_at[k] = rows_at[k - 1] + rng.randrange(2, 2 * gap)
+        cols_at[k] = cols_at[k - 1] + rng.randrange(2, 2 * gap)
+
+    height, width = rows_at[-1] + 3, cols_at[-1] + 2
+    grid = [["#"] * width for _ in range(height)]
+
+    for c in range(width):
+        for r in rows_at:
+            if cols_at[0] <= c <= cols_at[-1]:
+                grid[r][c] = "."
+    for r in range(height):
+        for c in cols_at:
+            if rows_at[0] <= r <= rows_at[-1]:
+                grid[r][c] = "."
+    for r in range(rows_at[0]):
+        grid[r][cols_at[0]] = "."
+    for r in range(rows_at[-1], height):
+        grid[r][cols_at[-1]] = "."
+
+    for r in rows_at:
+        for c in cols_at:
+            for dr, dc, slope in [(-1, 0, "v"), (1, 0, "v"), (0, -1, ">"), (0, 1, ">")]:
+                if grid[r + dr][c + dc] == "." and 0 < r + dr < height - 1:
+                    grid[r + dr][c + dc] = slope
+
+    # The solver finds the exit from the length of a last line without a newline
+    return render(grid, newline=False)
@@ -0,0 +1,75 @@
+"""Generators for the days whose input is mostly numbers"""
+from __future__ import annotations
+import random
+
+
+def scratchcards(rng: random.Random, size: int) -> str:
+    """Day 4: cards with 10 winning numbers and 25 numbers you have"""
+    lines: list[str] = []
+    for card in range(1, size + 1):
+        winning = rng.sample(range(1, 100), 10)
+        have = rng.sample(range(1, 100), 25)
+        lines.append(f"Card {card:>3}: {' '.join(f'{n:>2}' for n in winning)} | {' '.join(f'{n:>2}' for n in have)}")
+    return "\n".join(lines) + "\n"
+
+
+ALMANAC_CHAIN = ["seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location"]
+
+
+def almanac(rng: random.Random, size: int, universe: int = 2**32) -> str:
+    """
+    Day 5: seed ranges and seven maps of size ranges each. Like the real puzzle,
+    every map shuffles consecutive chunks of the numbers, so it's a bijection.
+    """
+    pairs: list[str] = []
+    for _ in range(10):
+        start = rng.randrange(universe)
+        pairs.append(f"{start} {rng.randrange(1, max(2, (universe - start) // 10))}")
+
+    blocks = [f"seeds: {' '.join(pairs)}"]
+    chunks = max(1, min(size, universe))
+    for src, dst in zip(ALMANAC_CHAIN, ALMANAC_CHAIN[1:]):
+        cuts = sorted(rng.sample(range(1, universe), chunks - 1)) if chunks > 1 else []
+        bounds = [0] + cuts + [universe]
+        sources = [(bounds[i], bounds[i + 1] - bounds[i]) for i in range(chunks)]
+        order = list(range(chunks))
+        rng.shuffle(order)
+
+        ranges: list[str] = []
+        dest = 0
+        for i in order:
+            start, length = sources[i]
+            ranges.append(f"{dest} {start} {length}")
+            dest += length
+        rng.shuffle(ranges)
+        blocks.append(f"{src}-to-{dst} map:\n" + "\n".join(ranges))
+
+    return "\n\n".join(blocks) + "\n"
+
+
+def races(rng: random.Random, size: int) -> str:
+    """
+    Day 6: size races. Part 2 reads all the times as one number and counts
+    through it, so anything past a handful of races is only useful for part 1.
+    """
+    times: list[int] = []
+    records: list[int] = []
+    for _ in range(max(1, size)):
+        t = rng.randrange(7, 100)
+        best = (t // 2) * (t - t // 2)
+        times.append(t)
+        records.append(rng.randrange(0, best))
+    return (
+        "Time:     " + " ".join(f"{t:>4}" for t in times) + "\n"
+        + "Distance: " + " ".join(f"{d:>4}" for d in records) + "\n"
+    )
+
+
+def histories(rng: random.Random, size: int, length: int = 21) -> str:
+    """Day 9: each line is a polynomial of degree at most 5, sampled at 0, 1, 2..."""
+    lines: list[str] = []
+    for _ in range(size):
+        coefficients = [rng.randrange(-9, 10) for _ in range(rng.randrange(1, 7))]
+        values = [sum(c * x**k for k, c in enumerate(coefficients)) for x in range(length)]
+        lines.append(" ".join(str(v) for v in values))
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,76 @@
+"""Random shapes that several input formats are built from"""
+from __future__ import annotations
+import random
+
+type Cell = tuple[int, int]
+
+# Clockwise around the 8 neighbors, starting north
+RING = [(-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1)]
+
+
+def _addable(region: set[Cell], cell: Cell) -> bool:
+    """
+    True if adding the cell keeps the region connected and free of holes and
+    corner-only contacts, which is exactly when its outline stays one simple loop.
+    That's the case when the region's cells form a single run around the cell's
+    ring of neighbors, and that run includes an edge neighbor.
+    """
+    inside = [(cell[0] + dr, cell[1] + dc) in region for dr, dc in RING]
+    runs = sum(1 for i in range(8) if inside[i] and not inside[i - 1])
+    touches = inside[0] or inside[2] or inside[4] or inside[6]
+    return touches and (runs == 1 or all(inside))
+
+
+def polyomino(rng: random.Random, rows: int, cols: int, fill: float = 0.5) -> set[Cell]:
+    """A random hole-free region of a rows x cols grid whose outline is a simple loop"""
+    start = (rng.randrange(rows), rng.randrange(cols))
+    region = {start}
+    target = max(1, int(rows * cols * fill))
+    frontier = [start]
+
+    attempts = 0
+    while len(region) < target and frontier and attempts < 50 * target:
+        attempts += 1
+        r, c = frontier[rng.randrange(len(frontier))]
+        dr, dc = rng.choice(RING[::2])
+        cell = (r + dr, c + dc)
+        if not (0 <= cell[0] < rows and 0 <= cell[1] < cols) or cell in region:
+            continue
+        if _addable(region, cell):
+            region.add(cell)
+            frontier.append(cell)
+
+    return region
+
+
+def outline(region: set[Cell]) -> list[Cell]:
+    """
+    The loop of grid corners around a region, clockwise, as a list of
+    corners where the direction changes. Corner (r, c) is the top left of cell (r, c).
+    """
+    following: dict[Cell, Cell] = {}
+    for (r, c) in region:
+        if (r - 1, c) not in region:
+            following[(r, c)] = (r, c + 1)
+        if (r, c + 1) not in region:
+            following[(r, c + 1)] = (r + 1, c + 1)
+        if (r + 1, c) not in region:
+            following[(r + 1, c + 1)] = (r + 1, c)
+        if (r, c - 1) not in region:
+            following[(r + 1, c)] = (r, c)
+
+    # The top left corner of the topmost cell is always a turn
+    start = min(region)
+    loop = [start]
+    current = following[start]
+    while current != start:
+        loop.append(current)
+        current = following[current]
+
+    corners: list[Cell] = []
+    for i in range(len(loop)):
+        before, here, after = loop[i - 1], loop[i], loop[(i + 1) % len(loop)]
+        if (here[0] - before[0], here[1] - before[1]) != (after[0] - here[0], after[1] - here[1]):
+            corners.append(here)
+
+    return corners
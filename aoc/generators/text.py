@@ -0,0 +1,197 @@
+"""Generators for the days whose input is lines of words and symbols"""
+from __future__ import annotations
+from string import ascii_lowercase, ascii_uppercase
+import random
+
+DIGIT_WORDS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def names(rng: random.Random, count: int, letters: str = ascii_lowercase, length: int = 2, avoid: set[str] | None = None) -> list[str]:
+    """count distinct random names"""
+    avoid = avoid or set()
+    capacity = len(letters) ** length - len(avoid)
+    assert count <= capacity, f"Can't make {count} distinct names of length {length}"
+
+    found: set[str] = set()
+    result: list[str] = []
+    while len(result) < count:
+        name = "".join(rng.choice(letters) for _ in range(length))
+        if name not in found and name not in avoid:
+            found.add(name)
+            result.append(name)
+    return result
+
+
+def calibration(rng: random.Random, size: int) -> str:
+    """Day 1: letters with digits and spelled out digits mixed in, at least one digit per line"""
+    lines: list[str] = []
+    for _ in range(size):
+        pieces = [str(rng.randrange(1, 10))]
+        for _ in range(rng.randrange(1, 8)):
+            roll = rng.random()
+            if roll < 0.3:
+                pieces.append(str(rng.randrange(1, 10)))
+            elif roll < 0.6:
+                pieces.append(rng.choice(DIGIT_WORDS))
+            else:
+                pieces.append("".join(rng.choice(ascii_lowercase) for _ in range(rng.randrange(1, 5))))
+        rng.shuffle(pieces)
+        lines.append("".join(pieces))
+    return "\n".join(lines) + "\n"
+
+
+def cube_games(rng: random.Random, size: int) -> str:
+    """Day 2: games of a few draws each"""
+    lines: list[str] = []
+    for game in range(1, size + 1):
+        draws: list[str] = []
+        for _ in range(rng.randrange(1, 7)):
+            colors = rng.sample(["red", "green", "blue"], rng.randrange(1, 4))
+            draws.append(", ".join(f"{rng.randrange(1, 21)} {c}" for c in colors))
+        lines.append(f"Game {game}: {'; '.join(draws)}")
+    return "\n".join(lines) + "\n"
+
+
+def camel_cards(rng: random.Random, size: int) -> str:
+    """Day 7: hands of five cards and their bids"""
+    return "".join(
+        "".join(rng.choice("23456789TJQKA") for _ in range(5)) + f" {rng.randrange(1, 1001)}\n"
+        for _ in range(size)
+    )
+
+
+def desert_map(rng: random.Random, size: int) -> str:
+    """
+    Day 8: a node table where AAA reaches ZZZ, and every ghost's walk from its
+    ..A node reaches its ..Z node after exactly one lap of its cycle, like the real
+    puzzle. Each cycle's length is the instruction length times a small prime, and
+    every step on it takes the branch the instruction at that point says to.
+    Node names are three letters, so size is capped at a few thousand nodes.
+    """
+    primes = [43, 47, 53, 59, 61, 67]
+    instructions = max(1, min(size, 13000) // sum(primes))
+    pattern = "".join(rng.choice("LR") for _ in range(instructions))
+
+    # Leaving A and Z out of the other names keeps them from looking like starts and ends
+    letters = ascii_uppercase[1:-1]
+    middle = names(rng, instructions * sum(primes), letters, 3)
+    ends = [("AAA", "ZZZ")] + [(p + "A", p + "Z") for p in names(rng, len(primes) - 1, letters, 2)]
+
+    nodes: dict[str, tuple[str, str]] = {}
+    taken = 0
+    for (start, end), prime in zip(ends, primes):
+        length = instructions * prime
+        cycle = middle[taken:taken + length - 1] + [end]
+        taken += length - 1
+
+        def link(node: str, step: int, to: str):
+            wrong = rng.choice(cycle)
+            nodes[node] = (to, wrong) if pattern[step % instructions] == "L" else (wrong, to)
+
+        link(start, 0, cycle[0])
+        for p in range(length):
+            link(cycle[p], p + 1, cycle[(p + 1) % length])
+
+    lines = [f"{n} = ({left}, {right})" for n, (left, right) in nodes.items()]
+    rng.shuffle(lines)
+    return pattern + "\n\n" + "\n".join(lines) + "\n"
+
+
+def springs(rng: random.Random, size: int) -> str:
+    """Day 12: rows of springs with some conditions unknown, each with at least one arrangement"""
+    lines: list[str] = []
+    for _ in range(size):
+        length = rng.randrange(5, 21)
+        row = ["#" if rng.random() < 0.5 else "." for _ in range(length)]
+        groups = [len(g) for g in "".join(row).split(".") if g]
+        if not groups:
+            row[rng.randrange(length)] = "#"
+            groups = [len(g) for g in "".join(row).split(".") if g]
+        masked = "".join("?" if rng.random() < 0.4 else c for c in row)
+        lines.append(f"{masked} {','.join(str(g) for g in groups)}")
+    return "\n".join(lines) + "\n"
+
+
+def lens_steps(rng: random.Random, size: int) -> str:
+    """Day 15: comma separated steps. The solver doesn't expect a trailing newline."""
+    labels = ["".join(rng.choice(ascii_lowercase) for _ in range(rng.randrange(2, 7))) for _ in range(max(1, size // 4))]
+    steps = [
+        f"{rng.choice(labels)}={rng.randrange(1, 10)}" if rng.random() < 0.6 else f"{rng.choice(labels)}-"
+        for _ in range(size)
+    ]
+    return ",".join(steps)
+
+
+def workflows(rng: random.Random, size: int) -> str:
+    """Day 19: a tree of workflows starting from "in", and size parts"""
+    flows = max(1, size)
+    remaining = names(rng, flows - 1, ascii_lowercase, 3, {"in"})
+    queue = ["in"]
+    rules: dict[str, list[str]] = {}
+
+    def rule(target: str) -> str:
+        return f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randrange(1, 4001)}:{target}"
+
+    while queue:
+        name = queue.pop(0)
+        targets: list[str] = []
+        for _ in range(rng.randrange(2, 6)):
+            if remaining and rng.random() < 0.7:
+                targets.append(remaining.pop(0))
+                queue.append(targets[-1])
+            else:
+                targets.append(rng.choice("AR"))
+        rules[name] = [rule(t) for t in targets[:-1]] + [targets[-1]]
+
+        # Keep the tree growing until every workflow is in it
+        if not queue and remaining:
+            rules[name].insert(0, rule(remaining[0]))
+            queue.append(remaining.pop(0))
+
+    lines = [f"{name}{{{','.join(r)}}}" for name, r in rules.items()]
+    rng.shuffle(lines)
+    ratings = [
+        "{" + ",".join(f"{c}={rng.randrange(1, 4001)}" for c in "xmas") + "}"
+        for _ in range(max(1, size))
+    ]
+    return "\n".join(lines) + "\n\n" + "\n".join(ratings) + "\n"
+
+
+# Day 20's second part watches these four conjunctions
+WATCHED = ["mp", "qt", "qb", "ng"]
+
+
+def pulse_modules(rng: random.Random, size: int, bits: int = 12) -> str:
+    """
+    Day 20: like the real puzzle, the broadcaster feeds size binary counters of
+    flip-flops. Each counter's conjunction fires when it reaches a random period,
+    and their inverters all feed one conjunction in front of rx.
+    """
+    chains = max(1, size)
+    inverters = (WATCHED + names(rng, max(0, chains - 4), ascii_lowercase, 3, set(WATCHED)))[:chains]
+    taken = set(inverters) | {"rx"}
+    pool = names(rng, chains * (bits + 1) + 1, ascii_lowercase, 2 if chains * (bits + 1) + 1 < 600 else 3, taken)
+    final = pool.pop()
+
+    lines: list[str] = []
+    heads: list[str] = []
+    for inverter in inverters:
+        flops = [pool.pop() for _ in range(bits)]
+        hub = pool.pop()
+        period = rng.randrange(2 ** (bits - 1), 2**bits) | 1
+        heads.append(flops[0])
+
+        for i, flop in enumerate(flops):
+            outputs = [flops[i + 1]] if i + 1 < bits else []
+            if period >> i & 1:
+                outputs.append(hub)
+            lines.append(f"%{flop} -> {', '.join(outputs)}")
+
+        hub_outputs = [f for i, f in enumerate(flops) if not period >> i & 1] + [flops[0], inverter]
+        lines.append(f"&{hub} -> {', '.join(dict.fromkeys(hub_outputs))}")
+        lines.append(f"&{inverter} -> {final}")
+
+    lines.append(f"&{final} -> rx")
+    lines.append(f"broadcaster -> {', '.join(heads)}")
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
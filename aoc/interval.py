@@ -0,0 +1,281 @@
+"""
+Integer interval algebra, for the days that work on ranges of numbers instead
+of the numbers themselves. Intervals are half-open like range(): (start, stop)
+holds start up to but not including stop, so sizes are stop - start and
+touching intervals don't overlap.
+
+    xs = Interval(0, 5)
+    xs.overlaps(Interval(4, 9))         # True
+
+    allowed = IntervalSet([(1, 4001)])
+    allowed &= IntervalSet([(1, 1351)])  # x < 1351
+    allowed.size()                       # 1350
+
+    shifts = IntervalMap([(98, 100, -48), (50, 98, 2)])
+    shifts.get(99, 0)                    # -48
+
+IntervalSet and IntervalMap keep their intervals sorted in parallel lists of
+starts and stops, so lookups are a bisect, and union, intersection, difference
+and restrict walk both sides once, in O(n + m).
+"""
+from __future__ import annotations
+from bisect import bisect_right
+from typing import Generic, Iterable, Iterator, NamedTuple, TypeVar
+
+V = TypeVar("V")
+
+
+class Interval(NamedTuple):
+    start: int
+    stop: int
+
+    def size(self) -> int:
+        return max(0, self.stop - self.start)
+
+    def contains(self, x: int) -> bool:
+        return self.start <= x < self.stop
+
+    def overlaps(self, other: tuple[int, int]) -> bool:
+        # Indexing is quicker than the named fields, and this sits in the inner loop of day 22
+        return self[0] < other[1] and other[0] < self[1]
+
+    def intersection(self, other: tuple[int, int]) -> Interval | None:
+        start, stop = max(self.start, other[0]), min(self.stop, other[1])
+        return Interval(start, stop) if start < stop else None
+
+
+class IntervalSet:
+    """A set of integers, stored as sorted intervals that neither overlap nor touch"""
+
+    def __init__(self, intervals: Iterable[tuple[int, int]] = ()):
+        self.starts: list[int] = []
+        self.stops: list[int] = []
+        for start, stop in sorted(i for i in intervals if i[0] < i[1]):
+            self._append(start, stop)
+
+    @classmethod
+    def _from_sorted(cls, starts: list[int], stops: list[int]) -> IntervalSet:
+        s = cls()
+        s.starts, s.stops = starts, stops
+        return s
+
+    def _append(self, start: int, stop: int):
+        """Adds an interval that starts at or after every one already here"""
+        if self.stops and start <= self.stops[-1]:
+            self.stops[-1] = max(self.stops[-1], stop)
+        else:
+            self.starts.append(start)
+            self.stops.append(stop)
+
+    def __iter__(self) -> Iterator[Interval]:
+        return map(Interval, self.starts, self.stops)
+
+    def __len__(self) -> int:
+        """How many intervals, see size() for how many numbers"""
+        return len(self.starts)
+
+    def __bool__(self) -> bool:
+        return bool(self.starts)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, IntervalSet) and self.starts == other.starts and self.stops == other.stops
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(zip(self.starts, self.stops))})"
+
+    def __contains__(self, x: int) -> bool:
+        i = bisect_right(self.starts, x) - 1
+        return i >= 0 and x < self.stops[i]
+
+    def size(self) -> int:
+        return sum(self.stops) - sum(self.starts)
+
+    def covers(self, start: int, stop: int) -> bool:
+        """Whether all of start up to stop is in one of the intervals"""
+        i = bisect_right(self.starts, start) - 1
+        return i >= 0 and stop <= self.stops[i]
+
+    def add(self, start: int, stop: int):
+        """Adds one interval, merging it with any it overlaps or touches"""
+        if start >= stop:
+            return
+        lo = bisect_right(self.stops, start - 1)  # First interval that ends at or after start
+        hi = bisect_right(self.starts, stop)  # First interval that starts after stop
+        if lo < hi:
+            start = min(start, self.starts[lo])
+            stop = max(stop, self.stops[hi - 1])
+        self.starts[lo:hi] = [start]
+        self.stops[lo:hi] = [stop]
+
+    def union(self, other: IntervalSet) -> IntervalSet:
+        result = IntervalSet()
+        i = j = 0
+        while i < len(self.starts) or j < len(other.starts):
+            if j == len(other.starts) or (i < len(self.starts) and self.starts[i] <= other.starts[j]):
+                result._append(self.starts[i], self.stops[i])
+                i += 1
+            else:
+                result._append(other.starts[j], other.stops[j])
+                j += 1
+        return result
+
+    def intersection(self, other: IntervalSet) -> IntervalSet:
+        starts: list[int] = []
+        stops: list[int] = []
+        i = j = 0
+        while i < len(self.starts) and j < len(other.starts):
+            start = max(self.starts[i], other.starts[j])
+            stop = min(self.stops[i], other.stops[j])
+            if start < stop:
+                starts.append(start)
+                stops.append(stop)
+            if self.stops[i] < other.stops[j]:
+                i += 1
+            else:
+                j += 1
+        return IntervalSet._from_sorted(starts, stops)
+
+    def difference(self, other: IntervalSet) -> IntervalSet:
+        starts: list[int] = []
+        stops: list[int] = []
+        j = 0
+        for start, stop in zip(self.starts, self.stops):
+            while j < len(other.starts) and other.stops[j] <= start:
+                j += 1
+            k = j
+            while k < len(other.starts) and other.starts[k] < stop:
+                if other.starts[k] > start:
+                    starts.append(start)
+                    stops.append(other.starts[k])
+                start = max(start, other.stops[k])
+                k += 1
+            if start < stop:
+                starts.append(start)
+                stops.append(stop)
+        return IntervalSet._from_sorted(starts, stops)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+
+class IntervalMap(Generic[V]):
+    """A value for each of a set of disjoint intervals, sorted by where they start"""
+
+    def __init__(self, entries: Iterable[tuple[int, int, V]] = ()):
+        self.starts: list[int] = []
+        self.stops: list[int] = []
+        self.values: list[V] = []
+        for start, stop, value in sorted((e for e in entries if e[0] < e[1]), key=lambda e: e[0]):
+            if self.stops and start < self.stops[-1]:
+                raise ValueError(f"[{start}, {stop}) overlaps [{self.starts[-1]}, {self.stops[-1]})")
+            self.starts.append(start)
+            self.stops.append(stop)
+            self.values.append(value)
+
+    def _append(self, start: int, stop: int, value: V):
+        """Adds an interval past the last one, joining them if they touch and have the same value"""
+        if self.stops and self.stops[-1] == start and self.values[-1] == value:
+            self.stops[-1] = stop
+        else:
+            self.starts.append(start)
+            self.stops.append(stop)
+            self.values.append(value)
+
+    def __iter__(self) -> Iterator[tuple[int, int, V]]:
+        return zip(self.starts, self.stops, self.values)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __bool__(self) -> bool:
+        return bool(self.starts)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, IntervalMap) and list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return f"IntervalMap({list(self)})"
+
+    def find(self, x: int) -> int:
+        """Index of the interval holding x, or -1"""
+        i = bisect_right(self.starts, x) - 1
+        return i if i >= 0 and x < self.stops[i] else -1
+
+    def get(self, x: int, default: V | None = None) -> V | None:
+        i = bisect_right(self.starts, x) - 1
+        return self.values[i] if i >= 0 and x < self.stops[i] else default
+
+    def domain(self) -> IntervalSet:
+        domain = IntervalSet()
+        for start, stop in zip(self.starts, self.stops):
+            domain._append(start, stop)
+        return domain
+
+    def filled(self, value: V, start: int, stop: int | None = None) -> IntervalMap[V]:
+        """A copy with the gaps between start and stop (the end of the last interval by default) given value"""
+        stop = max(self.stops[-1] if self.stops else start, start) if stop is None else stop
+        result: IntervalMap[V] = IntervalMap()
+        current = start
+        for s, e, v in self:
+            if current < s:
+                result._append(current, min(s, stop), value)
+            result._append(s, e, v)
+            current = max(current, e)
+        if current < stop:
+            result._append(current, stop, value)
+        return result
+
+    def restrict(self, keep: IntervalSet) -> IntervalMap[V]:
+        """Just the parts that are in keep"""
+        result: IntervalMap[V] = IntervalMap()
+        i = j = 0
+        while i < len(self.starts) and j < len(keep.starts):
+            start = max(self.starts[i], keep.starts[j])
+            stop = min(self.stops[i], keep.stops[j])
+            if start < stop:
+                result.starts.append(start)
+                result.stops.append(stop)
+                result.values.append(self.values[i])
+            if self.stops[i] < keep.stops[j]:
+                i += 1
+            else:
+                j += 1
+        return result
+
+
+def compose_shifts(first: IntervalMap[int], then: IntervalMap[int]) -> IntervalMap[int]:
+    """
+    Maps whose values are amounts to add, like day 5's almanac: x goes to
+    x + first.get(x, 0), and numbers a map doesn't cover stay where they are.
+    Returns the single map that does first and then then. A shifted interval can
+    land anywhere in then, so each one is placed with a bisect, which makes this
+    O((n + m + k) log m) for k intervals in the result.
+    """
+    if not first:
+        return IntervalMap(then)
+    if not then:
+        return IntervalMap(first)
+
+    # Numbers first leaves alone can still be moved by then
+    low = min(first.starts[0], then.starts[0])
+    high = max(first.stops[-1], then.stops[-1])
+
+    result: IntervalMap[int] = IntervalMap()
+    for start, stop, shift in first.filled(0, low, high):
+        image, end = start + shift, stop + shift
+        k = max(0, bisect_right(then.starts, image) - 1)
+        while image < end:
+            if k < len(then.starts) and then.starts[k] <= image < then.stops[k]:
+                piece = min(end, then.stops[k])
+                result._append(image - shift, piece - shift, shift + then.values[k])
+                k += 1
+            else:
+                # A gap in then, up to its next interval
+                while k < len(then.starts) and then.stops[k] <= image:
+                    k += 1
+                piece = min(end, then.starts[k]) if k < len(then.starts) else end
+                result._append(image - shift, piece - shift, shift)
+            image = piece
+
+    return result
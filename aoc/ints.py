@@ -0,0 +1,170 @@
+"""
+Pulls every integer out of an input in bulk, for the days whose inputs are mostly
+numbers.
+
+    nums = read_ints(filename)
+    for row in nums.lines():      # array('q') per non-blank line
+        ...
+    for block in nums.blocks():   # the lines between blank lines
+        ...
+
+A minus sign counts when it's right before a digit, so "-2" is negative but the
+"-" in "seed-to-soil" is skipped. With NumPy around, a big buffer is scanned
+in a handful of vectorized passes. Without it, everything that isn't part of a
+number is blanked out with bytes.translate, and each line is split and converted
+in C.
+"""
+from __future__ import annotations
+from array import array
+from typing import Iterator
+
+import re
+
+INT = re.compile(rb"-?\d+")
+
+DIGITS = b"0123456789"
+SPACE = ord(" ")
+NEWLINE = ord("\n")
+MINUS = ord("-")
+
+NUMPY_THRESHOLD = 1 << 20  # Below this many bytes, importing NumPy costs more than it saves
+
+# Keeps digits, minus signs and newlines, and turns everything else into spaces
+NUMERIC = bytes(c if c in DIGITS + b"-\n" else SPACE for c in range(256))
+
+
+def ints(data: bytes | str) -> array:
+    """All the integers in data, in order"""
+    if isinstance(data, str):
+        data = data.encode()
+    return array("q", map(int, INT.findall(data)))
+
+
+class Ints:
+    """
+    The integers of a whole input, in one flat array. The ones on line i are
+    values[line_starts[i]:line_starts[i + 1]], and block j is lines
+    block_starts[j] up to block_starts[j + 1]. Blank lines only end blocks,
+    they aren't counted as lines.
+    """
+
+    def __init__(self, values: array, line_starts: array, block_starts: array):
+        self.values = values
+        self.line_starts = line_starts
+        self.block_starts = block_starts
+
+    def __len__(self) -> int:
+        return len(self.line_starts) - 1
+
+    def line(self, i: int) -> array:
+        return self.values[self.line_starts[i]:self.line_starts[i + 1]]
+
+    def lines(self) -> Iterator[array]:
+        for i in range(len(self)):
+            yield self.line(i)
+
+    def blocks(self) -> Iterator[list[array]]:
+        for j in range(len(self.block_starts) - 1):
+            yield [self.line(i) for i in range(self.block_starts[j], self.block_starts[j + 1])]
+
+    def numpy(self):
+        """A zero-copy NumPy view of all the values. Needs NumPy."""
+        import numpy as np
+        return np.frombuffer(self.values, dtype=np.int64)
+
+
+def _scan_python(data: bytes) -> Ints:
+    values: list[int] = []
+    line_starts = [0]
+    block_starts = [0]
+
+    for original, numeric in zip(data.split(b"\n"), data.translate(NUMERIC).split(b"\n")):
+        if not original.strip():
+            if len(line_starts) - 1 > block_starts[-1]:
+                block_starts.append(len(line_starts) - 1)
+            continue
+
+        try:
+            values.extend(map(int, numeric.split()))
+        except ValueError:
+            # A minus sign that isn't part of a number
+            del values[line_starts[-1]:]
+            values.extend(map(int, INT.findall(original)))
+        line_starts.append(len(values))
+
+    if len(line_starts) - 1 > block_starts[-1]:
+        block_starts.append(len(line_starts) - 1)
+
+    return Ints(array("q", values), array("q", line_starts), array("q", block_starts))
+
+
+def _scan_numpy(data: bytes) -> Ints | None:
+    """None if the input has something the vectorized scan can't split, like 1-2"""
+    import numpy as np
+
+    raw = np.frombuffer(data, dtype=np.uint8)
+    numeric = np.frombuffer(NUMERIC, dtype=np.uint8)[raw]
+    is_digit = (numeric >= ord("0")) & (numeric <= ord("9"))
+
+    # A minus sign is only kept right before a digit, and can't follow one
+    minus = numeric == MINUS
+    before_digit = np.zeros_like(minus)
+    before_digit[:-1] = is_digit[1:]
+    after_digit = np.zeros_like(minus)
+    after_digit[1:] = is_digit[:-1]
+    if (minus & before_digit & after_digit).any():
+        return None
+    numeric[minus & ~before_digit] = SPACE
+
+    in_number = is_digit | (numeric == MINUS)
+    starts = in_number.copy()
+    starts[1:] &= ~in_number[:-1]
+
+    # Lines start after every newline, but a final newline doesn't start another one
+    heads = np.concatenate(([0], np.flatnonzero(raw == NEWLINE) + 1))
+    heads = heads[heads < len(raw)]
+    if not len(heads):
+        return Ints(array("q"), array("q", [0]), array("q", [0]))
+
+    visible = (raw != SPACE) & (raw != NEWLINE) & (raw != ord("\t")) & (raw != ord("\r"))
+    blank = ~np.logical_or.reduceat(visible, heads)
+    per_line = np.add.reduceat(starts, heads, dtype=np.int64)[~blank]
+
+    values = np.fromstring(numeric.tobytes(), dtype=np.int64, sep=" ") if starts.any() else np.zeros(0, np.int64)
+    if len(values) != int(starts.sum()):
+        return None
+
+    line_starts = np.zeros(len(per_line) + 1, dtype=np.int64)
+    np.cumsum(per_line, out=line_starts[1:])
+
+    # A block starts at each non-blank line that follows a blank one
+    kept = np.flatnonzero(~blank)
+    gaps = np.flatnonzero(np.diff(kept) > 1) + 1
+    block_starts = np.concatenate(([0], gaps, [len(kept)])) if len(kept) else np.zeros(1, np.int64)
+
+    return Ints(
+        array("q", values.astype(np.int64).tobytes()),
+        array("q", line_starts.tobytes()),
+        array("q", block_starts.astype(np.int64).tobytes()),
+    )
+
+
+def parse_ints(data: bytes | str) -> Ints:
+    if isinstance(data, str):
+        data = data.encode()
+
+    if len(data) < NUMPY_THRESHOLD:
+        return _scan_python(data)
+
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return _scan_python(data)
+
+    scanned = _scan_numpy(data)
+    return scanned if scanned is not None else _scan_python(data)
+
+
+def read_ints(filename: str) -> Ints:
+    with open(filename, "rb") as f:
+        return parse_ints(f.read())
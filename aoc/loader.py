@@ -0,0 +1,94 @@
+"""
+Reads puzzle inputs through a memory map, so a big input isn't copied into a list
+of line strings before parsing starts.
+
+    with Input(filename) as inp:
+        for block in inp.blocks(text=True):
+            ...
+
+lines(), blocks() and tokens() hand out memoryview slices of the mapped file, or
+str when text=True, in which case only the piece being looked at is decoded.
+Views must be let go of before the Input is closed.
+"""
+from __future__ import annotations
+from typing import Iterator
+import mmap
+import os
+import re
+
+WORD = re.compile(rb"\S+")
+
+
+class Input:
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.map: mmap.mmap | None = None
+
+        if os.path.getsize(filename) == 0:
+            self.view = memoryview(b"")  # Empty files can't be mapped
+        else:
+            with open(filename, "rb") as f:
+                self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self.view = memoryview(self.map)
+
+    def __enter__(self) -> Input:
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.view.release()
+        if self.map is not None:
+            self.map.close()
+
+    def __len__(self) -> int:
+        return len(self.view)
+
+    @staticmethod
+    def _out(piece: memoryview, text: bool) -> memoryview | str:
+        return str(piece, "utf-8") if text else piece
+
+    def lines(self, text: bool = False) -> Iterator[memoryview | str]:
+        """Every line without its line ending. A final newline doesn't make an extra empty line."""
+        view = self.view
+        buffer = self.map if self.map is not None else b""
+        start, end = 0, len(view)
+        while start < end:
+            stop = buffer.find(b"\n", start)
+            if stop == -1:
+                stop = end
+            line_end = stop - 1 if stop > start and view[stop - 1] == 13 else stop  # \r\n
+            yield self._out(view[start:line_end], text)
+            start = stop + 1
+
+    def blocks(self, text: bool = False) -> Iterator[list[memoryview | str]]:
+        """Runs of non-blank lines, split wherever there are blank ones"""
+        current: list[memoryview | str] = []
+        for line in self.lines():
+            if len(line) == 0 or bytes(line).isspace():
+                if current:
+                    yield current
+                    current = []
+            else:
+                current.append(self._out(line, text))
+        if current:
+            yield current
+
+    def tokens(self, sep: bytes | None = None, text: bool = False) -> Iterator[memoryview | str]:
+        """The pieces between runs of whitespace, or between each sep like str.split(sep)"""
+        view = self.view
+        buffer = self.map if self.map is not None else b""
+        if sep is None:
+            for match in WORD.finditer(buffer):
+                yield self._out(view[match.start():match.end()], text)
+            return
+
+        start = 0
+        while True:
+            stop = buffer.find(sep, start)
+            if stop == -1:
+                yield self._out(view[start:], text)
+                return
+            yield self._out(view[start:stop], text)
+            start = stop + len(sep)
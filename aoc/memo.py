@@ -0,0 +1,102 @@
+"""
+A memo table with a size limit, for solvers that cache answers to subproblems
+and would otherwise keep every one of them for the whole run:
+
+    memo: Memo[State, int] = Memo(limit=100_000)
+    found = memo.get(state, MISSING)
+    if found is MISSING:
+        found = memo.put(state, work_out(state))
+
+Once it's full the least recently used entry goes. Given a weigh function the
+limit is on the total weight instead, so a few huge entries can't hold on to
+more memory than many small ones would. Hits, misses and evictions are kept in
+stats, which last across clear(), so one Memo can serve a whole run of separate
+problems and report on all of them at the end with record().
+"""
+from __future__ import annotations
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, TypeVar
+
+from aoc import metrics
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+MISSING = object()  # What get() gives back for a miss when asked to, since None can be an answer
+
+
+@dataclass
+class Stats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    largest: int = 0  # Most entries held at once
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class Memo(Generic[K, V]):
+    def __init__(self, limit: int | None = 1 << 16, weigh: Callable[[K, V], int] | None = None):
+        """Holds up to limit entries, or limit total weight if weigh is given. None means no limit."""
+        self.limit = limit
+        self.weigh = weigh
+        self.entries: OrderedDict[K, V] = OrderedDict()
+        self.weights: dict[K, int] = {}
+        self.weight = 0
+        self.stats = Stats()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: K) -> bool:
+        """Doesn't count as a lookup, or make the entry any more recent"""
+        return key in self.entries
+
+    def get(self, key: K, default: V | object | None = None) -> V | object | None:
+        entries = self.entries
+        if key in entries:
+            self.stats.hits += 1
+            entries.move_to_end(key)
+            return entries[key]
+        self.stats.misses += 1
+        return default
+
+    def put(self, key: K, value: V) -> V:
+        """Stores value, making room if needed, and returns it"""
+        if key in self.entries:
+            self._drop(key)
+        self.entries[key] = value
+        if self.weigh is not None:
+            w = self.weigh(key, value)
+            self.weights[key] = w
+            self.weight += w
+
+        if self.limit is not None:
+            # Never evict the entry just added, even if it's over the limit on its own
+            while len(self.entries) > 1 and (self.weight if self.weigh else len(self.entries)) > self.limit:
+                self._drop(next(iter(self.entries)))
+                self.stats.evictions += 1
+
+        self.stats.largest = max(self.stats.largest, len(self.entries))
+        return value
+
+    def _drop(self, key: K):
+        del self.entries[key]
+        if self.weigh is not None:
+            self.weight -= self.weights.pop(key)
+
+    def clear(self):
+        """Empties the table, but keeps the stats"""
+        self.entries.clear()
+        self.weights.clear()
+        self.weight = 0
+
+    def record(self, name: str):
+        """Adds the stats to the metrics being collected, as name.hits and so on"""
+        metrics.count(f"{name}.hits", self.stats.hits)
+        metrics.count(f"{name}.misses", self.stats.misses)
+        metrics.count(f"{name}.evictions", self.stats.evictions)
+        metrics.observe(f"{name}.largest", self.stats.largest)
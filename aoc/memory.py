@@ -0,0 +1,55 @@
+"""
+Measures how much memory a block of code allocates, using tracemalloc:
+
+    with measure() as usage:
+        solver.solve2()
+    print(usage.peak_bytes)
+
+Tracing makes allocation-heavy code several times slower, so it's only switched on
+when asked for (--memory on the runner and the benchmarks). Timings taken with it
+on are inflated by the same amount.
+"""
+from __future__ import annotations
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator
+import sys
+import tracemalloc
+
+
+@dataclass
+class Usage:
+    peak_bytes: int = 0  # Most memory held at once, above what was already held at the start
+    net_bytes: int = 0  # Still held at the end, which is what the phase leaves behind for the next one
+    net_blocks: int = 0  # Change in the number of allocated blocks. Not an allocation count, since ones freed within the phase cancel out
+
+    def add(self, other: Usage):
+        """Folds in a second measurement of the same phase"""
+        self.peak_bytes = max(self.peak_bytes, self.net_bytes + other.peak_bytes)
+        self.net_bytes += other.net_bytes
+        self.net_blocks += other.net_blocks
+
+
+@contextmanager
+def measure() -> Iterator[Usage]:
+    usage = Usage()
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+
+    tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+    blocks = sys.getallocatedblocks()
+    try:
+        yield usage
+    finally:
+        current, peak = tracemalloc.get_traced_memory()
+        usage.peak_bytes = peak - before
+        usage.net_bytes = current - before
+        usage.net_blocks = sys.getallocatedblocks() - blocks
+        if started:
+            tracemalloc.stop()
+
+
+def megabytes(n: int) -> float:
+    return n / (1 << 20)
@@ -0,0 +1,112 @@
+"""
+Counters and histograms the solvers bump as they go, to show how much work an
+algorithm did and not just how long it took:
+
+    from aoc import metrics
+
+    metrics.count("search.dijkstra.popped", popped)
+    metrics.observe("25.phase_vertices", len(self.vertices))
+
+    with metrics.collect() as registry:
+        solver.solve1()
+    print(registry.to_json())
+
+Outside collect() nothing is recorded and count and observe return straight
+away, so the calls can stay in the solvers for good. Hot loops should still tally
+into a local and report the total once, instead of calling in every iteration.
+Switched on with --metrics on the runner.
+"""
+from __future__ import annotations
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from typing import Iterator
+import json
+
+
+@dataclass
+class Histogram:
+    count: int = 0
+    total: float = 0
+    low: float | None = None
+    high: float | None = None
+    buckets: dict[int, int] = field(default_factory=dict)  # Power of two above the value -> how many values
+
+    def add(self, value: float):
+        self.count += 1
+        self.total += value
+        self.low = value if self.low is None else min(self.low, value)
+        self.high = value if self.high is None else max(self.high, value)
+        bound = 1 << int(abs(value)).bit_length()
+        self.buckets[bound] = self.buckets.get(bound, 0) + 1
+
+    def merge(self, other: Histogram):
+        for bound, n in other.buckets.items():
+            self.buckets[bound] = self.buckets.get(bound, 0) + n
+        self.count += other.count
+        self.total += other.total
+        if other.low is not None:
+            self.low = other.low if self.low is None else min(self.low, other.low)
+            self.high = other.high if self.high is None else max(self.high, other.high)
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+@dataclass
+class Registry:
+    counters: dict[str, int] = field(default_factory=dict)
+    histograms: dict[str, Histogram] = field(default_factory=dict)
+
+    def count(self, name: str, n: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def observe(self, name: str, value: float):
+        if name not in self.histograms:
+            self.histograms[name] = Histogram()
+        self.histograms[name].add(value)
+
+    def merge(self, other: Registry):
+        for name, n in other.counters.items():
+            self.count(name, n)
+        for name, h in other.histograms.items():
+            self.histograms.setdefault(name, Histogram()).merge(h)
+
+    def empty(self) -> bool:
+        return not self.counters and not self.histograms
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), indent=2)
+
+
+_active: Registry | None = None
+
+
+def count(name: str, n: int = 1):
+    """Adds n to a counter, if anything is collecting"""
+    if _active is not None:
+        _active.count(name, n)
+
+
+def observe(name: str, value: float):
+    """Records one value in a histogram, if anything is collecting"""
+    if _active is not None:
+        _active.observe(name, value)
+
+
+def enabled() -> bool:
+    return _active is not None
+
+
+@contextmanager
+def collect() -> Iterator[Registry]:
+    """Records everything counted inside the block. A collect() inside another one passes its totals out to it."""
+    global _active
+    outer = _active
+    registry = Registry()
+    _active = registry
+    try:
+        yield registry
+    finally:
+        _active = outer
+        if outer is not None:
+            outer.merge(registry)
@@ -0,0 +1,120 @@
+"""
+Profiles one call and writes what it finds to a file:
+
+    profiling.run("collapsed", "day12-part2.collapsed.txt", solver.solve2)
+
+The collapsed and speedscope formats come from a sampler: a background thread
+that looks at the calling thread's stack every few milliseconds and counts how
+often each stack turns up. The solver runs at nearly full speed, and the counts
+show where its time goes. Collapsed files have one "outer;inner;innermost count"
+line per stack, for flamegraph.pl or speedscope.app. Speedscope files open
+straight in speedscope.app.
+
+cprofile uses the standard library's deterministic profiler instead. It records
+every call, which is exact but slows call-heavy solvers down a lot. Its files
+are for pstats or snakeviz.
+"""
+from __future__ import annotations
+from collections import Counter
+from timeit import default_timer as timer
+from types import CodeType, FrameType
+from typing import Any, Callable
+import cProfile
+import json
+import os
+import sys
+import threading
+
+from aoc.days import ROOT
+
+FORMATS = ("collapsed", "speedscope", "cprofile")
+SUFFIXES = {"collapsed": ".collapsed.txt", "speedscope": ".speedscope.json", "cprofile": ".prof"}
+DEFAULT_INTERVAL = 0.002  # Seconds between samples
+
+
+def frame_name(code: CodeType) -> str:
+    filename = code.co_filename
+    if filename.startswith(ROOT):
+        filename = os.path.relpath(filename, ROOT)
+    return f"{code.co_qualname} ({filename}:{code.co_firstlineno})"
+
+
+class Sampler:
+    def __init__(self, interval: float = DEFAULT_INTERVAL):
+        self.interval = interval
+        self.counts: Counter[tuple[CodeType, ...]] = Counter()
+        self.seconds = 0.0
+        self.stopping = threading.Event()
+
+    def sample(self, thread: int, base: FrameType):
+        """Counts stacks of the thread below the base frame, outermost first"""
+        start = timer()
+        while not self.stopping.wait(self.interval):
+            frame = sys._current_frames().get(thread)
+            stack: list[CodeType] = []
+            while frame is not None and frame is not base:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            if stack:
+                self.counts[tuple(reversed(stack))] += 1
+        self.seconds = timer() - start
+
+    def call(self, func: Callable[..., Any], *args: Any) -> Any:
+        base = sys._getframe()
+        sampler = threading.Thread(target=self.sample, args=(threading.get_ident(), base), daemon=True)
+        sampler.start()
+        try:
+            return func(*args)
+        finally:
+            self.stopping.set()
+            sampler.join()
+
+    def collapsed(self) -> str:
+        lines = [";".join(frame_name(code) for code in stack) + f" {count}" for stack, count in self.counts.most_common()]
+        return "\n".join(lines) + "\n"
+
+    def speedscope(self, name: str) -> dict[str, Any]:
+        frames: dict[CodeType, int] = {}
+        samples: list[list[int]] = []
+        weights: list[float] = []
+        total = sum(self.counts.values())
+        for stack, count in self.counts.most_common():
+            samples.append([frames.setdefault(code, len(frames)) for code in stack])
+            weights.append(self.seconds * count / total)
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "aoc.profiling",
+            "shared": {"frames": [{"name": code.co_qualname, "file": code.co_filename, "line": code.co_firstlineno} for code in frames]},
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }],
+        }
+
+
+def run(kind: str, filename: str, func: Callable[..., Any], *args: Any) -> Any:
+    """Calls func(*args) under the profiler and writes the profile to filename"""
+    os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
+    if kind == "cprofile":
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(func, *args)
+        finally:
+            profiler.dump_stats(filename)
+
+    sampler = Sampler()
+    try:
+        return sampler.call(func, *args)
+    finally:
+        with open(filename, "w") as f:
+            if kind == "speedscope":
+                json.dump(sampler.speedscope(os.path.basename(filename)), f)
+            else:
+                f.write(sampler.collapsed())
@@ -0,0 +1,75 @@
+"""
+How much memory each of the record classes the solvers make in bulk costs per
+instance, like day 20's Pulse (one per pulse sent) or day 22's Brick:
+
+    for size in measure_records(20):
+        print(size.name, size.bytes)
+
+Each record is built many times over from the same field values and measured
+with tracemalloc, so the figure covers the instance, its __dict__ if it has one,
+and anything its constructor allocates, but not the field values themselves.
+The benchmarks print it next to the timings for the days they run.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any, Callable
+
+from aoc.days import DAYS
+from aoc.memory import measure
+
+
+@dataclass(frozen=True)
+class Record:
+    day: int
+    name: str  # Class in the day's solver module
+    args: Callable[[ModuleType], tuple[Any, ...]]  # Typical constructor arguments, built once and shared
+
+
+def _vertices(m: ModuleType) -> tuple[Any, ...]:
+    return (m.Vertex(0, 0), m.Vertex(0, 5), True)
+
+
+def _face(m: ModuleType) -> tuple[Any, ...]:
+    e = m.Edge(*_vertices(m))
+    return (e, e, e, e)
+
+
+RECORDS: list[Record] = [
+    Record(18, "Vertex", lambda m: (0, 0)),
+    Record(18, "Edge", _vertices),
+    Record(18, "Face", _face),
+    Record(19, "Expression", lambda m: ("x", "<", 1351)),
+    Record(20, "Pulse", lambda m: ("broadcaster", "a", False)),
+    Record(22, "Coord", lambda m: (1, 0, 1)),
+    Record(22, "Brick", lambda m: (m.Coord(1, 0, 1), m.Coord(1, 2, 1), 0)),
+    Record(23, "HallPath", lambda m: (0,)),
+    Record(23, "Path", lambda m: (0,)),
+]
+
+
+@dataclass
+class RecordSize:
+    day: int
+    name: str
+    bytes: float  # Per instance
+    slotted: bool  # No per-instance __dict__
+
+
+def instance_bytes(cls: type, args: tuple[Any, ...], n: int = 10_000) -> float:
+    keep: list[Any] = [None] * n  # Allocated up front so it isn't counted
+    with measure() as usage:
+        for k in range(n):
+            keep[k] = cls(*args)
+    return usage.net_bytes / n
+
+
+def measure_records(number: int, n: int = 10_000) -> list[RecordSize]:
+    sizes: list[RecordSize] = []
+    for record in RECORDS:
+        if record.day == number:
+            module = DAYS[number].load()
+            cls = getattr(module, record.name)
+            args = record.args(module)
+            sizes.append(RecordSize(number, record.name, instance_bytes(cls, args, n), not hasattr(cls(*args), "__dict__")))
+    return sizes
@@ -0,0 +1,196 @@
+"""
+Checks that no day got slower, hungrier or started giving different answers,
+by comparing against a baseline recorded earlier:
+
+    python -m aoc.regress -g --update         # record regress_baseline.json
+    python -m aoc.regress -g                  # compare against it, exit 1 on regressions
+    python -m aoc.regress -d 17,25 -r 9 --tolerance 0.5
+
+Every phase is run several times in throwaway processes and the median is
+compared, so one noisy run doesn't fail the check. Peak memory comes from one
+extra run with tracing on, since tracing slows the solvers down. A phase has
+regressed when it's more than the tolerance above its baseline, plus a small
+absolute floor so phases that take microseconds don't flap.
+
+Baselines only mean something on the machine they were recorded on, so record
+one there and commit it alongside the code it describes.
+"""
+from __future__ import annotations
+from dataclasses import dataclass, asdict
+from statistics import median
+from typing import Any
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+from aoc.bench import run_isolated
+from aoc.days import DAYS, ROOT, select
+from aoc.generators import generate
+from aoc.memory import megabytes
+from aoc.runner import resolve_input
+
+DEFAULT_BASELINE = os.path.join(ROOT, "regress_baseline.json")
+MEMORY_FLOOR = 1 << 16  # Bytes of peak memory growth that never count as a regression
+
+type Key = tuple[int, str]
+
+
+@dataclass
+class Measurement:
+    day: int
+    part: str  # parse, part1 or part2
+    seconds: float  # Median of the repeats
+    peak_bytes: int | None = None
+    answer: str | None = None
+
+
+@dataclass
+class Regression:
+    day: int
+    part: str
+    metric: str  # seconds, peak_bytes or answer
+    baseline: Any
+    current: Any
+
+    def __str__(self) -> str:
+        if self.metric == "seconds":
+            change = f"{self.baseline:.4f}s -> {self.current:.4f}s ({self.current / max(self.baseline, 1e-9):.2f}x)"
+        elif self.metric == "peak_bytes":
+            change = f"{megabytes(self.baseline):.2f} MB -> {megabytes(self.current):.2f} MB"
+        else:
+            change = f"{self.baseline!r} -> {self.current!r}"
+        return f"day {self.day:>2} {self.part:<5} {self.metric}: {change}"
+
+
+def measure_day(number: int, filename: str, repeats: int, timeout: float | None, memory: bool = True) -> list[Measurement] | str:
+    """The median time of each phase, or the error if any run failed"""
+    times: dict[str, list[float]] = {}
+    answers: dict[str, str | None] = {}
+    for _ in range(repeats):
+        result = run_isolated(number, filename, timeout)
+        if result.error:
+            return result.error
+        for p in result.phases:
+            if p.name != "import":  # Mostly measures the disk cache
+                times.setdefault(p.name, []).append(p.seconds)
+                answers[p.name] = p.answer
+
+    peaks: dict[str, int] = {}
+    if memory:
+        result = run_isolated(number, filename, timeout, memory=True)
+        if result.error:
+            return result.error
+        peaks = {p.name: p.memory.peak_bytes for p in result.phases if p.memory}
+
+    return [Measurement(number, name, median(values), peaks.get(name), answers[name]) for name, values in times.items()]
+
+
+def compare(baseline: dict[Key, Measurement], current: list[Measurement], tolerance: float, memory_tolerance: float, floor: float) -> list[Regression]:
+    regressions: list[Regression] = []
+    for m in current:
+        base = baseline.get((m.day, m.part))
+        if base is None:
+            continue
+
+        if m.answer != base.answer:
+            regressions.append(Regression(m.day, m.part, "answer", base.answer, m.answer))
+        if m.seconds > base.seconds * (1 + tolerance) + floor:
+            regressions.append(Regression(m.day, m.part, "seconds", base.seconds, m.seconds))
+        if m.peak_bytes is not None and base.peak_bytes is not None:
+            if m.peak_bytes > base.peak_bytes * (1 + memory_tolerance) + MEMORY_FLOOR:
+                regressions.append(Regression(m.day, m.part, "peak_bytes", base.peak_bytes, m.peak_bytes))
+
+    return regressions
+
+
+def load_baseline(filename: str) -> tuple[str, dict[Key, Measurement]]:
+    with open(filename, "r") as f:
+        stored = json.load(f)
+    measurements = [Measurement(**m) for m in stored["measurements"]]
+    return stored["source"], {(m.day, m.part): m for m in measurements}
+
+
+def save_baseline(filename: str, source: str, repeats: int, measurements: list[Measurement]):
+    with open(filename, "w") as f:
+        json.dump({"source": source, "repeats": repeats, "measurements": [asdict(m) for m in measurements]}, f, indent=2)
+        f.write("\n")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m aoc.regress", description="Compare the solvers against a stored baseline")
+    parser.add_argument("-d", "--days", help="days to check, e.g. 1-5,9 (default: all)")
+    parser.add_argument("-i", "--input", default="input", help="input file, relative to each day's directory")
+    parser.add_argument("-g", "--generated", action="store_true", help="use synthetic inputs, the same on every machine")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the synthetic inputs")
+    parser.add_argument("-r", "--repeats", type=int, default=5, help="runs per day, the median is compared")
+    parser.add_argument("-t", "--timeout", type=float, default=300, help="seconds before a run is abandoned")
+    parser.add_argument("-b", "--baseline", default=DEFAULT_BASELINE, help="baseline file (default: regress_baseline.json)")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown, as a fraction of the baseline")
+    parser.add_argument("--memory-tolerance", type=float, default=0.25, help="allowed peak memory growth, as a fraction of the baseline")
+    parser.add_argument("--floor", type=float, default=0.01, help="seconds of slowdown that never count, for very fast phases")
+    parser.add_argument("--no-memory", action="store_true", help="only compare times and answers")
+    parser.add_argument("--update", action="store_true", help="record the baseline instead of comparing against it")
+    args = parser.parse_args(argv)
+
+    source = f"generated, seed {args.seed}" if args.generated else args.input
+    baseline: dict[Key, Measurement] = {}
+    if args.update and os.path.exists(args.baseline):
+        # Keep the days that weren't rerun, so a baseline can be refreshed a day at a time
+        stored_source, baseline = load_baseline(args.baseline)
+        if stored_source != source:
+            baseline = {}
+    elif not args.update:
+        if not os.path.exists(args.baseline):
+            parser.error(f"no baseline at {args.baseline}, record one with --update")
+        stored_source, baseline = load_baseline(args.baseline)
+        if stored_source != source:
+            parser.error(f"the baseline was recorded against {stored_source!r}, not {source!r}")
+
+    measurements: list[Measurement] = []
+    regressions: list[Regression] = []
+    failed = 0
+    with tempfile.TemporaryDirectory() as workdir:
+        for day in select(args.days):
+            if args.generated:
+                filename = os.path.join(workdir, f"day{day.number:02}")
+                with open(filename, "w") as f:
+                    f.write(generate(day.number, seed=args.seed))
+            else:
+                filename = resolve_input(DAYS[day.number], args.input)
+
+            measured = measure_day(day.number, filename, args.repeats, args.timeout, not args.no_memory)
+            if isinstance(measured, str):
+                failed += 1
+                print(f"day {day.number:>2} failed: {measured}", file=sys.stderr)
+                continue
+
+            measurements.extend(measured)
+            if args.update:
+                continue
+
+            found = compare(baseline, measured, args.tolerance, args.memory_tolerance, args.floor)
+            regressions.extend(found)
+            for m in measured:
+                base = baseline.get((m.day, m.part))
+                status = "no baseline" if base is None else "ok"
+                if any(r.part == m.part for r in found):
+                    status = "REGRESSED"
+                print(f"day {m.day:>2} {m.part:<5} {m.seconds:>9.4f}s  {status}", file=sys.stderr)
+
+    if args.update:
+        for m in measurements:
+            baseline[(m.day, m.part)] = m
+        save_baseline(args.baseline, source, args.repeats, sorted(baseline.values(), key=lambda m: (m.day, m.part)))
+        print(f"Recorded {len(measurements)} phases in {args.baseline}")
+        return 1 if failed else 0
+
+    for r in regressions:
+        print(r)
+    print(f"{len(regressions)} regressions in {len(measurements)} phases, {failed} days failed to run")
+    return 1 if regressions or failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
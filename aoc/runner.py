@@ -0,0 +1,362 @@
+"""
+Runs any set of days, in parallel, and reports how long each phase took:
+
+    python -m aoc.runner                 # every day against its "input" file
+    python -m aoc.runner -d 1-9 -i tiny_input
+    python -m aoc.runner -d 17 -j 1 --json
+    python -m aoc.runner --cache         # reuse answers for unchanged inputs and code
+    python -m aoc.runner --sidecars      # reuse parsed inputs, for the days that support it
+    python -m aoc.runner --memory        # peak memory of each phase as well
+    python -m aoc.runner --metrics       # what the solvers counted, see aoc.metrics
+    python -m aoc.runner --split-parts   # both parts of a day at once, in forked workers
+    python -m aoc.runner -d 12 --profile speedscope   # where the time goes, in profiles/
+    python -m aoc.runner -d 23 --resume  # save long searches as they go, and carry on from the last save
+"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext, redirect_stdout
+from dataclasses import dataclass, field, asdict
+from functools import partial
+from timeit import default_timer as timer
+from typing import Any, Callable
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import sys
+
+from aoc import checkpoint, profiling, sidecar
+from aoc.cache import AnswerCache, file_hash
+from aoc.days import Day, DAYS, Part, ROOT, select
+from aoc.memory import Usage, measure, megabytes
+from aoc.metrics import Registry, collect
+
+
+DEFAULT_PROFILE_DIR = os.path.join(ROOT, "profiles")
+
+
+@dataclass
+class Phase:
+    name: str  # import, parse, part1 or part2
+    seconds: float = 0.0
+    answer: str | None = None
+    cached: bool = False  # Answer came from the cache, seconds is how long it took originally
+    memory: Usage | None = None  # Only measured when asked for
+    metrics: Registry | None = None  # Counters the solver bumped, only collected when asked for
+
+
+@dataclass
+class DayResult:
+    day: int
+    input: str
+    phases: list[Phase] = field(default_factory=list)
+    error: str | None = None
+    parts_seconds: float | None = None  # Wall time of the parts, when they ran at the same time
+
+    def phase(self, name: str) -> Phase | None:
+        for p in self.phases:
+            if p.name == name:
+                return p
+        return None
+
+    def total(self) -> float:
+        if self.parts_seconds is None:
+            return sum(p.seconds for p in self.phases if not p.cached)
+        return sum(p.seconds for p in self.phases if not p.cached and not p.name.startswith("part")) + self.parts_seconds
+
+
+def resolve_input(day: Day, input_name: str) -> str:
+    """Input names are relative to the day's directory, like running the solver from there"""
+    return os.path.join(day.directory, os.path.expanduser(input_name))
+
+
+@contextmanager
+def timed(phase: Phase, memory: bool = False, metrics: bool = False):
+    """Adds the time the block takes to the phase, its memory use if memory is on, and what it counted if metrics is on"""
+    with measure() if memory else nullcontext() as usage, collect() if metrics else nullcontext() as registry:
+        start = timer()
+        try:
+            yield
+        finally:
+            phase.seconds += timer() - start
+
+    if usage is not None:
+        if phase.memory is None:
+            phase.memory = usage
+        else:
+            phase.memory.add(usage)
+
+    if registry is not None and not registry.empty():
+        if phase.metrics is None:
+            phase.metrics = registry
+        else:
+            phase.metrics.merge(registry)
+
+
+def in_parallel(tasks: list[Callable[[], Phase]]) -> list[Phase]:
+    """
+    Runs each task in a forked child and returns what they made, in order. The
+    children start from copy-on-write pages of everything already loaded, so they
+    can share a parsed solver and still mutate it without seeing each other's changes.
+    """
+    context = multiprocessing.get_context("fork")
+    running = []
+    for task in tasks:
+        receiver, sender = context.Pipe(duplex=False)
+        child = context.Process(target=_run_task, args=(task, sender))
+        child.start()
+        sender.close()
+        running.append((child, receiver))
+
+    results: list[Phase] = []
+    failure: BaseException | None = None
+    for child, receiver in running:
+        try:
+            ok, value = receiver.recv()
+        except EOFError:
+            ok, value = False, RuntimeError("worker died without answering")
+        child.join()
+        if ok:
+            results.append(value)
+        elif failure is None:
+            failure = value
+
+    if failure is not None:
+        raise failure
+    return results
+
+
+def _run_task(task: Callable[[], Phase], connection):
+    try:
+        connection.send((True, task()))
+    except Exception as e:
+        try:
+            connection.send((False, e))
+        except Exception:
+            connection.send((False, RuntimeError(f"{e.__class__.__name__}: {e}")))  # Exceptions that don't pickle
+    finally:
+        connection.close()
+
+
+SPLIT_PARTS = "fork" in multiprocessing.get_all_start_methods()
+
+
+def run_day(number: int, input_name: str = "input", cache: AnswerCache | None = None, memory: bool = False,
+            profile: str | None = None, profile_dir: str = DEFAULT_PROFILE_DIR, metrics: bool = False,
+            split: bool = False) -> DayResult:
+    """
+    Runs both parts of one day. Safe to call in a worker process. With split, the
+    parts run at the same time in forked copies of the parsed solver, so the day
+    takes as long as its slower part. Without fork, split does nothing.
+    """
+    day = DAYS[number]
+    filename = resolve_input(day, input_name)
+    result = DayResult(number, filename)
+
+    cwd = os.getcwd()
+    os.chdir(day.directory)  # Some solvers write scratch files next to their input
+    try:
+        parts = list(zip(["part1", "part2"], day.parts()))
+        keys: dict[str, str] = {}
+        hits: dict[str, Phase] = {}
+        if cache is not None:
+            input_hash = file_hash(filename)
+            for name, part in parts:
+                keys[name] = cache.key(day, name, part, filename, input_hash)
+                entry = cache.get(keys[name])
+                if entry is not None:
+                    hits[name] = Phase(name, entry.seconds, entry.answer, cached=True)
+
+        if len(hits) == len(parts):
+            result.phases = [Phase("import", cached=True), Phase("parse", cached=True)] + [hits[name] for name, _ in parts]
+            return result
+
+        with redirect_stdout(io.StringIO()):
+            # Loading the solver's module on its own shows what its imports cost
+            imports = Phase("import")
+            result.phases.append(imports)
+            with timed(imports, memory, metrics):
+                day.load()
+                for _, part in parts:
+                    if part.path is not None:
+                        day.load(part.path)
+
+            parse = Phase("parse")
+            result.phases.append(parse)
+            with timed(parse, memory, metrics):
+                solver = day.make_solver(filename)
+
+            # Parts that need a solver of their own get it here, so building it still counts as parsing
+            solvers: dict[str, Any] = {}
+            for name, part in parts:
+                if name not in hits:
+                    solvers[name] = solver
+                    if day.needs_own_solver(part):
+                        with timed(parse, memory, metrics):
+                            solvers[name] = day.make_solver(filename, part)
+
+            def solve(name: str, part: Part) -> Phase:
+                phase = Phase(name)
+                with timed(phase, memory, metrics):
+                    if profile is None:
+                        answer = day.solve(solvers[name], part, filename)
+                    else:
+                        target = os.path.join(profile_dir, f"day{number:02}-{name}{profiling.SUFFIXES[profile]}")
+                        answer = profiling.run(profile, target, day.solve, solvers[name], part, filename)
+                phase.answer = None if answer is None else str(answer)
+                return phase
+
+            todo = [(name, part) for name, part in parts if name not in hits]
+            if split and SPLIT_PARTS and len(todo) > 1:
+                start = timer()
+                solved = dict(zip([name for name, _ in todo], in_parallel([partial(solve, name, part) for name, part in todo])))
+                result.parts_seconds = timer() - start
+            else:
+                solved = {}
+                for name, part in todo:
+                    solved[name] = solve(name, part)
+
+            for name, part in parts:
+                if name in hits:
+                    result.phases.append(hits[name])
+                    continue
+
+                phase = solved[name]
+                result.phases.append(phase)
+                if cache is not None:
+                    cache.put(keys[name], number, name, phase.answer, phase.seconds)
+
+    except Exception as e:
+        result.error = f"{e.__class__.__name__}: {e}"
+
+    finally:
+        os.chdir(cwd)
+
+    return result
+
+
+def run(numbers: list[int], input_name: str = "input", jobs: int | None = None, cache: AnswerCache | None = None, cold: bool = False, memory: bool = False,
+        profile: str | None = None, profile_dir: str = DEFAULT_PROFILE_DIR, metrics: bool = False, split: bool = False) -> list[DayResult]:
+    """
+    Fans the days out over a process pool, so the run takes as long as the slowest
+    day. Workers are reused, so a day's import time leaves out libraries an earlier
+    day in the same worker already imported. With cold, every day gets a freshly
+    spawned worker and the import times are true cold starts, at the cost of
+    starting an interpreter per day.
+    """
+    if not cold and (jobs == 1 or len(numbers) == 1):
+        return [run_day(n, input_name, cache, memory, profile, profile_dir, metrics, split) for n in numbers]
+
+    results: list[DayResult] = []
+    options = {"max_tasks_per_child": 1, "mp_context": multiprocessing.get_context("spawn")} if cold else {}
+    with ProcessPoolExecutor(max_workers=jobs, **options) as pool:
+        futures = [pool.submit(run_day, n, input_name, cache, memory, profile, profile_dir, metrics, split) for n in numbers]
+        for future in as_completed(futures):
+            results.append(future.result())
+
+    results.sort(key=lambda r: r.day)
+    return results
+
+
+def format_table(results: list[DayResult]) -> str:
+    """Seconds per phase, then the peak megabytes of each phase if memory was measured"""
+    with_memory = any(p.memory for r in results for p in r.phases)
+    header = f"{'day':>3}  {'import':>9}  {'parse':>9}  {'part1':>9}  {'part2':>9}  "
+    if with_memory:
+        header += f"{'parse MB':>9}  {'part1 MB':>9}  {'part2 MB':>9}  "
+    lines = [header + "answers"]
+    for r in results:
+        if r.error:
+            lines.append(f"{r.day:>3}  {r.error}")
+            continue
+
+        times = []
+        answers = []
+        for name in ["import", "parse", "part1", "part2"]:
+            p = r.phase(name)
+            if p is None:
+                times.append(f"{'-':>9}")
+            elif p.cached:
+                times.append(f"{'cached':>9}")
+            else:
+                times.append(f"{p.seconds:>9.4f}")
+            if p and name.startswith("part"):
+                answers.append(str(p.answer))
+
+        if with_memory:
+            for name in ["parse", "part1", "part2"]:
+                p = r.phase(name)
+                times.append(f"{megabytes(p.memory.peak_bytes):>9.2f}" if p and p.memory else f"{'-':>9}")
+
+        lines.append(f"{r.day:>3}  {'  '.join(times)}  {' / '.join(answers)}")
+
+    return "\n".join(lines)
+
+
+def format_metrics(results: list[DayResult]) -> str:
+    """One line per counter and histogram, under the phase that recorded it"""
+    lines = []
+    for r in results:
+        for p in r.phases:
+            if p.metrics is None:
+                continue
+            lines.append(f"day {r.day} {p.name}:")
+            for name, n in sorted(p.metrics.counters.items()):
+                lines.append(f"    {name:<32} {n:>12}")
+            for name, h in sorted(p.metrics.histograms.items()):
+                lines.append(f"    {name:<32} {h.count:>12}  mean {h.mean():.1f}, {h.low} to {h.high}")
+
+    return "\n".join(lines) if lines else "Nothing was counted"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m aoc.runner", description="Run and time the daily solvers")
+    parser.add_argument("-d", "--days", help="days to run, e.g. 1-5,9 (default: all)")
+    parser.add_argument("-i", "--input", default="input", help="input file, relative to each day's directory")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--cold", action="store_true", help="run each day in a fresh process, to time imports from a cold start")
+    parser.add_argument("-c", "--cache", action="store_true", help="reuse answers for inputs and code that haven't changed")
+    parser.add_argument("--cache-dir", help="where cached answers live (default: .aoc_cache)")
+    parser.add_argument("--sidecars", action="store_true", help="save parsed inputs next to them, and load them from there next time")
+    parser.add_argument("--memory", action="store_true", help="measure peak memory per phase (slows the solvers down)")
+    parser.add_argument("--split-parts", action="store_true", help="run each day's two parts at the same time, on forked copies of the parsed input")
+    parser.add_argument("--metrics", action="store_true", help="collect the counters and histograms the solvers record")
+    parser.add_argument("--profile", choices=profiling.FORMATS, help="profile each part, sampling for collapsed stacks or speedscope, or with cProfile")
+    parser.add_argument("--profile-dir", default=DEFAULT_PROFILE_DIR, help="where profiles are written (default: profiles)")
+    parser.add_argument("--checkpoints", action="store_true", help="save the state of long searches next to their inputs every so often (days 21 and 23)")
+    parser.add_argument("--resume", action="store_true", help="carry on from saved checkpoints, and keep saving them")
+    parser.add_argument("--checkpoint-seconds", type=float, help=f"how often to save checkpoints (default: {checkpoint.DEFAULT_SECONDS:g})")
+    args = parser.parse_args(argv)
+
+    if args.sidecars:
+        os.environ[sidecar.ENV] = "1"  # Inherited by the worker processes
+    if args.resume or args.checkpoints:
+        os.environ[checkpoint.ENV] = "resume" if args.resume else "1"
+    if args.checkpoint_seconds is not None:
+        os.environ[checkpoint.SECONDS_ENV] = str(args.checkpoint_seconds)
+
+    numbers = [d.number for d in select(args.days)]
+    cache = AnswerCache(args.cache_dir) if args.cache or args.cache_dir else None
+
+    start = timer()
+    profile_dir = os.path.abspath(args.profile_dir)  # Days run from their own directories
+    results = run(numbers, args.input, args.jobs, cache, args.cold, args.memory, args.profile, profile_dir, args.metrics, args.split_parts)
+    elapsed = timer() - start
+
+    if args.json:
+        print(json.dumps({"wall_seconds": elapsed, "days": [asdict(r) for r in results]}, indent=2))
+    else:
+        print(format_table(results))
+        if args.metrics:
+            print(format_metrics(results))
+        print(f"Ran {len(results)} days in {elapsed:.4f} seconds ({sum(r.total() for r in results):.4f} seconds of solver time)")
+        if args.profile:
+            print(f"Profiles are in {profile_dir}")
+
+    return 1 if any(r.error for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
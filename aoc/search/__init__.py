@@ -0,0 +1,20 @@
+"""
+Shortest path search over graphs whose vertices are ints 0..n-1.
+
+Build a Graph once, from int edges with Graph.from_edges or from any hashable
+vertex names with GraphBuilder, then run bfs, dijkstra or astar on it. The
+weighted searches take a queue class, so the right one can be picked per day:
+
+    BinaryHeap   any non-negative weights, the safe default
+    BucketQueue  small integer weights (Dial's algorithm), O(1) per operation
+    RadixHeap    integer weights of any size, cheaper than a heap on big graphs
+"""
+from aoc.search.graph import Graph, GraphBuilder
+from aoc.search.paths import INF, astar, bfs, dijkstra
+from aoc.search.queues import QUEUES, BinaryHeap, BucketQueue, RadixHeap
+
+__all__ = [
+    "Graph", "GraphBuilder",
+    "INF", "astar", "bfs", "dijkstra",
+    "QUEUES", "BinaryHeap", "BucketQueue", "RadixHeap",
+]
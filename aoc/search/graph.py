@@ -0,0 +1,72 @@
+"""Directed graphs in compressed sparse row form"""
+from __future__ import annotations
+from array import array
+from typing import Hashable, Iterable, Iterator
+
+
+class Graph:
+    """
+    The edges leaving vertex v are targets[k] with cost weights[k], for k in
+    range(offsets[v], offsets[v + 1]). Three flat arrays, however many edges.
+    """
+
+    def __init__(self, offsets: array, targets: array, weights: array):
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @classmethod
+    def from_edges(cls, n: int, edges: Iterable[tuple[int, int, int]]) -> Graph:
+        """Counting sort of (src, dst, cost) edges by source"""
+        edges = list(edges)
+        offsets = array("q", bytes(8 * (n + 1)))
+        for src, _, _ in edges:
+            offsets[src + 1] += 1
+        for v in range(n):
+            offsets[v + 1] += offsets[v]
+
+        fill = array("q", offsets[:-1])
+        targets = array("q", bytes(8 * len(edges)))
+        weights = array("q", bytes(8 * len(edges)))
+        for src, dst, cost in edges:
+            k = fill[src]
+            targets[k] = dst
+            weights[k] = cost
+            fill[src] = k + 1
+
+        return cls(offsets, targets, weights)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    def max_weight(self) -> int:
+        return max(self.weights, default=0)
+
+    def neighbors(self, v: int) -> Iterator[tuple[int, int]]:
+        for k in range(self.offsets[v], self.offsets[v + 1]):
+            yield self.targets[k], self.weights[k]
+
+
+class GraphBuilder:
+    """Collects edges between hashable names, numbering the vertices as they turn up"""
+
+    def __init__(self):
+        self.ids: dict[Hashable, int] = {}
+        self.names: list[Hashable] = []
+        self.edges: list[tuple[int, int, int]] = []
+
+    def vertex(self, name: Hashable) -> int:
+        v = self.ids.get(name)
+        if v is None:
+            v = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return v
+
+    def add_edge(self, src: Hashable, dst: Hashable, cost: int = 1):
+        self.edges.append((self.vertex(src), self.vertex(dst), cost))
+
+    def build(self) -> Graph:
+        return Graph.from_edges(len(self.names), self.edges)
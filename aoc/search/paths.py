@@ -0,0 +1,109 @@
+"""Breadth first search, Dijkstra and A* over a Graph"""
+from __future__ import annotations
+from array import array
+from collections import deque
+from typing import Callable, Iterable
+
+from aoc import metrics
+from aoc.search.graph import Graph
+from aoc.search.queues import BinaryHeap
+
+INF = 1 << 62  # Distance to a vertex that wasn't reached
+
+type Queue = type[BinaryHeap]
+
+
+def _sources(start: int | Iterable[int]) -> list[int]:
+    return [start] if isinstance(start, int) else list(start)
+
+
+def bfs(graph: Graph, start: int | Iterable[int], goal: int | None = None) -> array:
+    """Fewest edges from the start vertices to every vertex, ignoring weights. Stops early at the goal."""
+    offsets, targets = graph.offsets, graph.targets
+    dist = array("q", [INF]) * len(graph)
+    frontier = deque(_sources(start))
+    for s in frontier:
+        dist[s] = 0
+
+    popped = 0
+    while frontier:
+        v = frontier.popleft()
+        popped += 1
+        if v == goal:
+            break
+        d = dist[v] + 1
+        for k in range(offsets[v], offsets[v + 1]):
+            t = targets[k]
+            if dist[t] == INF:
+                dist[t] = d
+                frontier.append(t)
+
+    metrics.count("search.bfs.popped", popped)
+    return dist
+
+
+def dijkstra(graph: Graph, start: int | Iterable[int], goal: int | None = None, queue: Queue = BinaryHeap) -> array:
+    """Cheapest cost from the start vertices to every vertex. Stops early at the goal."""
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    dist = array("q", [INF]) * len(graph)
+    pending = queue(graph.max_weight())
+    for s in _sources(start):
+        dist[s] = 0
+        pending.push(0, s)
+
+    popped = stale = 0
+    while pending:
+        d, v = pending.pop()
+        popped += 1
+        if d > dist[v]:
+            stale += 1
+            continue  # Already settled by a cheaper route
+        if v == goal:
+            break
+        for k in range(offsets[v], offsets[v + 1]):
+            t = targets[k]
+            nd = d + weights[k]
+            if nd < dist[t]:
+                dist[t] = nd
+                pending.push(nd, t)
+
+    metrics.count("search.dijkstra.popped", popped)
+    metrics.count("search.dijkstra.stale", stale)
+    return dist
+
+
+def astar(graph: Graph, start: int | Iterable[int], goal: int, heuristic: Callable[[int], int], queue: Queue = BinaryHeap) -> int:
+    """
+    Cheapest cost from the start vertices to the goal, or INF. The heuristic must
+    never overestimate, and must be consistent to use a monotone queue. A bucket
+    queue also needs it to change by no more than an edge's weight along that edge.
+    """
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    dist = array("q", [INF]) * len(graph)
+    pending = queue(2 * graph.max_weight())
+    for s in _sources(start):
+        dist[s] = 0
+        pending.push(heuristic(s), s)
+
+    popped = stale = 0
+    found = INF
+    while pending:
+        f, v = pending.pop()
+        popped += 1
+        d = dist[v]
+        if f > d + heuristic(v):
+            stale += 1
+            continue  # Already settled by a cheaper route
+        if v == goal:
+            found = d
+            break
+        for k in range(offsets[v], offsets[v + 1]):
+            t = targets[k]
+            nd = d + weights[k]
+            if nd < dist[t]:
+                dist[t] = nd
+                pending.push(nd + heuristic(t), t)
+
+    metrics.count("search.astar.popped", popped)
+    metrics.count("search.astar.stale", stale)
+    return found
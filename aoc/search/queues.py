@@ -0,0 +1,104 @@
+"""
+Min priority queues of (key, vertex) pairs, all with the same small interface:
+push(key, vertex), pop() -> (key, vertex) and len(). Each is built with the
+largest edge weight of the graph being searched, which only BucketQueue uses.
+
+BucketQueue and RadixHeap are monotone: a pushed key must be no smaller than
+the last popped one, which holds for Dijkstra and for A* with a consistent
+heuristic.
+"""
+from __future__ import annotations
+import heapq
+
+
+class BinaryHeap:
+    def __init__(self, max_weight: int = 0):
+        self.heap: list[tuple[int, int]] = []
+
+    def push(self, key: int, vertex: int):
+        heapq.heappush(self.heap, (key, vertex))
+
+    def pop(self) -> tuple[int, int]:
+        return heapq.heappop(self.heap)
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+
+class BucketQueue:
+    """
+    Dial's buckets: one list per key, in a ring of max_weight + 1 of them, since
+    every queued key is within max_weight of the smallest one
+    """
+
+    def __init__(self, max_weight: int = 0):
+        self.buckets: list[list[int]] = [[] for _ in range(max_weight + 1)]
+        self.current = 0
+        self.size = 0
+
+    def push(self, key: int, vertex: int):
+        if not self.size and not self.current <= key < self.current + len(self.buckets):
+            self.current = key  # Nothing queued, so the ring can start anywhere
+        assert self.current <= key < self.current + len(self.buckets), f"Key {key} is out of range"
+        self.buckets[key % len(self.buckets)].append(vertex)
+        self.size += 1
+
+    def pop(self) -> tuple[int, int]:
+        if not self.size:
+            raise IndexError("pop from an empty queue")
+
+        span = len(self.buckets)
+        while not self.buckets[self.current % span]:
+            self.current += 1
+
+        self.size -= 1
+        return self.current, self.buckets[self.current % span].pop()
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class RadixHeap:
+    """
+    Bucket i holds the keys that first differ from the last popped key at bit
+    i - 1. Popping empties the lowest non-empty bucket into lower ones, and each
+    entry can only move down so many times.
+    """
+
+    def __init__(self, max_weight: int = 0):
+        self.buckets: list[list[tuple[int, int]]] = [[] for _ in range(65)]
+        self.last = 0
+        self.size = 0
+
+    def push(self, key: int, vertex: int):
+        assert key >= self.last, f"Key {key} is below the last popped key {self.last}"
+        self.buckets[(key ^ self.last).bit_length()].append((key, vertex))
+        self.size += 1
+
+    def pop(self) -> tuple[int, int]:
+        if not self.size:
+            raise IndexError("pop from an empty queue")
+
+        if not self.buckets[0]:
+            i = 1
+            while not self.buckets[i]:
+                i += 1
+
+            spill = self.buckets[i]
+            self.buckets[i] = []
+            self.last = min(key for key, _ in spill)
+            for key, vertex in spill:
+                self.buckets[(key ^ self.last).bit_length()].append((key, vertex))
+
+        self.size -= 1
+        return self.buckets[0].pop()
+
+    def __len__(self) -> int:
+        return self.size
+
+
+QUEUES = {
+    "heap": BinaryHeap,
+    "bucket": BucketQueue,
+    "radix": RadixHeap,
+}
@@ -0,0 +1,311 @@
+"""
+A local HTTP service that answers puzzles without paying for interpreter start up
+and imports on every request:
+
+    python -m aoc.service -w 4                 # listens on 127.0.0.1:8023
+    curl -d '{"day": 17, "part": 2, "input": "tiny_input"}' localhost:8023/solve
+    curl -d '{"day": 9, "part": 1, "text": "0 3 6 9\\n"}' localhost:8023/solve
+    curl localhost:8023/health
+
+Every worker process imports all the days when it starts, then solves one request
+at a time. Inputs are file names relative to the day's directory, as with the
+runner, or the text itself. Replies are JSON with the answer and how long the
+request spent waiting, parsing and solving.
+
+Only as many requests as there are workers run at once, and only --queue more
+wait for one. Past that the service answers 503 straight away instead of piling
+up work. A request that runs past its timeout gets a 504, and its worker is
+killed and replaced, so a runaway search can't hold a worker forever.
+"""
+from __future__ import annotations
+from contextlib import redirect_stdout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing.connection import Connection
+from timeit import default_timer as timer
+from typing import Any
+import argparse
+import io
+import json
+import math
+import multiprocessing
+import os
+import queue
+import sys
+import tempfile
+import threading
+import urllib.error
+import urllib.request
+
+from aoc.batch import warm
+from aoc.days import DAYS
+from aoc.runner import resolve_input
+
+DEFAULT_PORT = 8023
+DEFAULT_TIMEOUT = 60.0
+MIN_TIMEOUT = 0.001  # A zero or negative timeout would give up before the worker even started
+
+
+def solve_part(number: int, index: int, filename: str) -> dict[str, Any]:
+    """Runs in a worker: one part of one day, from a fresh solver"""
+    day = DAYS[number]
+    part = day.parts()[index]
+    cwd = os.getcwd()
+    os.chdir(day.directory)
+    try:
+        with redirect_stdout(io.StringIO()):
+            start = timer()
+            solver = day.make_solver(filename, part)
+            parsed = timer()
+            answer = day.solve(solver, part, filename)
+            solved = timer()
+        return {"answer": None if answer is None else str(answer), "parse_seconds": parsed - start, "seconds": solved - parsed}
+    except Exception as e:
+        return {"error": f"{e.__class__.__name__}: {e}"}
+    finally:
+        os.chdir(cwd)
+
+
+def work(connection: Connection):
+    with redirect_stdout(io.StringIO()):
+        for number in DAYS:
+            warm(number)
+    connection.send("ready")
+
+    while True:
+        try:
+            request = connection.recv()
+        except EOFError:
+            return  # The service went away
+        connection.send(solve_part(*request))
+
+
+class Worker:
+    def __init__(self, context: Any):
+        self.connection, child = context.Pipe()
+        self.process = context.Process(target=work, args=(child,), daemon=True)
+        self.process.start()
+        child.close()
+        self.ready = False
+
+    def call(self, request: tuple, timeout: float) -> dict[str, Any] | None:
+        """The worker's reply, or None if it took longer than the timeout"""
+        if not self.ready:
+            self.connection.recv()  # Warming up doesn't count against the request
+            self.ready = True
+
+        self.connection.send(request)
+        if not self.connection.poll(timeout):
+            return None
+        return self.connection.recv()
+
+    def stop(self):
+        self.process.terminate()
+        self.process.join()
+        self.connection.close()
+
+
+class WorkerPool:
+    def __init__(self, workers: int, backlog: int):
+        self.context = multiprocessing.get_context("spawn")  # Forking a threaded server isn't safe
+        self.size = workers
+        self.idle: queue.Queue[Worker] = queue.Queue()
+        for _ in range(workers):
+            self.idle.put(Worker(self.context))
+
+        # Requests running plus requests waiting for a worker
+        self.admitted = threading.BoundedSemaphore(workers + backlog)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.served = 0
+        self.timed_out = 0
+        self.rejected = 0
+
+    def status(self) -> dict[str, int]:
+        with self.lock:
+            return {
+                "workers": self.size,
+                "in_flight": self.in_flight,
+                "served": self.served,
+                "timed_out": self.timed_out,
+                "rejected": self.rejected,
+            }
+
+    def submit(self, request: tuple, timeout: float) -> tuple[int, dict[str, Any]]:
+        """An HTTP status and the reply body"""
+        if not self.admitted.acquire(blocking=False):
+            with self.lock:
+                self.rejected += 1
+            return 503, {"error": "too many requests waiting, try again later"}
+
+        with self.lock:
+            self.in_flight += 1
+        try:
+            start = timer()
+            worker = self.idle.get()
+            waited = timer() - start
+            crashed = False
+            try:
+                reply = worker.call(request, timeout)
+            except (EOFError, OSError):
+                reply = {"error": "worker died"}
+                crashed = True
+
+            if reply is None or crashed:
+                # Timed out or crashed, so start a replacement. It warms up while it waits for work.
+                worker.stop()
+                worker = Worker(self.context)
+            self.idle.put(worker)
+
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+            self.admitted.release()
+
+        with self.lock:
+            self.served += 1
+            self.timed_out += reply is None
+        if reply is None:
+            return 504, {"error": f"timed out after {timeout} seconds", "queued_seconds": waited}
+
+        reply["queued_seconds"] = waited
+        return (500 if "error" in reply else 200), reply
+
+    def close(self):
+        for _ in range(self.size):
+            self.idle.get().stop()
+
+
+class Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port: int, pool: WorkerPool, timeout: float = DEFAULT_TIMEOUT, quiet: bool = False):
+        super().__init__(("127.0.0.1", port), Handler)
+        self.pool = pool
+        self.request_timeout = timeout
+        self.quiet = quiet
+
+    def timeout_for(self, asked: Any) -> float:
+        """The timeout asked for, kept between MIN_TIMEOUT and the server's own"""
+        # float() would take true and "nan" too, neither of which is a number of seconds
+        if isinstance(asked, bool) or not isinstance(asked, (int, float, str)):
+            raise TypeError(f"timeout must be a number of seconds, not {asked!r}")
+        seconds = float(asked)
+        if math.isnan(seconds):
+            raise ValueError(f"timeout must be a number of seconds, not {asked!r}")
+        return max(MIN_TIMEOUT, min(seconds, self.request_timeout))
+
+    def solve(self, request: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        try:
+            number = int(request["day"])
+            index = int(request.get("part", 1)) - 1
+            day = DAYS[number]
+            timeout = self.timeout_for(request.get("timeout", self.request_timeout))
+            for field in ("text", "input"):
+                if field in request and not isinstance(request[field], str):
+                    raise TypeError(f"{field} must be a string, not {request[field]!r}")
+        except (KeyError, TypeError, ValueError) as e:
+            return 400, {"error": f"bad request: {e!r}"}
+        if not 0 <= index < len(day.parts()):
+            return 400, {"error": f"day {number} has no part {index + 1}"}
+
+        answer: dict[str, Any] = {"day": number, "part": index + 1}
+        if "text" in request:
+            with tempfile.TemporaryDirectory() as workdir:
+                # Some days take different arguments for the examples, which they spot by name
+                filename = os.path.join(workdir, "tiny_input" if request.get("tiny") else "input")
+                with open(filename, "w") as f:
+                    f.write(request["text"])
+                status, reply = self.pool.submit((number, index, filename), timeout)
+        else:
+            filename = resolve_input(day, request.get("input", "input"))
+            if not os.path.isfile(filename):
+                return 400, answer | {"error": f"no input at {filename}"}
+            status, reply = self.pool.submit((number, index, filename), timeout)
+
+        return status, answer | reply
+
+
+class Handler(BaseHTTPRequestHandler):
+    server: Server
+
+    def do_GET(self):
+        if self.path == "/health":
+            self.reply(200, self.server.pool.status())
+        else:
+            self.reply(404, {"error": f"no such path {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/solve":
+            self.reply(404, {"error": f"no such path {self.path}"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length))
+        except ValueError as e:
+            self.reply(400, {"error": f"bad request: {e}"})
+            return
+        if not isinstance(request, dict):
+            self.reply(400, {"error": "bad request: expected a JSON object"})
+            return
+
+        self.reply(*self.server.solve(request))
+
+    def reply(self, status: int, body: dict[str, Any]):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if status == 503:
+            self.send_header("Retry-After", "1")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+def ask(day: int, part: int = 1, input: str | None = None, text: str | None = None, port: int = DEFAULT_PORT, timeout: float | None = None) -> tuple[int, dict[str, Any]]:
+    """Sends one request to a running service, for scripts that want answers quickly"""
+    request: dict[str, Any] = {"day": day, "part": part}
+    if input is not None:
+        request["input"] = input
+    if text is not None:
+        request["text"] = text
+    if timeout is not None:
+        request["timeout"] = timeout
+
+    message = urllib.request.Request(f"http://127.0.0.1:{port}/solve", json.dumps(request).encode(), {"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(message) as response:
+            return response.status, json.load(response)
+    except urllib.error.HTTPError as e:
+        return e.code, json.load(e)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m aoc.service", description="Answer puzzles from pre-warmed workers over local HTTP")
+    parser.add_argument("-p", "--port", type=int, default=DEFAULT_PORT, help="port on 127.0.0.1 to listen on")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1, help="worker processes, and so requests solved at once")
+    parser.add_argument("-q", "--queue", type=int, default=16, help="requests that may wait for a worker before new ones are turned away")
+    parser.add_argument("-t", "--timeout", type=float, default=DEFAULT_TIMEOUT, help="longest a request may take, in seconds")
+    parser.add_argument("--quiet", action="store_true", help="don't log each request")
+    args = parser.parse_args(argv)
+
+    pool = WorkerPool(args.workers, args.queue)
+    server = Server(args.port, pool, args.timeout, args.quiet)
+    print(f"Listening on http://127.0.0.1:{server.server_port} with {args.workers} workers", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        pool.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
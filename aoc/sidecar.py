@@ -0,0 +1,123 @@
+"""
+Saves a day's parsed input as flat int64 arrays in a binary file next to the
+input, and maps it back in on later runs instead of parsing the text again.
+
+    stored = sidecar.load(filename, "bricks-v1")
+    if stored is None:
+        corners = ...parse the text...
+        sidecar.save(filename, "bricks-v1", {"corners": corners})
+    else:
+        corners = stored.arrays["corners"]
+
+Sidecars are off unless AOC_SIDECARS is set (the runner and the benchmarks set it
+with --sidecars), so by default nothing is written next to the inputs. A sidecar
+is only used if it was made from a file of the same size and modification time,
+and with the same tag, so bump the tag's version when the parsed layout changes.
+
+The file is an 8 byte magic number, the header length, a JSON header and then the
+arrays, each starting on an 8 byte boundary.
+"""
+from __future__ import annotations
+from array import array
+from dataclasses import dataclass
+from typing import Any, Sequence
+import json
+import mmap
+import os
+import struct
+import tempfile
+
+MAGIC = b"AOCSIDE1"
+ENV = "AOC_SIDECARS"
+
+
+@dataclass
+class Sidecar:
+    arrays: dict[str, memoryview]  # Views of the mapped file, cast to int64
+    meta: dict[str, Any]
+
+
+def enabled() -> bool:
+    return os.environ.get(ENV, "") not in ("", "0")
+
+
+def path(filename: str, tag: str) -> str:
+    return f"{filename}.{tag}.sidecar"
+
+
+def _stamp(filename: str) -> dict[str, int]:
+    stat = os.stat(filename)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def save(filename: str, tag: str, arrays: dict[str, Sequence[int]], meta: dict[str, Any] | None = None, force: bool = False):
+    """Writes the sidecar, if they're enabled. Names and strings go in meta, which must be JSON."""
+    if not (enabled() or force):
+        return
+
+    packed = {name: values if isinstance(values, array) and values.typecode == "q" else array("q", values) for name, values in arrays.items()}
+    layout: dict[str, list[int]] = {}
+    offset = 0
+    for name, values in packed.items():
+        layout[name] = [offset, len(values)]
+        offset += 8 * len(values)
+
+    header = json.dumps({"tag": tag, "input": _stamp(filename), "arrays": layout, "meta": meta or {}}).encode()
+    header += b" " * (-len(header) % 8)
+
+    target = path(filename, tag)
+    fd, scratch = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(target)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(MAGIC + struct.pack("<Q", len(header)) + header)
+            for values in packed.values():
+                values.tofile(f)
+        os.replace(scratch, target)
+    except OSError:
+        os.unlink(scratch)
+        raise
+
+
+def load(filename: str, tag: str, force: bool = False) -> Sidecar | None:
+    """The saved arrays, or None if sidecars are off or there isn't an up to date one"""
+    if not (enabled() or force):
+        return None
+
+    try:
+        with open(path(filename, tag), "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    # A sidecar cut short or written over is no use, so like a stale one it's ignored
+    try:
+        found = _header(mapped, filename, tag)
+    except (struct.error, ValueError, KeyError, TypeError, AttributeError):
+        found = None
+    if found is None:
+        mapped.close()
+        return None
+
+    start, header = found
+    view = memoryview(mapped)
+    arrays = {
+        name: view[start + offset:start + offset + 8 * count].cast("q")
+        for name, (offset, count) in header["arrays"].items()
+    }
+    return Sidecar(arrays, header["meta"])
+
+
+def _header(mapped: mmap.mmap, filename: str, tag: str) -> tuple[int, dict[str, Any]] | None:
+    """Where the arrays start and the header describing them, if the sidecar is whole and up to date"""
+    if mapped[:8] != MAGIC:
+        return None
+    (length,) = struct.unpack("<Q", mapped[8:16])
+    header = json.loads(mapped[16:16 + length])
+    if header["tag"] != tag or header["input"] != _stamp(filename) or "meta" not in header:
+        return None
+
+    start = 16 + length
+    for offset, count in header["arrays"].values():
+        if offset < 0 or count < 0 or start + offset + 8 * count > len(mapped):
+            return None
+    return start, header
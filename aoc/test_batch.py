@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+
+from aoc.batch import expand, read_manifest, results
+from aoc.generators import generate
+
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.workdir = tempfile.TemporaryDirectory()
+        self.inputs = []
+        for seed in range(6):
+            filename = os.path.join(self.workdir.name, f"in{seed}")
+            with open(filename, "w") as f:
+                f.write(generate(9, 10, seed))
+            self.inputs.append(filename)
+
+    def tearDown(self):
+        self.workdir.cleanup()
+
+    def test_expand(self):
+        for junk in ["in0.bricks-v1.sidecar", "in1.hallpaths-slopes-v1.checkpoint", ".hidden"]:
+            open(os.path.join(self.workdir.name, junk), "w").close()
+        self.assertEqual(list(expand([self.workdir.name])), self.inputs)
+        self.assertEqual(list(expand(self.inputs[:1])), self.inputs[:1])
+
+    def test_manifest(self):
+        manifest = os.path.join(self.workdir.name, "manifest")
+        with open(manifest, "w") as f:
+            f.write("# generated inputs\nin1\n\nin3  # the odd one\n")
+        self.assertEqual(read_manifest(manifest), [self.inputs[1], self.inputs[3]])
+
+    def test_results(self):
+        serial = {r.input: [p.answer for p in r.phases] for r in results(9, self.inputs, jobs=1)}
+        pooled = {r.input: [p.answer for p in r.phases] for r in results(9, self.inputs, jobs=2)}
+        self.assertEqual(sorted(serial), self.inputs)
+        self.assertEqual(serial, pooled)
+
+        failed = list(results(9, [os.path.join(self.workdir.name, "missing")], jobs=1))
+        self.assertIn("FileNotFoundError", failed[0].error)
+
+
+if __name__ == "__main__":
+    unittest.main()
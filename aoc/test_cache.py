@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+
+from aoc.cache import AnswerCache
+from aoc.days import DAYS
+from aoc.generators import generate
+from aoc.runner import run_day
+
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self):
+        self.workdir = tempfile.TemporaryDirectory()
+        self.cache = AnswerCache(os.path.join(self.workdir.name, "cache"))
+        self.input = os.path.join(self.workdir.name, "input")
+        self.write(generate(9, 20, 1))
+
+    def tearDown(self):
+        self.workdir.cleanup()
+
+    def write(self, text: str):
+        with open(self.input, "w") as f:
+            f.write(text)
+
+    def test_keys(self):
+        day = DAYS[9]
+        key = self.cache.key(day, "part1", day.part1, self.input)
+        self.assertEqual(key, self.cache.key(day, "part1", day.part1, self.input))
+        self.assertNotEqual(key, self.cache.key(day, "part2", day.part2, self.input))
+        self.assertNotEqual(key, self.cache.key(DAYS[4], "part1", day.part1, self.input))
+
+        self.write(generate(9, 20, 2))
+        self.assertNotEqual(key, self.cache.key(day, "part1", day.part1, self.input))
+
+    def test_round_trip(self):
+        self.assertIsNone(self.cache.get("ab" * 32))
+        self.cache.put("ab" * 32, 9, "part1", "114", 0.5)
+        entry = self.cache.get("ab" * 32)
+        self.assertEqual((entry.day, entry.part, entry.answer, entry.seconds), (9, "part1", "114", 0.5))
+
+    def test_runner(self):
+        first = run_day(9, self.input, self.cache)
+        self.assertIsNone(first.error)
+        self.assertFalse(any(p.cached for p in first.phases))
+
+        second = run_day(9, self.input, self.cache)
+        self.assertTrue(all(p.cached for p in second.phases))
+        self.assertEqual([p.answer for p in second.phases], [p.answer for p in first.phases])
+        self.assertEqual(second.total(), 0)
+
+        self.write(generate(9, 20, 2))
+        third = run_day(9, self.input, self.cache)
+        self.assertFalse(any(p.cached for p in third.phases))
+
+
+if __name__ == "__main__":
+    unittest.main()
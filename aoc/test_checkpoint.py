@@ -0,0 +1,94 @@
+from contextlib import redirect_stdout
+from unittest import mock
+import io
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+from aoc import checkpoint
+from aoc.checkpoint import Checkpoint
+from aoc.days import DAYS
+
+
+class TestCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.dir, "input")
+        with open(self.filename, "w") as f:
+            f.write("1 2 3\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_round_trip(self):
+        c = Checkpoint(self.filename, "t-v1", every=0, save=True, resume=True)
+        self.assertIsNone(c.resume())
+        self.assertTrue(c.due())
+        c.save((3, [1, 2], {4}))
+        self.assertEqual(c.saves, 1)
+        self.assertEqual(Checkpoint(self.filename, "t-v1", resume=True).resume(), (3, [1, 2], {4}))
+        self.assertIsNone(Checkpoint(self.filename, "t-v2", resume=True).resume())
+
+        c.done()
+        self.assertFalse(os.path.exists(checkpoint.path(self.filename, "t-v1")))
+
+    def test_off_by_default(self):
+        with mock.patch.dict(os.environ, {checkpoint.ENV: ""}):
+            c = Checkpoint(self.filename, "t-v1", every=0)
+            self.assertFalse(c.due())
+            c.save(1)
+        self.assertFalse(os.path.exists(checkpoint.path(self.filename, "t-v1")))
+
+    def test_saving_without_resuming(self):
+        Checkpoint(self.filename, "t-v1", save=True).save(1)
+        with mock.patch.dict(os.environ, {checkpoint.ENV: "1"}):
+            self.assertIsNone(Checkpoint(self.filename, "t-v1").resume())
+        with mock.patch.dict(os.environ, {checkpoint.ENV: "resume"}):
+            self.assertEqual(Checkpoint(self.filename, "t-v1").resume(), 1)
+
+    def test_changed_input(self):
+        Checkpoint(self.filename, "t-v1", save=True).save(1)
+        with open(self.filename, "a") as f:
+            f.write("4\n")
+        self.assertIsNone(Checkpoint(self.filename, "t-v1", resume=True).resume())
+
+    def test_corrupt(self):
+        c = Checkpoint(self.filename, "t-v1", every=0, save=True, resume=True)
+        c.save((3, [1, 2], {4}))
+        with open(c.path, "rb") as f:
+            whole = f.read()
+
+        # Cut short, not a dict, or naming things that can't be imported
+        broken = [whole[:len(whole) // 2], whole[:-1], pickle.dumps([1, 2]), pickle.dumps({"tag": "t-v1"}),
+                  b"cno_such_module\nThing\n.", b"cos\nno_such_function\n.", b"garbage"]
+        for data in broken:
+            with self.subTest(data=data[:20]):
+                with open(c.path, "wb") as f:
+                    f.write(data)
+                self.assertIsNone(c.resume())
+
+    def test_day_23_resumes(self):
+        day = DAYS[23]
+        shutil.copy(os.path.join(day.directory, "tiny_input"), self.filename)
+        with redirect_stdout(io.StringIO()):
+            expected = day.make_solver(self.filename).solve2()
+
+            # Saves before every path, and keeps the last one as though the run was cut short there
+            with mock.patch.dict(os.environ, {checkpoint.ENV: "1", checkpoint.SECONDS_ENV: "0"}), mock.patch.object(Checkpoint, "done"):
+                self.assertEqual(day.make_solver(self.filename).solve2(), expected)
+
+            tag = "hallpaths-slopes-v1"
+            longest, explored, _, stack = Checkpoint(self.filename, tag, resume=True).resume()
+            self.assertGreater(explored, 0)
+            self.assertTrue(stack)
+
+            with mock.patch.dict(os.environ, {checkpoint.ENV: "resume"}):
+                self.assertEqual(day.make_solver(self.filename).solve2(), expected)
+        self.assertFalse(os.path.exists(checkpoint.path(self.filename, tag)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+
+from aoc.complexity import EXPECTATIONS, Expectation, Fit, exponent, fit, geometric
+from aoc.regress import Measurement
+
+
+class TestExponent(unittest.TestCase):
+
+    def test_power_laws(self):
+        sizes = [100, 200, 400, 800]
+        self.assertAlmostEqual(exponent(sizes, [n for n in sizes]), 1)
+        self.assertAlmostEqual(exponent(sizes, [3e-6 * n * n for n in sizes]), 2)
+        self.assertAlmostEqual(exponent(sizes, [5.0] * 4), 0)
+
+    def test_needs_two_points(self):
+        self.assertIsNone(exponent([100], [1.0]))
+        self.assertIsNone(exponent([100, 100], [1.0, 2.0]))
+        self.assertIsNone(exponent([100, 200], [0, 1.0]))
+
+    def test_geometric(self):
+        self.assertEqual(geometric(175, 2, 4), [175, 350, 700, 1400])
+        self.assertEqual(geometric(1, 1.2, 4), [1, 2])  # Repeats are dropped
+
+
+class TestFit(unittest.TestCase):
+
+    def test_flags_worse_than_expected(self):
+        series = {
+            n: [Measurement(22, "parse", 1e-5 * n, 100 * n), Measurement(22, "part1", 1e-6 * n ** 3, 100 * n)]
+            for n in [100, 200, 400]
+        }
+        fits = {f.part: f for f in fit(22, series, floor=0.0001)}
+
+        self.assertAlmostEqual(fits["part1"].time, 3)
+        self.assertAlmostEqual(fits["part1"].memory, 1)
+        self.assertEqual(fits["part1"].expected, EXPECTATIONS[(22, "part1")])
+        self.assertEqual(fits["part1"].worse(0.3), ["time"])
+        self.assertEqual(fits["parse"].worse(0.3), [])
+
+    def test_fast_points_left_out(self):
+        series = {n: [Measurement(9, "part1", s)] for n, s in [(100, 1e-5), (200, 1e-5), (400, 0.01), (800, 0.02)]}
+        (only,) = fit(9, series, floor=0.002)
+        self.assertAlmostEqual(only.time, 1)
+        self.assertIsNone(only.memory)
+        self.assertEqual(only.worse(0.3), [])
+
+    def test_memory(self):
+        f = Fit(1, "part1", [1, 2], [1, 2], [1, 8], time=1, memory=3, expected=Expectation(1, 1))
+        self.assertEqual(f.worse(0.3), ["memory"])
+
+
+if __name__ == '__main__':
+    unittest.main()
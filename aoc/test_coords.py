@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+
+from aoc.coords import Layout, OUTSIDE
+
+BOARD = ["#.S", "..#", "O.."]
+
+
+class TestLayout(unittest.TestCase):
+
+    def setUp(self):
+        self.layout = Layout.from_lines(BOARD)
+        self.board = self.layout.pad(BOARD)
+
+    def test_shape(self):
+        self.assertEqual((self.layout.width, self.layout.height, self.layout.stride, self.layout.size), (3, 3, 5, 25))
+        self.assertEqual(len(self.board), self.layout.size)
+        self.assertEqual(self.board.count(OUTSIDE), 25 - 9)
+
+    def test_pack(self):
+        for r in range(3):
+            for c in range(3):
+                i = self.layout.pack(r, c)
+                self.assertEqual(self.layout.unpack(i), (r, c))
+                self.assertEqual((self.layout.row(i), self.layout.col(i)), (r, c))
+                self.assertEqual(chr(self.board[i]), BOARD[r][c])
+        self.assertEqual(list(self.layout.cells()), [self.layout.pack(r, c) for r in range(3) for c in range(3)])
+
+    def test_steps(self):
+        layout = self.layout
+        middle = layout.pack(1, 1)
+        self.assertEqual([layout.unpack(middle + d) for d in layout.NEIGHBORS4], [(0, 1), (1, 2), (2, 1), (1, 0)])
+        self.assertEqual(len({middle + d for d in layout.NEIGHBORS8}), 8)
+
+    def test_border(self):
+        # Every step off the board lands on the sentinel, never off the end of the buffer
+        layout = self.layout
+        for i in layout.cells():
+            for d in layout.NEIGHBORS8:
+                self.assertEqual(self.board[i + d] == OUTSIDE, not layout.inside(i + d))
+
+        self.assertTrue(layout.on_edge(layout.pack(0, 1)))
+        self.assertTrue(layout.on_edge(layout.pack(1, 2)))
+        self.assertFalse(layout.on_edge(layout.pack(1, 1)))
+
+    def test_rows(self):
+        self.assertEqual(self.layout.rows(self.board), [b"#.S", b"..#", b"O.."])
+
+    def test_fill(self):
+        board = self.layout.pad([b"abc", b"def", b"ghi"], fill=ord("#"))
+        self.assertEqual(board[:5], b"#####")
+        self.assertEqual(board[self.layout.pack(1, 0):self.layout.pack(1, 3)], b"def")
+
+    def test_ragged(self):
+        # A row of the wrong width would shift every cell after it
+        with self.assertRaises(ValueError):
+            self.layout.pad(["#.S", "..", "O.."])
+        with self.assertRaises(ValueError):
+            self.layout.pad(["#.S", "..#"])
+
+    def test_read(self):
+        with tempfile.TemporaryDirectory() as workdir:
+            filename = os.path.join(workdir, "input")
+            with open(filename, "wb") as f:
+                f.write(b"#.S\r\n..#\r\nO..\r\n\n")
+            layout, board = Layout.read(filename, fill=ord("#"))
+        self.assertEqual((layout.width, layout.height), (3, 3))
+        self.assertEqual(board, self.layout.pad(BOARD, fill=ord("#")))
+
+
+if __name__ == "__main__":
+    unittest.main()
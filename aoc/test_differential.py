@@ -0,0 +1,48 @@
+import tempfile
+import unittest
+
+from aoc.differential import PAIRS, Pair, check, format_outcome
+from aoc.generators import grids
+
+
+class TestPairs(unittest.TestCase):
+
+    def setUp(self):
+        self.workdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.workdir.cleanup()
+
+    def test_fast_paths_agree(self):
+        for pair in PAIRS:
+            with self.subTest(day=pair.day, name=pair.name):
+                outcome = check(pair, range(2), self.workdir.name)
+                self.assertIsNone(outcome.error)
+                self.assertEqual(outcome.cases, 2)
+                self.assertFalse(outcome.failed())
+                if not pair.known:
+                    self.assertEqual(outcome.mismatches, [])
+
+    def test_catches_a_wrong_answer(self):
+        wrong = Pair(21, "off by one", lambda rng: grids.garden(rng, 11 * 11), lambda s: s.solve1(6), lambda s: s.solve2(6) + 1)
+        outcome = check(wrong, range(3), self.workdir.name)
+        self.assertEqual([seed for seed, _, _ in outcome.mismatches], [0, 1, 2])
+        self.assertTrue(outcome.failed())
+        self.assertIn("3 DIFFER", format_outcome(outcome))
+
+    def test_inputs_replay(self):
+        # The answers only depend on the seed, so a failing seed can be rerun on its own
+        answers = Pair(17, "answers", lambda rng: grids.heat_loss(rng, 8 * 8), lambda s: s.newSolve1(1, 3), lambda s: None)
+        first = check(answers, range(3, 4), self.workdir.name)
+        again = check(answers, range(3, 4), self.workdir.name)
+        self.assertEqual(first.mismatches, again.mismatches)
+
+    def test_errors_are_reported(self):
+        broken = Pair(17, "broken", lambda rng: grids.heat_loss(rng, 8 * 8), lambda s: s.newSolve1(1, 3), lambda s: s.missing())
+        outcome = check(broken, range(2), self.workdir.name)
+        self.assertIn("AttributeError", outcome.error)
+        self.assertTrue(outcome.failed())
+
+
+if __name__ == '__main__':
+    unittest.main()
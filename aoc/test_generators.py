@@ -0,0 +1,49 @@
+from contextlib import redirect_stdout
+import io
+import os
+import tempfile
+import unittest
+
+from aoc.days import DAYS
+from aoc.generators import GENERATORS, generate
+
+
+class TestGenerators(unittest.TestCase):
+
+    def test_every_day(self):
+        self.assertEqual(sorted(GENERATORS), sorted(DAYS))
+
+    def test_reproducible(self):
+        for day in GENERATORS:
+            self.assertEqual(generate(day, 50, 7), generate(day, 50, 7), f"Day {day} isn't reproducible")
+            self.assertNotEqual(generate(day, 50, 7), generate(day, 50, 8), f"Day {day} ignores the seed")
+
+    def test_parses(self):
+        with tempfile.TemporaryDirectory() as workdir:
+            for number, day in DAYS.items():
+                filename = os.path.join(workdir, f"day{number}")
+                with open(filename, "w") as f:
+                    f.write(generate(number, 50, 1))
+                try:
+                    with redirect_stdout(io.StringIO()):
+                        day.make_solver(filename)
+                except ImportError as e:
+                    print(f"Skipping day {number}: {e}")
+
+    def test_small_answers(self):
+        cases = {
+            8: lambda s: s.solve1() % 43 == 0,  # AAA's cycle is 43 laps of the instructions
+            25: lambda s: s.solve1() > 0,  # The solver asserts it found a three edge cut
+        }
+        with tempfile.TemporaryDirectory() as workdir:
+            for number, check in cases.items():
+                filename = os.path.join(workdir, f"day{number}")
+                with open(filename, "w") as f:
+                    f.write(generate(number, 100, 3))
+                with redirect_stdout(io.StringIO()):
+                    ok = check(DAYS[number].make_solver(filename))
+                self.assertTrue(ok, f"Day {number} gave a bad answer")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import random
+import unittest
+
+from aoc.interval import Interval, IntervalMap, IntervalSet, compose_shifts
+
+
+def members(s: IntervalSet) -> set[int]:
+    return {x for start, stop in s for x in range(start, stop)}
+
+
+class TestInterval(unittest.TestCase):
+
+    def test_half_open(self):
+        xs = Interval(0, 5)
+        self.assertEqual(xs.size(), 5)
+        self.assertTrue(xs.contains(0))
+        self.assertFalse(xs.contains(5))
+        self.assertTrue(xs.overlaps(Interval(4, 9)))
+        self.assertFalse(xs.overlaps(Interval(5, 9)))
+        self.assertEqual(xs.intersection((3, 8)), Interval(3, 5))
+        self.assertIsNone(xs.intersection((5, 8)))
+
+
+class TestIntervalSet(unittest.TestCase):
+
+    def test_merges_touching(self):
+        s = IntervalSet([(5, 7), (0, 2), (2, 4), (6, 9), (3, 3)])
+        self.assertEqual(list(s), [(0, 4), (5, 9)])
+        self.assertEqual(s.size(), 8)
+        self.assertIn(3, s)
+        self.assertNotIn(4, s)
+
+    def test_covers(self):
+        s = IntervalSet([(0, 4), (5, 9)])
+        self.assertTrue(s.covers(5, 9))
+        self.assertFalse(s.covers(3, 6))
+        self.assertFalse(s.covers(-1, 2))
+
+    def test_add(self):
+        s = IntervalSet([(0, 2), (4, 6), (8, 10)])
+        s.add(2, 4)
+        self.assertEqual(list(s), [(0, 6), (8, 10)])
+        s.add(11, 12)
+        s.add(-3, -1)
+        self.assertEqual(list(s), [(-3, -1), (0, 6), (8, 10), (11, 12)])
+
+    def test_against_python_sets(self):
+        rng = random.Random(21)
+        for _ in range(200):
+            intervals = [[(a, a + rng.randrange(6)) for a in rng.sample(range(40), 5)] for _ in range(2)]
+            a, b = IntervalSet(intervals[0]), IntervalSet(intervals[1])
+            added = IntervalSet()
+            for start, stop in intervals[0]:
+                added.add(start, stop)
+
+            self.assertEqual(added, a)
+            self.assertEqual(members(a | b), members(a) | members(b))
+            self.assertEqual(members(a & b), members(a) & members(b))
+            self.assertEqual(members(a - b), members(a) - members(b))
+            self.assertEqual((a | b).size(), len(members(a) | members(b)))
+
+
+class TestIntervalMap(unittest.TestCase):
+
+    def setUp(self):
+        self.shifts = IntervalMap([(98, 100, -48), (50, 98, 2)])
+
+    def test_get(self):
+        self.assertEqual(self.shifts.get(99, 0), -48)
+        self.assertEqual(self.shifts.get(50, 0), 2)
+        self.assertEqual(self.shifts.get(100, 0), 0)
+        self.assertEqual(self.shifts.find(49), -1)
+
+    def test_overlap_rejected(self):
+        with self.assertRaises(ValueError):
+            IntervalMap([(0, 5, "a"), (4, 6, "b")])
+
+    def test_filled_and_restrict(self):
+        self.assertEqual(list(self.shifts.filled(0, 0)), [(0, 50, 0), (50, 98, 2), (98, 100, -48)])
+        self.assertEqual(list(self.shifts.restrict(IntervalSet([(90, 99)]))), [(90, 98, 2), (98, 99, -48)])
+        self.assertEqual(list(self.shifts.domain()), [(50, 100)])
+
+    def test_compose_shifts(self):
+        rng = random.Random(5)
+        for _ in range(200):
+            maps = []
+            for _ in range(2):
+                cuts = sorted(rng.sample(range(60), 6))
+                maps.append(IntervalMap((cuts[i], cuts[i + 1], rng.randrange(-20, 20)) for i in range(0, 6, 2)))
+            first, then = maps
+            both = compose_shifts(first, then)
+            for x in range(-30, 90):
+                y = x + first.get(x, 0)
+                self.assertEqual(x + both.get(x, 0), y + then.get(y, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
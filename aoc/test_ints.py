@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+
+from aoc.ints import _scan_numpy, _scan_python, ints, parse_ints, read_ints
+
+ALMANAC = b"""seeds: 79 14
+
+seed-to-soil map:
+50 98 2
+52 50 48
+
+
+soil-to-fertilizer map:
+0 15 37
+"""
+
+
+def flatten(scanned) -> tuple[list[list[int]], list[list[list[int]]]]:
+    return [list(row) for row in scanned.lines()], [[list(row) for row in block] for block in scanned.blocks()]
+
+
+class TestInts(unittest.TestCase):
+
+    def test_ints(self):
+        self.assertEqual(list(ints("19, 13, 30 @ -2,  1, -2")), [19, 13, 30, -2, 1, -2])
+        self.assertEqual(list(ints(b"1,0,1~1,2,1")), [1, 0, 1, 1, 2, 1])
+        self.assertEqual(list(ints("seed-to-soil 1-2")), [1, -2])
+
+    def check(self, scan):
+        lines, blocks = flatten(scan(ALMANAC))
+        self.assertEqual(lines, [[79, 14], [], [50, 98, 2], [52, 50, 48], [], [0, 15, 37]])
+        self.assertEqual(blocks, [[[79, 14]], [[], [50, 98, 2], [52, 50, 48]], [[], [0, 15, 37]]])
+
+        lines, blocks = flatten(scan(b"0 3 -6 9\r\n10 -13\n  \n7"))
+        self.assertEqual(lines, [[0, 3, -6, 9], [10, -13], [7]])
+        self.assertEqual(len(blocks), 2)
+
+        self.assertEqual(flatten(scan(b"")), ([], []))
+        self.assertEqual(flatten(scan(b"\n\n")), ([], []))
+
+    def test_python(self):
+        self.check(_scan_python)
+        self.assertEqual(flatten(_scan_python(b"1-2 3\n"))[0], [[1, -2, 3]])
+
+    def test_numpy(self):
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            self.skipTest("NumPy isn't installed")
+        self.check(_scan_numpy)
+        self.assertIsNone(_scan_numpy(b"1-2 3\n"))
+        self.assertEqual(flatten(parse_ints(b"1-2 3\n"))[0], [[1, -2, 3]])
+
+    def test_read_ints(self):
+        with tempfile.TemporaryDirectory() as workdir:
+            filename = os.path.join(workdir, "input")
+            with open(filename, "wb") as f:
+                f.write(ALMANAC)
+            scanned = read_ints(filename)
+        self.assertEqual(len(scanned), 6)
+        self.assertEqual(list(scanned.line(3)), [52, 50, 48])
+        self.assertEqual(sum(scanned.values), sum(parse_ints(ALMANAC.decode()).values))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import os
+import tempfile
+import unittest
+
+from aoc.loader import Input
+
+
+class TestLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.workdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.workdir.cleanup()
+
+    def load(self, content: bytes) -> Input:
+        filename = os.path.join(self.workdir.name, "input")
+        with open(filename, "wb") as f:
+            f.write(content)
+        return Input(filename)
+
+    def test_lines(self):
+        with self.load(b"abc\n\nde\r\nf") as inp:
+            self.assertEqual(list(inp.lines(text=True)), ["abc", "", "de", "f"])
+            self.assertEqual([bytes(line) for line in inp.lines()], [b"abc", b"", b"de", b"f"])
+        with self.load(b"abc\n") as inp:
+            self.assertEqual(list(inp.lines(text=True)), ["abc"])
+
+    def test_blocks(self):
+        with self.load(b"seeds: 1 2\n\na\nb\n  \n\nc\n") as inp:
+            self.assertEqual(list(inp.blocks(text=True)), [["seeds: 1 2"], ["a", "b"], ["c"]])
+
+    def test_tokens(self):
+        with self.load(b"rn=1,cm-,qp=3\n") as inp:
+            self.assertEqual(list(inp.tokens(b",", text=True)), "rn=1,cm-,qp=3\n".split(","))
+            self.assertEqual(list(inp.tokens(text=True)), ["rn=1,cm-,qp=3"])
+        with self.load(b" 12  -4\n7\n") as inp:
+            self.assertEqual([int(t) for t in inp.tokens()], [12, -4, 7])
+
+    def test_empty(self):
+        with self.load(b"") as inp:
+            self.assertEqual(len(inp), 0)
+            self.assertEqual(list(inp.lines()), [])
+            self.assertEqual(list(inp.blocks()), [])
+            self.assertEqual(list(inp.tokens(b",", text=True)), [""])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+
+from aoc import metrics
+from aoc.memo import MISSING, Memo
+from aoc.metrics import collect
+
+
+class TestMemo(unittest.TestCase):
+
+    def test_hits_and_misses(self):
+        memo: Memo[str, int] = Memo()
+        self.assertIs(memo.get("a", MISSING), MISSING)
+        self.assertEqual(memo.put("a", 1), 1)
+        self.assertEqual(memo.get("a"), 1)
+        self.assertIsNone(memo.get("b"))
+        self.assertEqual((memo.stats.hits, memo.stats.misses), (1, 2))
+        self.assertEqual(memo.stats.hit_rate(), 1 / 3)
+
+    def test_least_recently_used_goes(self):
+        memo: Memo[str, int] = Memo(2)
+        memo.put("a", 1)
+        memo.put("b", 2)
+        memo.get("a")
+        memo.put("c", 3)
+        self.assertIn("a", memo)
+        self.assertNotIn("b", memo)
+        self.assertEqual(len(memo), 2)
+        self.assertEqual(memo.stats.evictions, 1)
+        self.assertEqual(memo.stats.largest, 2)
+
+    def test_weighed(self):
+        memo: Memo[str, str] = Memo(10, weigh=lambda k, v: len(v))
+        memo.put("a", "x" * 4)
+        memo.put("b", "x" * 4)
+        memo.put("c", "x" * 4)
+        self.assertEqual(list(memo.entries), ["b", "c"])
+        self.assertEqual(memo.weight, 8)
+
+        # Too big on its own, but kept until the next one comes along
+        memo.put("d", "x" * 20)
+        self.assertEqual(list(memo.entries), ["d"])
+        memo.put("d", "x")
+        self.assertEqual(memo.weight, 1)
+
+    def test_clear_keeps_stats(self):
+        memo: Memo[str, int] = Memo(None)
+        memo.put("a", 1)
+        memo.get("a")
+        memo.clear()
+        self.assertEqual(len(memo), 0)
+        self.assertEqual(memo.stats.hits, 1)
+
+    def test_record(self):
+        memo: Memo[str, int] = Memo()
+        memo.get("a")
+        memo.put("a", 1)
+        with collect() as registry:
+            memo.record("test")
+        self.assertEqual(registry.counters, {"test.hits": 0, "test.misses": 1, "test.evictions": 0})
+        self.assertEqual(registry.histograms["test.largest"].high, 1)
+        self.assertFalse(metrics.enabled())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import tracemalloc
+import unittest
+
+from aoc.memory import Usage, measure
+from aoc.runner import Phase, timed
+
+
+class TestMeasure(unittest.TestCase):
+
+    def test_peak_and_net(self):
+        with measure() as usage:
+            scratch = bytearray(1 << 20)
+            del scratch
+            kept = bytearray(1 << 16)
+
+        self.assertGreaterEqual(usage.peak_bytes, 1 << 20)
+        self.assertGreaterEqual(usage.net_bytes, 1 << 16)
+        self.assertLess(usage.net_bytes, 1 << 20)
+        self.assertEqual(len(kept), 1 << 16)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_leaves_outer_trace_running(self):
+        tracemalloc.start()
+        try:
+            with measure():
+                pass
+            self.assertTrue(tracemalloc.is_tracing())
+        finally:
+            tracemalloc.stop()
+
+    def test_add(self):
+        usage = Usage(peak_bytes=100, net_bytes=40, net_blocks=2)
+        usage.add(Usage(peak_bytes=80, net_bytes=10, net_blocks=1))
+        self.assertEqual(usage, Usage(peak_bytes=120, net_bytes=50, net_blocks=3))
+
+
+class TestTimed(unittest.TestCase):
+
+    def test_off_by_default(self):
+        phase = Phase("part1")
+        with timed(phase):
+            pass
+        self.assertIsNone(phase.memory)
+        self.assertGreaterEqual(phase.seconds, 0)
+
+    def test_accumulates(self):
+        phase = Phase("parse")
+        with timed(phase, memory=True):
+            first = bytearray(1 << 16)
+        with timed(phase, memory=True):
+            second = bytearray(1 << 16)
+        self.assertGreaterEqual(phase.memory.net_bytes, len(first) + len(second))
+
+
+if __name__ == "__main__":
+    unittest.main()
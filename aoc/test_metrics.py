@@ -0,0 +1,120 @@
+import json
+import unittest
+
+from aoc import metrics
+from aoc.metrics import Histogram, Registry, collect
+from aoc.runner import Phase, format_metrics, DayResult, timed
+from aoc.search import Graph, GraphBuilder, bfs, dijkstra
+
+
+class TestRegistry(unittest.TestCase):
+
+    def test_off_outside_collect(self):
+        self.assertFalse(metrics.enabled())
+        metrics.count("nothing")
+        metrics.observe("nothing", 3)
+        with collect() as registry:
+            self.assertTrue(metrics.enabled())
+        self.assertTrue(registry.empty())
+
+    def test_count_and_observe(self):
+        with collect() as registry:
+            metrics.count("a")
+            metrics.count("a", 4)
+            for v in [1, 2, 3, 10]:
+                metrics.observe("h", v)
+
+        self.assertEqual(registry.counters, {"a": 5})
+        h = registry.histograms["h"]
+        self.assertEqual((h.count, h.total, h.low, h.high), (4, 16, 1, 10))
+        self.assertEqual(h.buckets, {2: 1, 4: 2, 16: 1})
+        self.assertEqual(h.mean(), 4)
+
+    def test_nested_passes_totals_out(self):
+        with collect() as outer:
+            metrics.count("a")
+            with collect() as inner:
+                metrics.count("a", 2)
+                metrics.observe("h", 5)
+            metrics.count("a")
+
+        self.assertEqual(inner.counters, {"a": 2})
+        self.assertEqual(outer.counters, {"a": 4})
+        self.assertEqual(outer.histograms["h"].count, 1)
+        self.assertFalse(metrics.enabled())
+
+    def test_merge_histograms(self):
+        h = Histogram()
+        h.add(3)
+        other = Histogram()
+        other.add(7)
+        other.add(1)
+        h.merge(other)
+        self.assertEqual((h.count, h.total, h.low, h.high), (3, 11, 1, 7))
+        self.assertEqual(h.buckets, {4: 1, 8: 1, 2: 1})
+
+    def test_to_json(self):
+        registry = Registry()
+        registry.count("a", 2)
+        registry.observe("h", 6)
+        data = json.loads(registry.to_json())
+        self.assertEqual(data["counters"], {"a": 2})
+        self.assertEqual(data["histograms"]["h"]["buckets"], {"8": 1})
+
+
+class TestSearchCounts(unittest.TestCase):
+
+    def setUp(self):
+        builder = GraphBuilder()
+        builder.add_edge(0, 1, 5)
+        builder.add_edge(0, 2, 1)
+        builder.add_edge(2, 1, 1)
+        self.graph: Graph = builder.build()
+
+    def test_dijkstra(self):
+        with collect() as registry:
+            dist = dijkstra(self.graph, 0)
+        self.assertEqual(dist[1], 2)
+        # 1 is pushed twice, first at 5 and then at 2, so one pop is stale
+        self.assertEqual(registry.counters, {"search.dijkstra.popped": 4, "search.dijkstra.stale": 1})
+
+    def test_bfs(self):
+        with collect() as registry:
+            bfs(self.graph, 0)
+        self.assertEqual(registry.counters, {"search.bfs.popped": 3})
+
+
+class TestRunner(unittest.TestCase):
+
+    def test_timed_collects(self):
+        phase = Phase("part1")
+        with timed(phase, metrics=True):
+            metrics.count("a")
+        with timed(phase, metrics=True):
+            metrics.count("a", 2)
+        self.assertEqual(phase.metrics.counters, {"a": 3})
+
+    def test_timed_off_by_default(self):
+        phase = Phase("part1")
+        with timed(phase):
+            metrics.count("a")
+        self.assertIsNone(phase.metrics)
+
+    def test_empty_phase_left_alone(self):
+        phase = Phase("import")
+        with timed(phase, metrics=True):
+            pass
+        self.assertIsNone(phase.metrics)
+
+    def test_format(self):
+        phase = Phase("part2")
+        with timed(phase, metrics=True):
+            metrics.count("23.paths_explored", 70)
+        text = format_metrics([DayResult(23, "tiny_input", [phase])])
+        self.assertIn("day 23 part2:", text)
+        self.assertIn("23.paths_explored", text)
+        self.assertEqual(format_metrics([]), "Nothing was counted")
+
+
+if __name__ == '__main__':
+    unittest.main()
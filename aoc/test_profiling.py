@@ -0,0 +1,60 @@
+from timeit import default_timer as timer
+import json
+import os
+import pstats
+import tempfile
+import unittest
+
+from aoc import profiling
+
+
+def busy(seconds: float) -> str:
+    end = timer() + seconds
+    while timer() < end:
+        sum(range(100))
+    return "done"
+
+
+class TestProfiling(unittest.TestCase):
+
+    def setUp(self):
+        self.workdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.workdir.cleanup()
+
+    def profile(self, kind: str) -> str:
+        filename = os.path.join(self.workdir.name, "nested", f"busy{profiling.SUFFIXES[kind]}")
+        self.assertEqual(profiling.run(kind, filename, busy, 0.1), "done")
+        return filename
+
+    def test_collapsed(self):
+        with open(self.profile("collapsed")) as f:
+            lines = f.read().splitlines()
+        self.assertTrue(lines)
+        stack, count = lines[0].rsplit(" ", 1)
+        self.assertTrue(stack.startswith("busy (aoc/test_profiling.py:"))
+        self.assertGreater(int(count), 0)
+
+    def test_speedscope(self):
+        with open(self.profile("speedscope")) as f:
+            document = json.load(f)
+        frames = document["shared"]["frames"]
+        sampled = document["profiles"][0]
+        self.assertEqual(frames[sampled["samples"][0][0]]["name"], "busy")
+        self.assertEqual(len(sampled["samples"]), len(sampled["weights"]))
+        self.assertAlmostEqual(sampled["endValue"], 0.1, delta=0.05)
+
+    def test_cprofile(self):
+        stats = pstats.Stats(self.profile("cprofile"))
+        self.assertTrue(any(name == "busy" for _, _, name in stats.stats))
+
+    def test_errors_still_write(self):
+        filename = os.path.join(self.workdir.name, "fail.collapsed.txt")
+        with self.assertRaises(ZeroDivisionError):
+            profiling.run("collapsed", filename, lambda: 1 / 0)
+        self.assertTrue(os.path.exists(filename))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+import unittest
+
+from aoc.records import RECORDS, instance_bytes, measure_records
+
+
+@dataclass
+class Plain:
+    a: int
+    b: int
+
+
+@dataclass(slots=True)
+class Slotted:
+    a: int
+    b: int
+
+
+class TestRecords(unittest.TestCase):
+
+    def test_slots_are_smaller(self):
+        self.assertLess(instance_bytes(Slotted, (1, 2), 1000), instance_bytes(Plain, (1, 2), 1000))
+
+    def test_every_record_is_slotted(self):
+        for number in sorted({r.day for r in RECORDS}):
+            for size in measure_records(number, 100):
+                with self.subTest(day=number, record=size.name):
+                    self.assertTrue(size.slotted)
+                    self.assertGreater(size.bytes, 0)
+
+    def test_day_without_records(self):
+        self.assertEqual(measure_records(1), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
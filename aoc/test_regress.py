@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+
+from aoc.regress import Measurement, compare, load_baseline, save_baseline
+
+
+class TestCompare(unittest.TestCase):
+
+    def setUp(self):
+        self.baseline = {
+            (17, "part1"): Measurement(17, "part1", 1.0, 10 << 20, "102"),
+            (17, "part2"): Measurement(17, "part2", 0.001, None, "94"),
+        }
+
+    def check(self, *current, tolerance=0.25, floor=0.01):
+        return [(r.part, r.metric) for r in compare(self.baseline, list(current), tolerance, 0.25, floor)]
+
+    def test_within_tolerance(self):
+        self.assertEqual(self.check(Measurement(17, "part1", 1.2, 11 << 20, "102")), [])
+
+    def test_slower(self):
+        self.assertEqual(self.check(Measurement(17, "part1", 5.0, 10 << 20, "102")), [("part1", "seconds")])
+
+    def test_floor_covers_tiny_phases(self):
+        self.assertEqual(self.check(Measurement(17, "part2", 0.005, None, "94")), [])
+        self.assertEqual(self.check(Measurement(17, "part2", 0.005, None, "94"), floor=0), [("part2", "seconds")])
+
+    def test_memory_and_answer(self):
+        found = self.check(Measurement(17, "part1", 1.0, 40 << 20, "103"))
+        self.assertEqual(found, [("part1", "answer"), ("part1", "peak_bytes")])
+
+    def test_missing_baseline_is_not_a_regression(self):
+        self.assertEqual(self.check(Measurement(3, "part1", 100.0, None, "1")), [])
+
+
+class TestBaselineFile(unittest.TestCase):
+
+    def test_round_trip(self):
+        measurements = [Measurement(1, "parse", 0.5, 1024), Measurement(1, "part1", 0.25, None, "281")]
+        with tempfile.TemporaryDirectory() as workdir:
+            filename = os.path.join(workdir, "baseline.json")
+            save_baseline(filename, "tiny_input", 5, measurements)
+            source, stored = load_baseline(filename)
+
+        self.assertEqual(source, "tiny_input")
+        self.assertEqual(stored, {(m.day, m.part): m for m in measurements})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+
+from aoc.runner import DayResult, Phase, SPLIT_PARTS, in_parallel, run_day
+
+
+def _answers(result: DayResult) -> list[str | None]:
+    return [p.answer for p in result.phases if p.name.startswith("part")]
+
+
+@unittest.skipUnless(SPLIT_PARTS, "needs fork")
+class TestSplitParts(unittest.TestCase):
+
+    def test_children_get_their_own_copy(self):
+        shared = [0]
+
+        def bump(name: str) -> Phase:
+            shared[0] += 1
+            return Phase(name, answer=str(shared[0]))
+
+        phases = in_parallel([lambda: bump("part1"), lambda: bump("part2")])
+        self.assertEqual([(p.name, p.answer) for p in phases], [("part1", "1"), ("part2", "1")])
+        self.assertEqual(shared, [0])
+
+    def test_failure_is_raised(self):
+        def fail() -> Phase:
+            raise ValueError("no answer")
+
+        with self.assertRaisesRegex(ValueError, "no answer"):
+            in_parallel([lambda: Phase("part1"), fail])
+
+    def test_same_answers(self):
+        # Day 14 tilts its board in place and day 20 builds a second solver for part 2
+        for number in [14, 20]:
+            with self.subTest(day=number):
+                together = run_day(number, "tiny_input")
+                split = run_day(number, "tiny_input", split=True)
+                self.assertIsNone(split.error)
+                self.assertEqual(_answers(split), _answers(together))
+                self.assertIsNotNone(split.parts_seconds)
+                self.assertIsNone(together.parts_seconds)
+
+    def test_single_part_runs_in_place(self):
+        result = run_day(25, "tiny_input", split=True)
+        self.assertEqual(_answers(result), ["54"])
+        self.assertIsNone(result.parts_seconds)
+
+
+class TestTotal(unittest.TestCase):
+
+    def test_overlapping_parts_count_once(self):
+        phases = [Phase("import", 1.0), Phase("parse", 2.0), Phase("part1", 3.0), Phase("part2", 5.0)]
+        self.assertEqual(DayResult(1, "input", phases).total(), 11.0)
+        self.assertEqual(DayResult(1, "input", phases, parts_seconds=5.5).total(), 8.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import random
+import unittest
+
+from aoc.search import INF, QUEUES, Graph, GraphBuilder, astar, bfs, dijkstra
+
+
+def bellman_ford(n: int, edges: list[tuple[int, int, int]], start: int) -> list[int]:
+    dist = [INF] * n
+    dist[start] = 0
+    for _ in range(n):
+        for src, dst, cost in edges:
+            if dist[src] != INF and dist[src] + cost < dist[dst]:
+                dist[dst] = dist[src] + cost
+    return dist
+
+
+def random_edges(rng: random.Random, n: int, m: int, heaviest: int) -> list[tuple[int, int, int]]:
+    return [(rng.randrange(n), rng.randrange(n), rng.randrange(heaviest + 1)) for _ in range(m)]
+
+
+class TestGraph(unittest.TestCase):
+
+    def test_from_edges(self):
+        g = Graph.from_edges(4, [(2, 0, 5), (0, 1, 1), (2, 3, 7), (0, 2, 2)])
+        self.assertEqual(len(g), 4)
+        self.assertEqual(g.edge_count(), 4)
+        self.assertEqual(g.max_weight(), 7)
+        self.assertEqual(sorted(g.neighbors(0)), [(1, 1), (2, 2)])
+        self.assertEqual(list(g.neighbors(1)), [])
+        self.assertEqual(sorted(g.neighbors(2)), [(0, 5), (3, 7)])
+
+    def test_builder(self):
+        b = GraphBuilder()
+        b.add_edge("start", (0, 1), 4)
+        b.add_edge((0, 1), "end")
+        self.assertEqual(b.names, ["start", (0, 1), "end"])
+        g = b.build()
+        self.assertEqual(list(g.neighbors(b.ids[(0, 1)])), [(b.ids["end"], 1)])
+
+
+class TestSearch(unittest.TestCase):
+
+    def test_queues_agree(self):
+        rng = random.Random(5)
+        for heaviest in [1, 9, 1000]:
+            n = 60
+            edges = random_edges(rng, n, 300, heaviest)
+            g = Graph.from_edges(n, edges)
+            expected = bellman_ford(n, edges, 0)
+            for name, queue in QUEUES.items():
+                with self.subTest(queue=name, heaviest=heaviest):
+                    self.assertEqual(list(dijkstra(g, 0, queue=queue)), expected)
+
+    def test_goal(self):
+        g = Graph.from_edges(3, [(0, 1, 2), (1, 2, 2), (0, 2, 5)])
+        for queue in QUEUES.values():
+            self.assertEqual(dijkstra(g, 0, goal=2, queue=queue)[2], 4)
+
+    def test_bfs(self):
+        g = Graph.from_edges(5, [(0, 1, 9), (1, 2, 9), (0, 2, 9), (2, 3, 9)])
+        self.assertEqual(list(bfs(g, 0)), [0, 1, 1, 2, INF])
+        self.assertEqual(list(bfs(g, [1, 3])), [INF, 0, 1, 0, INF])
+
+    def test_astar(self):
+        # An open grid with random costs, where Manhattan distance is a consistent heuristic
+        rng = random.Random(2)
+        size = 12
+        edges = []
+        for r in range(size):
+            for c in range(size):
+                for dr, dc in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+                    if 0 <= r + dr < size and 0 <= c + dc < size:
+                        edges.append((r * size + c, (r + dr) * size + c + dc, rng.randrange(1, 10)))
+        g = Graph.from_edges(size * size, edges)
+        goal = size * size - 1
+
+        def manhattan(v: int) -> int:
+            r, c = divmod(v, size)
+            return (size - 1 - r) + (size - 1 - c)
+
+        expected = dijkstra(g, 0)[goal]
+        for name, queue in QUEUES.items():
+            with self.subTest(queue=name):
+                self.assertEqual(astar(g, 0, goal, manhattan, queue=queue), expected)
+        self.assertEqual(astar(Graph.from_edges(2, []), 0, 1, lambda v: 0), INF)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import threading
+import unittest
+
+from aoc.service import MIN_TIMEOUT, Server, WorkerPool, ask
+
+
+class TestService(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = WorkerPool(1, 0)
+        cls.server = Server(0, cls.pool, timeout=30, quiet=True)
+        cls.port = cls.server.server_port
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.pool.close()
+
+    def test_input_file(self):
+        status, reply = ask(17, 2, input="tiny_input", port=self.port)
+        self.assertEqual(status, 200)
+        self.assertEqual(reply["answer"], "94")
+        self.assertGreaterEqual(reply["seconds"], 0)
+
+    def test_text(self):
+        status, reply = ask(9, 1, text="0 3 6 9\n1 3 6 10\n", port=self.port)
+        self.assertEqual((status, reply["answer"]), (200, str(12 + 15)))
+
+    def test_bad_requests(self):
+        self.assertEqual(ask(1, 2, port=self.port)[0], 400)
+        self.assertEqual(ask(26, 1, port=self.port)[0], 400)
+        self.assertEqual(ask(1, 1, input="no_such_file", port=self.port)[0], 400)
+        for timeout in ["soon", True, [5], float("nan")]:
+            self.assertEqual(ask(1, 1, input="tiny_input", timeout=timeout, port=self.port)[0], 400)
+        for value in [5, ["input"], None]:
+            self.assertEqual(self.server.solve({"day": 1, "input": value})[0], 400)
+            self.assertEqual(self.server.solve({"day": 1, "text": value})[0], 400)
+        self.assertEqual(ask(1, 1, text=5, port=self.port)[0], 400)
+
+    def test_timeout_clamped(self):
+        self.assertEqual(self.server.timeout_for(0), MIN_TIMEOUT)
+        self.assertEqual(self.server.timeout_for(-5), MIN_TIMEOUT)
+        self.assertEqual(self.server.timeout_for("2.5"), 2.5)
+        self.assertEqual(self.server.timeout_for(1e9), 30)
+
+    def test_timeout_replaces_worker(self):
+        status, _ = ask(20, 2, input="tiny_input", timeout=0.01, port=self.port)
+        self.assertEqual(status, 504)
+        status, reply = ask(17, 1, input="tiny_input", port=self.port)
+        self.assertEqual((status, reply["answer"]), (200, "102"))
+
+
+if __name__ == "__main__":
+    unittest.main()
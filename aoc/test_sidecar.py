@@ -0,0 +1,78 @@
+from array import array
+import mmap
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from aoc import sidecar
+
+
+class TestSidecar(unittest.TestCase):
+
+    def setUp(self):
+        self.workdir = tempfile.TemporaryDirectory()
+        self.input = os.path.join(self.workdir.name, "input")
+        with open(self.input, "w") as f:
+            f.write("1,0,1~1,2,1\n")
+
+    def tearDown(self):
+        self.workdir.cleanup()
+
+    def test_round_trip(self):
+        sidecar.save(self.input, "t-v1", {"a": array("q", [1, -2, 3]), "b": [2**40], "c": []}, {"names": ["x"]}, force=True)
+        stored = sidecar.load(self.input, "t-v1", force=True)
+        self.assertEqual(list(stored.arrays["a"]), [1, -2, 3])
+        self.assertEqual(list(stored.arrays["b"]), [2**40])
+        self.assertEqual(list(stored.arrays["c"]), [])
+        self.assertEqual(stored.meta, {"names": ["x"]})
+
+    def test_stale(self):
+        sidecar.save(self.input, "t-v1", {"a": [1]}, force=True)
+        self.assertIsNone(sidecar.load(self.input, "t-v2", force=True))
+
+        with open(self.input, "a") as f:
+            f.write("2,2,2~2,2,2\n")
+        self.assertIsNone(sidecar.load(self.input, "t-v1", force=True))
+
+    def test_corrupt(self):
+        sidecar.save(self.input, "t-v1", {"a": [1, 2, 3]}, force=True)
+        target = sidecar.path(self.input, "t-v1")
+        with open(target, "rb") as f:
+            whole = f.read()
+
+        # Cut off in the length, the header and the arrays, then a header that isn't JSON or lacks a field
+        broken = [whole[:12], whole[:20], whole[:-8], whole[:16] + b"{" * (len(whole) - 16),
+                  whole.replace(b'"meta"', b'"mate"')]
+        # Every map of a rejected sidecar is closed again, rather than left for the garbage collector
+        opened: list[mmap.mmap] = []
+        real = mmap.mmap
+
+        def mapping(*args, **kwargs):
+            opened.append(real(*args, **kwargs))
+            return opened[-1]
+
+        for data in broken:
+            with self.subTest(size=len(data)):
+                with open(target, "wb") as f:
+                    f.write(data)
+                with mock.patch.object(sidecar.mmap, "mmap", mapping):
+                    self.assertIsNone(sidecar.load(self.input, "t-v1", force=True))
+        self.assertEqual(len(opened), len(broken))
+        self.assertTrue(all(m.closed for m in opened))
+
+    def test_enabled(self):
+        with mock.patch.dict(os.environ, {sidecar.ENV: ""}):
+            sidecar.save(self.input, "t-v1", {"a": [1]})
+            self.assertFalse(os.path.exists(sidecar.path(self.input, "t-v1")))
+
+        with mock.patch.dict(os.environ, {sidecar.ENV: "1"}):
+            sidecar.save(self.input, "t-v1", {"a": [1]})
+            self.assertEqual(list(sidecar.load(self.input, "t-v1").arrays["a"]), [1])
+
+        with mock.patch.dict(os.environ, {sidecar.ENV: "0"}):
+            self.assertIsNone(sidecar.load(self.input, "t-v1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import random
+import unittest
+
+from aoc.unionfind import UnionFind
+
+
+class TestUnionFind(unittest.TestCase):
+
+    def test_union(self):
+        uf = UnionFind(6)
+        self.assertEqual(uf.sets, 6)
+        uf.union(0, 1)
+        uf.union(2, 3)
+        root = uf.union(1, 3)
+        self.assertEqual(uf.find(0), root)
+        self.assertTrue(uf.same(0, 2))
+        self.assertFalse(uf.same(0, 4))
+        self.assertEqual(uf.size(3), 4)
+        self.assertEqual(uf.sets, 3)
+        self.assertEqual(uf.union(0, 2), root)
+        self.assertEqual(uf.sets, 3)
+
+    def test_groups(self):
+        uf = UnionFind(5)
+        uf.union(4, 1)
+        self.assertEqual(sorted(uf.groups().values()), [[0], [1, 4], [2], [3]])
+        self.assertEqual(list(uf.groups([4, 1, 3]).values()), [[4, 1], [3]])
+
+    def test_against_labels(self):
+        rng = random.Random(10)
+        n = 200
+        uf = UnionFind(n)
+        labels = list(range(n))
+        for _ in range(150):
+            a, b = rng.randrange(n), rng.randrange(n)
+            uf.union(a, b)
+            old, new = labels[a], labels[b]
+            labels = [new if label == old else label for label in labels]
+
+        for a in range(n):
+            self.assertEqual(uf.size(a), labels.count(labels[a]))
+            for b in range(0, n, 7):
+                self.assertEqual(uf.same(a, b), labels[a] == labels[b])
+        self.assertEqual(uf.sets, len(set(labels)))
+        self.assertLessEqual(max(uf.rank), 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
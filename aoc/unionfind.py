@@ -0,0 +1,65 @@
+"""
+Disjoint sets over the ints 0..n-1, for days that label connected regions or
+contract vertices together:
+
+    uf = UnionFind(layout.size)
+    uf.union(a, b)
+    uf.find(a) == uf.find(b)            # True
+    uf.groups(cells)                     # {root: [members...]}
+
+Parents, ranks and sizes live in flat arrays. find compresses the path it walks
+and union hangs the shallower tree under the deeper one, so both are as good as
+constant time however big the sets get. Named vertices need numbering first,
+as day 25 does.
+"""
+from __future__ import annotations
+from array import array
+from typing import Iterable
+
+
+class UnionFind:
+    def __init__(self, n: int):
+        self.parent = array('q', range(n))
+        self.rank = bytearray(n)  # Union by rank keeps trees below log2(n) deep, so a byte is plenty
+        self.sizes = array('q', [1]) * n
+        self.sets = n
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, a: int, b: int) -> int:
+        """Joins the sets holding a and b, and returns the root of the result"""
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return a
+        if self.rank[a] < self.rank[b]:
+            a, b = b, a
+        elif self.rank[a] == self.rank[b]:
+            self.rank[a] += 1
+        self.parent[b] = a
+        self.sizes[a] += self.sizes[b]
+        self.sets -= 1
+        return a
+
+    def same(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
+
+    def size(self, x: int) -> int:
+        """How many are in the set holding x"""
+        return self.sizes[self.find(x)]
+
+    def groups(self, members: Iterable[int] | None = None) -> dict[int, list[int]]:
+        """The members of each set by root, in the order they come, of everything by default"""
+        found: dict[int, list[int]] = {}
+        for x in range(len(self.parent)) if members is None else members:
+            found.setdefault(self.find(x), []).append(x)
+        return found